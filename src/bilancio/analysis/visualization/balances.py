@@ -6,6 +6,7 @@ from typing import Any, List, Optional, Union
 
 from bilancio.analysis.balances import AgentBalance, agent_balance
 from bilancio.engines.system import System
+from bilancio.ops.aliases import get_alias_for_id
 from bilancio.analysis.visualization.common import (
     RICH_AVAILABLE,
     RenderableType,
@@ -649,11 +650,8 @@ def build_t_account_rows(system: System, agent_id: str) -> TAccount:
             maturity="—",
         ))
 
-    # Precompute id->alias map for quick lookups
-    try:
-        id_to_alias = {cid: alias for alias, cid in (system.state.aliases or {}).items()}
-    except Exception:
-        id_to_alias = {}
+    def _id_or_alias(cid: str) -> str:
+        return get_alias_for_id(system, cid) or cid
 
     # Contracts as assets (held by agent)
     for cid in agent.asset_ids:
@@ -674,7 +672,7 @@ def build_t_account_rows(system: System, agent_id: str) -> TAccount:
                 value_minor=valued_minor,
                 counterparty_name=counterparty,
                 maturity=maturity,
-                id_or_alias=id_to_alias.get(cid, cid),
+                id_or_alias=_id_or_alias(cid),
             ))
         else:
             # Financial assets
@@ -688,7 +686,7 @@ def build_t_account_rows(system: System, agent_id: str) -> TAccount:
                 value_minor=int(c.amount) if c.amount is not None else None,
                 counterparty_name=counterparty if c.kind != "cash" else "—",
                 maturity=maturity,
-                id_or_alias=id_to_alias.get(cid, cid),
+                id_or_alias=_id_or_alias(cid),
             ))
 
     # Contracts as liabilities (issued by agent)
@@ -708,7 +706,7 @@ def build_t_account_rows(system: System, agent_id: str) -> TAccount:
                 value_minor=valued_minor,
                 counterparty_name=counterparty,
                 maturity=maturity,
-                id_or_alias=id_to_alias.get(cid, cid),
+                id_or_alias=_id_or_alias(cid),
             ))
         else:
             counterparty = _format_agent(c.asset_holder_id, system)
@@ -721,7 +719,7 @@ def build_t_account_rows(system: System, agent_id: str) -> TAccount:
                 value_minor=int(c.amount) if c.amount is not None else None,
                 counterparty_name=counterparty,
                 maturity=maturity,
-                id_or_alias=id_to_alias.get(cid, cid),
+                id_or_alias=_id_or_alias(cid),
             ))
 
     # Ordering within each side
@@ -513,7 +513,7 @@ def display_events_for_day(system: System, day: int) -> None:
         day: The simulation day to display events for
     """
     console = Console() if RICH_AVAILABLE else None
-    events = [e for e in system.state.events if e.get("day") == day]
+    events = system.state.events.for_day(day)
     
     if not events:
         _print("  No events occurred on this day.", console)
@@ -556,7 +556,7 @@ def display_events_for_day_renderable(system: System, day: int) -> List[Renderab
     Returns:
         List of Rich renderables (or strings for simple format)
     """
-    events = [e for e in system.state.events if e.get("day") == day]
+    events = system.state.events.for_day(day)
     
     if not events:
         if RICH_AVAILABLE:
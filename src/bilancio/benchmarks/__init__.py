@@ -0,0 +1,25 @@
+"""Performance benchmarks for the engine, dealer and analysis hot paths."""
+
+from .cases import BENCHMARKS, DEFAULT_SIZES, Benchmark
+from .runner import (
+    BenchResult,
+    Comparison,
+    compare_results,
+    load_results,
+    run_benchmarks,
+    run_case,
+    write_results,
+)
+
+__all__ = [
+    "BENCHMARKS",
+    "DEFAULT_SIZES",
+    "Benchmark",
+    "BenchResult",
+    "Comparison",
+    "compare_results",
+    "load_results",
+    "run_benchmarks",
+    "run_case",
+    "write_results",
+]
@@ -0,0 +1,178 @@
+"""Benchmark cases for the engine, dealer and analysis hot paths.
+
+Each case has a ``setup(n_agents)`` that builds its inputs (untimed) and
+returns a zero-argument callable; only that callable is timed. Setups build
+fresh state every time, so a case can be repeated.
+"""
+
+from __future__ import annotations
+
+import tempfile
+from dataclasses import dataclass
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+# Days simulated by the time-stepped cases
+BENCH_DAYS = 10
+# Maturity spread of generated rings (days)
+MATURITY_DAYS = 5
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    name: str
+    description: str
+    setup: Callable[[int], Callable[[], Any]]
+
+
+def _ring_scenario(n_agents: int, *, dealer: bool = False, seed: int = 7) -> Dict[str, Any]:
+    """Ring scenario from the ring explorer generator, as the sweep runner builds it."""
+    from bilancio.config.models import RingExplorerGeneratorConfig
+    from bilancio.scenarios import compile_ring_explorer
+
+    generator = RingExplorerGeneratorConfig.model_validate({
+        "version": 1,
+        "generator": "ring_explorer_v1",
+        "name_prefix": "bench",
+        "params": {
+            "n_agents": n_agents,
+            "seed": seed,
+            "kappa": "1",
+            "Q_total": str(100 * n_agents),
+            "inequality": {"scheme": "dirichlet", "concentration": "1"},
+            "maturity": {"days": MATURITY_DAYS, "mode": "lead_lag", "mu": "0.5"},
+            "liquidity": {"allocation": {"mode": "uniform"}},
+        },
+        "compile": {"emit_yaml": False},
+    })
+    scenario = compile_ring_explorer(generator, source_path=None)
+    if dealer:
+        scenario["dealer"] = {
+            "enabled": True,
+            "ticket_size": 1,
+            "dealer_share": Decimal("0.25"),
+            "vbt_share": Decimal("0.50"),
+        }
+    return scenario
+
+
+def _ring_system(n_agents: int, *, dealer: bool = False, default_mode: str = "expel-agent"):
+    from bilancio.config.apply import apply_to_system
+    from bilancio.config.loaders import preprocess_config
+    from bilancio.config.models import ScenarioConfig
+    from bilancio.engines.system import System
+
+    config = ScenarioConfig(**preprocess_config(_ring_scenario(n_agents, dealer=dealer)))
+    system = System(default_mode=default_mode)
+    apply_to_system(config, system)
+    return system
+
+
+def _setup_run_until_stable(n_agents: int) -> Callable[[], Any]:
+    from bilancio.engines.simulation import run_until_stable
+
+    system = _ring_system(n_agents)
+    return lambda: run_until_stable(system, max_days=MATURITY_DAYS + BENCH_DAYS)
+
+
+def _setup_dealer_trading_phase(n_agents: int) -> Callable[[], Any]:
+    from bilancio.engines.dealer_integration import run_dealer_trading_phase
+
+    system = _ring_system(n_agents, dealer=True)
+    subsystem = system.state.dealer_subsystem
+    return lambda: run_dealer_trading_phase(subsystem, system, system.state.day)
+
+
+def _dealer_ring_tickets(n_agents: int, trader_ids: list[str]):
+    from bilancio.dealer.models import Ticket
+
+    tickets = []
+    for i, issuer in enumerate(trader_ids):
+        for j in range(2):
+            tau = 2 + (i + 3 * j) % 9
+            tickets.append(Ticket(
+                id=f"T{i}_{j}",
+                issuer_id=issuer,
+                owner_id=trader_ids[(i + 1 + j) % n_agents],
+                face=Decimal(1),
+                maturity_day=tau,
+                remaining_tau=tau,
+                bucket_id=None,
+                serial=j,
+            ))
+    return tickets
+
+
+def _setup_dealer_ring_simulation(n_agents: int) -> Callable[[], Any]:
+    from bilancio.dealer.models import TraderState
+    from bilancio.dealer.simulation import DealerRingConfig, DealerRingSimulation
+
+    sim = DealerRingSimulation(DealerRingConfig(seed=42, max_days=BENCH_DAYS))
+    traders = [TraderState(agent_id=f"H{i + 1}", cash=Decimal(2)) for i in range(n_agents)]
+    tickets = _dealer_ring_tickets(n_agents, [t.agent_id for t in traders])
+    by_id = {t.agent_id: t for t in traders}
+    for ticket in tickets:
+        by_id[ticket.issuer_id].obligations.append(ticket)
+    sim.setup_ring(traders, tickets)
+    return lambda: sim.run(max_days=BENCH_DAYS)
+
+
+def _setup_bank_dealer_simulation(n_agents: int) -> Callable[[], Any]:
+    from bilancio.dealer.bank_dealer_simulation import BankDealerSimulation
+    from bilancio.dealer.bank_integration import BankDealerRingConfig
+
+    sim = BankDealerSimulation(BankDealerRingConfig(
+        ticket_size=Decimal(1),
+        max_days=BENCH_DAYS,
+        seed=42,
+        n_trader_banks=3,
+    ))
+    trader_ids = [f"H{i + 1}" for i in range(n_agents)]
+    sim.setup_ring(
+        n_traders=n_agents,
+        initial_deposits=Decimal(2),
+        tickets=_dealer_ring_tickets(n_agents, trader_ids),
+    )
+    return lambda: sim.run(max_days=BENCH_DAYS)
+
+
+def _setup_metrics_compute(n_agents: int) -> Callable[[], Any]:
+    from bilancio.analysis.metrics_computer import MetricsComputer
+    from bilancio.engines.simulation import run_until_stable
+    from bilancio.export.writers import write_balances_csv, write_events_jsonl
+    from bilancio.storage.artifact_loaders import LocalArtifactLoader
+
+    system = _ring_system(n_agents)
+    run_until_stable(system, max_days=MATURITY_DAYS + BENCH_DAYS)
+    tmp = tempfile.TemporaryDirectory(prefix="bilancio-bench-")
+    out = Path(tmp.name)
+    write_events_jsonl(system, out / "events.jsonl")
+    write_balances_csv(system, out / "balances.csv")
+    computer = MetricsComputer(LocalArtifactLoader(out))
+    artifacts = {"events_jsonl": "events.jsonl", "balances_csv": "balances.csv"}
+
+    def compute():
+        return computer.compute(artifacts)
+
+    compute.workdir = tmp  # removed once the case is dropped
+    return compute
+
+
+BENCHMARKS: Dict[str, Benchmark] = {
+    b.name: b
+    for b in (
+        Benchmark("run_until_stable", "engine: ring from compile_ring_explorer",
+                  _setup_run_until_stable),
+        Benchmark("dealer_ring_simulation", "dealer: DealerRingSimulation.run",
+                  _setup_dealer_ring_simulation),
+        Benchmark("dealer_trading_phase", "engine: one run_dealer_trading_phase call",
+                  _setup_dealer_trading_phase),
+        Benchmark("metrics_compute", "analysis: MetricsComputer.compute on events.jsonl",
+                  _setup_metrics_compute),
+        Benchmark("bank_dealer_simulation", "dealer: BankDealerSimulation.run",
+                  _setup_bank_dealer_simulation),
+    )
+}
+
+DEFAULT_SIZES = (10, 100, 1_000, 10_000)
@@ -0,0 +1,166 @@
+"""Run benchmark cases, save results as JSON and compare against a baseline."""
+
+from __future__ import annotations
+
+import json
+import platform
+import sys
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from .cases import BENCHMARKS
+
+RESULTS_VERSION = 1
+
+
+@dataclass
+class BenchResult:
+    """Timings of one case at one size, in seconds."""
+
+    name: str
+    n_agents: int
+    repeat: int
+    best_s: float
+    mean_s: float
+    setup_s: float
+    error: Optional[str] = None
+
+
+@dataclass
+class Comparison:
+    """A result next to its baseline; ratio is current best / baseline best.
+
+    ``error`` is set, and the times are None, when the case failed or is
+    missing in the current run.
+    """
+
+    name: str
+    n_agents: int
+    baseline_s: float
+    current_s: Optional[float]
+    ratio: Optional[float]
+    regressed: bool
+    error: Optional[str] = None
+
+    @property
+    def failed(self) -> bool:
+        return self.regressed or self.error is not None
+
+
+def run_case(name: str, n_agents: int, repeat: int = 3) -> BenchResult:
+    """Time case ``name`` at ``n_agents``; each repeat gets a fresh setup."""
+    bench = BENCHMARKS[name]
+    timings: List[float] = []
+    setup_total = 0.0
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            fn = bench.setup(n_agents)
+            setup_total += time.perf_counter() - start
+
+            start = time.perf_counter()
+            fn()
+            timings.append(time.perf_counter() - start)
+    except Exception as e:
+        return BenchResult(name, n_agents, len(timings), 0.0, 0.0, setup_total,
+                           error=f"{type(e).__name__}: {e}")
+    return BenchResult(
+        name,
+        n_agents,
+        repeat,
+        min(timings),
+        sum(timings) / len(timings),
+        setup_total / repeat,
+    )
+
+
+def run_benchmarks(
+    names: Iterable[str],
+    sizes: Iterable[int],
+    repeat: int = 3,
+    progress: Optional[Callable[[BenchResult], None]] = None,
+) -> Dict[str, Any]:
+    """Run every case in ``names`` at every size; returns the results document."""
+    names = list(names)
+    unknown = [n for n in names if n not in BENCHMARKS]
+    if unknown:
+        raise ValueError(f"Unknown benchmark(s): {', '.join(unknown)}")
+
+    results = []
+    for name in names:
+        for n_agents in sizes:
+            result = run_case(name, n_agents, repeat)
+            results.append(result)
+            if progress is not None:
+                progress(result)
+
+    return {
+        "version": RESULTS_VERSION,
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "results": [asdict(r) for r in results],
+    }
+
+
+def write_results(doc: Dict[str, Any], path: Path | str) -> None:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(doc, indent=2) + "\n")
+
+
+def load_results(path: Path | str) -> Dict[str, Any]:
+    doc = json.loads(Path(path).read_text())
+    if doc.get("version") != RESULTS_VERSION:
+        raise ValueError(f"Unsupported benchmark results version in {path}: {doc.get('version')}")
+    return doc
+
+
+def compare_results(
+    current: Dict[str, Any],
+    baseline: Dict[str, Any],
+    tolerance: float = 0.2,
+) -> List[Comparison]:
+    """Compare best times of the successful baseline cases with the current run.
+
+    A case regressed when it is slower than the baseline by more than
+    ``tolerance`` (0.2 = 20%). A baseline case that failed or is missing in
+    the current run is reported with ``error`` set, so it fails the
+    comparison too. Cases new in the current run are not compared.
+    """
+    def index(doc):
+        return {(r["name"], r["n_agents"]): r for r in doc.get("results", [])}
+
+    results = index(current)
+    comparisons = []
+    for key, base in index(baseline).items():
+        baseline_s = base.get("best_s")
+        if base.get("error") or not baseline_s:
+            continue
+        result = results.get(key)
+        error = "missing from the current run" if result is None else result.get("error")
+        if error:
+            comparisons.append(Comparison(
+                name=key[0],
+                n_agents=key[1],
+                baseline_s=baseline_s,
+                current_s=None,
+                ratio=None,
+                regressed=False,
+                error=error,
+            ))
+            continue
+        current_s = result["best_s"]
+        ratio = current_s / baseline_s
+        comparisons.append(Comparison(
+            name=key[0],
+            n_agents=key[1],
+            baseline_s=baseline_s,
+            current_s=current_s,
+            ratio=ratio,
+            regressed=ratio > 1 + tolerance,
+        ))
+    return comparisons
@@ -1,9 +1,11 @@
 """Apply configuration to a Bilancio system."""
 
-from typing import Dict, Any
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List
 from decimal import Decimal
 
 from bilancio.engines.system import System
+from bilancio.engines.settlement import schedule_action
 from bilancio.domain.agents import Bank, Household, Firm, CentralBank, Treasury
 from bilancio.ops.banking import deposit_cash, withdraw_cash, client_payment
 from bilancio.domain.instruments.credit import Payable
@@ -58,6 +60,282 @@ def apply_policy_overrides(system: System, overrides: Dict[str, Any]) -> None:
     if "mop_rank" in overrides and overrides["mop_rank"]:
         for agent_kind, mop_list in overrides["mop_rank"].items():
             system.policy.mop_rank[agent_kind] = mop_list
+        system.policy.invalidate()
+
+
+def _capture_alias(system: System, action, instr_id: str) -> None:
+    """Register the optional alias of a creation action for instr_id."""
+    alias = getattr(action, 'alias', None)
+    if alias:
+        if alias in system.state.aliases:
+            raise ValueError(f"Alias already exists: {alias}")
+        system.set_alias(alias, instr_id)
+
+
+def _apply_mint_reserves(system: System, action) -> None:
+    instr_id = system.mint_reserves(
+        to_bank_id=action.to,
+        amount=action.amount,
+        alias=getattr(action, 'alias', None)
+    )
+    _capture_alias(system, action, instr_id)
+
+
+def _apply_mint_cash(system: System, action) -> None:
+    instr_id = system.mint_cash(
+        to_agent_id=action.to,
+        amount=action.amount,
+        alias=getattr(action, 'alias', None)
+    )
+    _capture_alias(system, action, instr_id)
+
+
+def _apply_transfer_reserves(system: System, action) -> None:
+    system.transfer_reserves(
+        from_bank_id=action.from_bank,
+        to_bank_id=action.to_bank,
+        amount=action.amount
+    )
+
+
+def _apply_transfer_cash(system: System, action) -> None:
+    system.transfer_cash(
+        from_agent_id=action.from_agent,
+        to_agent_id=action.to_agent,
+        amount=action.amount
+    )
+
+
+def _apply_deposit_cash(system: System, action) -> None:
+    deposit_cash(
+        system=system,
+        customer_id=action.customer,
+        bank_id=action.bank,
+        amount=action.amount
+    )
+
+
+def _apply_withdraw_cash(system: System, action) -> None:
+    withdraw_cash(
+        system=system,
+        customer_id=action.customer,
+        bank_id=action.bank,
+        amount=action.amount
+    )
+
+
+def _deposit_bank(system: System, customer_id: str) -> str | None:
+    """A bank holding a deposit of the customer (the last one in agent order), or None."""
+    state = system.state
+    banks = {
+        state.contracts[cid].liability_issuer_id
+        for cid in system.holding_ids(customer_id, "bank_deposit")
+    }
+    banks = [b for b in banks if b in state.agents and state.agents[b].kind == "bank"]
+    if len(banks) > 1:
+        order = {agent_id: i for i, agent_id in enumerate(state.agents)}
+        banks.sort(key=order.__getitem__)
+    return banks[-1] if banks else None
+
+
+def _apply_client_payment(system: System, action) -> None:
+    # Need to determine banks for payer and payee
+    agents = system.state.agents
+    if action.payer not in agents or action.payee not in agents:
+        raise ValueError(f"Unknown agent in client_payment: {action.payer} or {action.payee}")
+
+    # Banks come from the parties' current deposits
+    payer_bank = _deposit_bank(system, action.payer)
+    payee_bank = _deposit_bank(system, action.payee)
+
+    if not payer_bank or not payee_bank:
+        raise ValueError(f"Cannot determine banks for client_payment from {action.payer} to {action.payee}")
+
+    client_payment(
+        system=system,
+        payer_id=action.payer,
+        payer_bank=payer_bank,
+        payee_id=action.payee,
+        payee_bank=payee_bank,
+        amount=action.amount
+    )
+
+
+def _apply_create_stock(system: System, action) -> None:
+    system.create_stock(
+        owner_id=action.owner,
+        sku=action.sku,
+        quantity=action.quantity,
+        unit_price=action.unit_price
+    )
+
+
+def _apply_transfer_stock(system: System, action) -> None:
+    # Find stock with matching SKU owned by from_agent
+    stocks = [s for s in system.state.stocks.values()
+             if s.owner_id == action.from_agent and s.sku == action.sku]
+
+    if not stocks:
+        raise ValueError(f"No stock with SKU {action.sku} owned by {action.from_agent}")
+
+    # Transfer from first matching stock
+    stock = stocks[0]
+    if stock.quantity < action.quantity:
+        raise ValueError(f"Insufficient stock: {stock.quantity} < {action.quantity}")
+
+    system.transfer_stock(
+        stock_id=stock.id,
+        from_owner=action.from_agent,
+        to_owner=action.to_agent,
+        quantity=action.quantity if action.quantity < stock.quantity else None
+    )
+
+
+def _apply_create_delivery_obligation(system: System, action) -> None:
+    instr_id = system.create_delivery_obligation(
+        from_agent=action.from_agent,
+        to_agent=action.to_agent,
+        sku=action.sku,
+        quantity=action.quantity,
+        unit_price=action.unit_price,
+        due_day=action.due_day,
+        alias=getattr(action, 'alias', None)
+    )
+    _capture_alias(system, action, instr_id)
+
+
+def _apply_create_payable(system: System, action) -> None:
+    # Create a Payable instrument
+    # Payable uses asset_holder_id (creditor) and liability_issuer_id (debtor)
+    # Note: amount should be in minor units (e.g., cents)
+    # If the input is in major units (e.g., dollars), multiply by 100
+    # For now, we assume the YAML amounts are already in minor units
+
+    # Plan 024: maturity_distance for rollover - defaults to due_day if not set
+    maturity_distance = getattr(action, 'maturity_distance', None)
+    if maturity_distance is None:
+        maturity_distance = action.due_day
+
+    payable = Payable(
+        id=system.new_contract_id("PAY"),
+        kind="payable",  # Will be set by __post_init__ but required by dataclass
+        amount=int(action.amount),  # Assumes amount is already in minor units
+        denom="X",  # Default denomination - could be made configurable
+        asset_holder_id=action.to_agent,  # creditor holds the asset
+        liability_issuer_id=action.from_agent,  # debtor issues the liability
+        due_day=action.due_day,
+        maturity_distance=maturity_distance,  # Plan 024: for continuous rollover
+    )
+    system.add_contract(payable)
+    # optional alias capture
+    _capture_alias(system, action, payable.id)
+
+    # Log the event
+    system.log("PayableCreated",
+        debtor=action.from_agent,
+        creditor=action.to_agent,
+        amount=int(action.amount),
+        due_day=action.due_day,
+        maturity_distance=maturity_distance,
+        payable_id=payable.id,
+        alias=getattr(action, 'alias', None)
+    )
+
+
+def _apply_transfer_claim(system: System, action) -> None:
+    # Transfer claim (reassign asset holder) by alias or id (order-independent validation)
+    alias = getattr(action, 'contract_alias', None)
+    explicit_id = getattr(action, 'contract_id', None)
+    id_from_alias = None
+    if alias is not None:
+        id_from_alias = system.state.aliases.get(alias)
+        if id_from_alias is None:
+            raise ValueError(f"Unknown alias: {alias}")
+    if alias is not None and explicit_id is not None and id_from_alias != explicit_id:
+        raise ValueError(f"Alias {alias} and contract_id {explicit_id} refer to different contracts")
+    resolved_id = explicit_id or id_from_alias
+    if not resolved_id:
+        raise ValueError("transfer_claim requires contract_alias or contract_id to resolve a contract")
+
+    instr = system.state.contracts.get(resolved_id)
+    if instr is None:
+        raise ValueError(f"Contract not found: {resolved_id}")
+
+    old_holder_id = instr.asset_holder_id
+    new_holder_id = action.to_agent
+
+    # Perform reassignment atomically
+    with atomic(system):
+        old_holder = system.state.agents[old_holder_id]
+        new_holder = system.state.agents[new_holder_id]
+        if resolved_id not in old_holder.asset_ids:
+            raise ValueError(f"Contract {resolved_id} not in old holder's assets")
+        system.move_asset(resolved_id, old_holder_id, new_holder_id)
+        system.log("ClaimTransferred",
+                   contract_id=resolved_id,
+                   frm=old_holder_id,
+                   to=new_holder_id,
+                   contract_kind=instr.kind,
+                   amount=getattr(instr, 'amount', None),
+                   due_day=getattr(instr, 'due_day', None),
+                   sku=getattr(instr, 'sku', None),
+                   alias=alias)
+
+
+# action type -> handler(system, action)
+_ACTION_HANDLERS: Dict[str, Callable[..., None]] = {
+    "mint_reserves": _apply_mint_reserves,
+    "mint_cash": _apply_mint_cash,
+    "transfer_reserves": _apply_transfer_reserves,
+    "transfer_cash": _apply_transfer_cash,
+    "deposit_cash": _apply_deposit_cash,
+    "withdraw_cash": _apply_withdraw_cash,
+    "client_payment": _apply_client_payment,
+    "create_stock": _apply_create_stock,
+    "transfer_stock": _apply_transfer_stock,
+    "create_delivery_obligation": _apply_create_delivery_obligation,
+    "create_payable": _apply_create_payable,
+    "transfer_claim": _apply_transfer_claim,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledAction:
+    """An action parsed once and bound to its handler.
+
+    ``source`` is the original action dict (scheduled-action cancellation
+    still inspects it); calling the compiled action applies it to a system.
+    """
+
+    source: Dict[str, Any]
+    action: Any
+    handler: Callable[..., None]
+
+    def __call__(self, system: System) -> None:
+        try:
+            self.handler(system, self.action)
+        except Exception as e:
+            # Add context to the error
+            raise ValueError(f"Failed to apply {self.action.action}: {e}")
+
+
+def _unknown_action(system: System, action) -> None:
+    raise ValueError(f"Unknown action type: {action.action}")
+
+
+def compile_action(action_dict: Dict[str, Any]) -> CompiledAction:
+    """Parse an action dict and resolve its handler ahead of execution.
+
+    Nothing about the agents is bound at compile time: agents can be added
+    or expelled before a scheduled action runs, so handlers resolve them
+    from the system when called.
+
+    Raises:
+        ValueError: If the action cannot be parsed
+    """
+    action = parse_action(action_dict)
+    handler = _ACTION_HANDLERS.get(action.action, _unknown_action)
+    return CompiledAction(source=action_dict, action=action, handler=handler)
 
 
 def apply_action(system: System, action_dict: Dict[str, Any], agents: Dict[str, Any]) -> None:
@@ -72,239 +350,51 @@ def apply_action(system: System, action_dict: Dict[str, Any], agents: Dict[str,
         ValueError: If action cannot be applied
         ValidationError: If action violates system invariants
     """
-    # Parse the action
-    action = parse_action(action_dict)
-    action_type = action.action
-    
-    try:
-        if action_type == "mint_reserves":
-            instr_id = system.mint_reserves(
-                to_bank_id=action.to,
-                amount=action.amount,
-                alias=getattr(action, 'alias', None)
-            )
-            # optional alias capture
-            if getattr(action, 'alias', None):
-                alias = action.alias
-                if alias in system.state.aliases:
-                    raise ValueError(f"Alias already exists: {alias}")
-                system.state.aliases[alias] = instr_id
-            
-        elif action_type == "mint_cash":
-            instr_id = system.mint_cash(
-                to_agent_id=action.to,
-                amount=action.amount,
-                alias=getattr(action, 'alias', None)
-            )
-            if getattr(action, 'alias', None):
-                alias = action.alias
-                if alias in system.state.aliases:
-                    raise ValueError(f"Alias already exists: {alias}")
-                system.state.aliases[alias] = instr_id
-            
-        elif action_type == "transfer_reserves":
-            system.transfer_reserves(
-                from_bank_id=action.from_bank,
-                to_bank_id=action.to_bank,
-                amount=action.amount
-            )
-            
-        elif action_type == "transfer_cash":
-            system.transfer_cash(
-                from_agent_id=action.from_agent,
-                to_agent_id=action.to_agent,
-                amount=action.amount
-            )
-            
-        elif action_type == "deposit_cash":
-            deposit_cash(
-                system=system,
-                customer_id=action.customer,
-                bank_id=action.bank,
-                amount=action.amount
-            )
-            
-        elif action_type == "withdraw_cash":
-            withdraw_cash(
-                system=system,
-                customer_id=action.customer,
-                bank_id=action.bank,
-                amount=action.amount
-            )
-            
-        elif action_type == "client_payment":
-            # Need to determine banks for payer and payee
-            payer = agents.get(action.payer)
-            payee = agents.get(action.payee)
-            
-            if not payer or not payee:
-                raise ValueError(f"Unknown agent in client_payment: {action.payer} or {action.payee}")
-            
-            # Find bank relationships (simplified - assumes first deposit)
-            payer_bank = None
-            payee_bank = None
-            
-            # Check for existing deposits to determine banks
-            for bank_id in [a.id for a in agents.values() if a.kind == "bank"]:
-                if system.deposit_ids(action.payer, bank_id):
-                    payer_bank = bank_id
-                if system.deposit_ids(action.payee, bank_id):
-                    payee_bank = bank_id
-            
-            if not payer_bank or not payee_bank:
-                raise ValueError(f"Cannot determine banks for client_payment from {action.payer} to {action.payee}")
-            
-            client_payment(
-                system=system,
-                payer_id=action.payer,
-                payer_bank=payer_bank,
-                payee_id=action.payee,
-                payee_bank=payee_bank,
-                amount=action.amount
-            )
-            
-        elif action_type == "create_stock":
-            system.create_stock(
-                owner_id=action.owner,
-                sku=action.sku,
-                quantity=action.quantity,
-                unit_price=action.unit_price
-            )
-            
-        elif action_type == "transfer_stock":
-            # Find stock with matching SKU owned by from_agent
-            stocks = [s for s in system.state.stocks.values() 
-                     if s.owner_id == action.from_agent and s.sku == action.sku]
-            
-            if not stocks:
-                raise ValueError(f"No stock with SKU {action.sku} owned by {action.from_agent}")
-            
-            # Transfer from first matching stock
-            stock = stocks[0]
-            if stock.quantity < action.quantity:
-                raise ValueError(f"Insufficient stock: {stock.quantity} < {action.quantity}")
-            
-            system.transfer_stock(
-                stock_id=stock.id,
-                from_owner=action.from_agent,
-                to_owner=action.to_agent,
-                quantity=action.quantity if action.quantity < stock.quantity else None
-            )
-            
-        elif action_type == "create_delivery_obligation":
-            instr_id = system.create_delivery_obligation(
-                from_agent=action.from_agent,
-                to_agent=action.to_agent,
-                sku=action.sku,
-                quantity=action.quantity,
-                unit_price=action.unit_price,
-                due_day=action.due_day,
-                alias=getattr(action, 'alias', None)
-            )
-            if getattr(action, 'alias', None):
-                alias = action.alias
-                if alias in system.state.aliases:
-                    raise ValueError(f"Alias already exists: {alias}")
-                system.state.aliases[alias] = instr_id
-            
-        elif action_type == "create_payable":
-            # Create a Payable instrument
-            # Payable uses asset_holder_id (creditor) and liability_issuer_id (debtor)
-            # Note: amount should be in minor units (e.g., cents)
-            # If the input is in major units (e.g., dollars), multiply by 100
-            # For now, we assume the YAML amounts are already in minor units
-
-            # Plan 024: maturity_distance for rollover - defaults to due_day if not set
-            maturity_distance = getattr(action, 'maturity_distance', None)
-            if maturity_distance is None:
-                maturity_distance = action.due_day
-
-            payable = Payable(
-                id=system.new_contract_id("PAY"),
-                kind="payable",  # Will be set by __post_init__ but required by dataclass
-                amount=int(action.amount),  # Assumes amount is already in minor units
-                denom="X",  # Default denomination - could be made configurable
-                asset_holder_id=action.to_agent,  # creditor holds the asset
-                liability_issuer_id=action.from_agent,  # debtor issues the liability
-                due_day=action.due_day,
-                maturity_distance=maturity_distance,  # Plan 024: for continuous rollover
-            )
-            system.add_contract(payable)
-            # optional alias capture
-            if getattr(action, 'alias', None):
-                alias = action.alias
-                if alias in system.state.aliases:
-                    raise ValueError(f"Alias already exists: {alias}")
-                system.state.aliases[alias] = payable.id
-
-            # Log the event
-            system.log("PayableCreated",
-                debtor=action.from_agent,
-                creditor=action.to_agent,
-                amount=int(action.amount),
-                due_day=action.due_day,
-                maturity_distance=maturity_distance,
-                payable_id=payable.id,
-                alias=getattr(action, 'alias', None)
-            )
-        
-        elif action_type == "transfer_claim":
-            # Transfer claim (reassign asset holder) by alias or id (order-independent validation)
-            data = action
-            alias = getattr(data, 'contract_alias', None)
-            explicit_id = getattr(data, 'contract_id', None)
-            id_from_alias = None
-            if alias is not None:
-                id_from_alias = system.state.aliases.get(alias)
-                if id_from_alias is None:
-                    raise ValueError(f"Unknown alias: {alias}")
-            if alias is not None and explicit_id is not None and id_from_alias != explicit_id:
-                raise ValueError(f"Alias {alias} and contract_id {explicit_id} refer to different contracts")
-            resolved_id = explicit_id or id_from_alias
-            if not resolved_id:
-                raise ValueError("transfer_claim requires contract_alias or contract_id to resolve a contract")
-
-            instr = system.state.contracts.get(resolved_id)
-            if instr is None:
-                raise ValueError(f"Contract not found: {resolved_id}")
-
-            old_holder_id = instr.asset_holder_id
-            new_holder_id = data.to_agent
-
-            # Perform reassignment atomically
-            with atomic(system):
-                old_holder = system.state.agents[old_holder_id]
-                new_holder = system.state.agents[new_holder_id]
-                if resolved_id not in old_holder.asset_ids:
-                    raise ValueError(f"Contract {resolved_id} not in old holder's assets")
-                old_holder.asset_ids.remove(resolved_id)
-                new_holder.asset_ids.append(resolved_id)
-                instr.asset_holder_id = new_holder_id
-                system.log("ClaimTransferred",
-                           contract_id=resolved_id,
-                           frm=old_holder_id,
-                           to=new_holder_id,
-                           contract_kind=instr.kind,
-                           amount=getattr(instr, 'amount', None),
-                           due_day=getattr(instr, 'due_day', None),
-                           sku=getattr(instr, 'sku', None),
-                           alias=alias)
-            
-            # Log the event
-            system.log("PayableCreated",
-                debtor=action.from_agent,
-                creditor=action.to_agent,
-                amount=int(action.amount),
-                due_day=action.due_day,
-                payable_id=payable.id
-            )
-            
-        else:
-            raise ValueError(f"Unknown action type: {action_type}")
-            
-    except Exception as e:
-        # Add context to the error
-        raise ValueError(f"Failed to apply {action_type}: {e}")
+    compile_action(action_dict)(system)
+
+
+def schedule_actions(system: System, scheduled_actions) -> None:
+    """Stage scheduled actions for Phase B1 and compile them ahead of time.
+
+    The raw action dicts go to ``state.scheduled_actions_by_day`` through
+    ``schedule_action``, which indexes what they reference; their
+    compiled form is cached per day in ``state.compiled_actions_by_day``.
+    Actions that fail to parse are still staged; the error is raised when
+    their day runs.
+    """
+    for sa in scheduled_actions:
+        schedule_action(system, sa.day, sa.action)
+    for day in system.state.scheduled_actions_by_day:
+        try:
+            compiled_actions_for_day(system, day)
+        except ValueError:
+            continue
+
+
+def compiled_actions_for_day(system: System, day: int) -> List[CompiledAction]:
+    """Compiled form of the actions scheduled for ``day``, in order.
+
+    The per-day cache is revalidated against the scheduled list (identity and
+    length), so edits such as cancelling a defaulted agent's actions are picked
+    up; actions compiled before are reused by identity of their dict.
+    """
+    state = system.state
+    actions = state.scheduled_actions_by_day.get(day)
+    if not actions:
+        return []
+    entry = state.compiled_actions_by_day.get(day)
+    if entry is not None and entry[0] is actions and entry[1] == len(actions):
+        return entry[2]
+
+    known = {id(c.source): c for c in entry[2]} if entry is not None else {}
+    compiled = []
+    for action_dict in actions:
+        c = known.get(id(action_dict))
+        if c is None or c.source is not action_dict:
+            c = compile_action(action_dict)
+        compiled.append(c)
+    state.compiled_actions_by_day[day] = (actions, len(actions), compiled)
+    return compiled
 
 
 def _collect_alias_from_action(action_model) -> str | None:
@@ -370,6 +460,9 @@ def apply_to_system(config: ScenarioConfig, system: System) -> None:
     4. Initializes dealer subsystem if configured
     5. Optionally validates invariants
 
+    Scheduled actions are not staged here; callers that run the scenario
+    stage them with ``schedule_actions``.
+
     Args:
         config: Scenario configuration
         system: System instance to configure
@@ -432,6 +525,8 @@ def apply_to_system(config: ScenarioConfig, system: System) -> None:
             dealer_share=config.dealer.dealer_share,
             vbt_share=config.dealer.vbt_share,
             seed=42,  # Default seed - can be made configurable later
+            quote_cache_size=config.dealer.quote_cache_size,
+            kernel_audit_every=config.dealer.kernel_audit_every,
         )
 
         # Create risk assessment params if enabled
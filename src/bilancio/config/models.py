@@ -316,6 +316,10 @@ class ExportConfig(BaseModel):
         None,
         description="Path to export events JSONL"
     )
+    phase_timings_csv: Optional[str] = Field(
+        None,
+        description="Path to export per-day, per-phase timings and counters CSV"
+    )
 
 
 class RunConfig(BaseModel):
@@ -334,6 +338,18 @@ class RunConfig(BaseModel):
         False,
         description="Enable continuous rollover of settled payables (Plan 024)"
     )
+    pooled_holdings: bool = Field(
+        False,
+        description="Keep one cash/reserve balance record per holder and issuer, updated in place on transfer"
+    )
+    clearing_mode: Literal["bilateral", "multilateral"] = Field(
+        "bilateral",
+        description="Phase C interbank clearing: settle each bank pair, or each bank's multilateral net position"
+    )
+    settlement_mode: Literal["sequential", "lsm"] = Field(
+        "sequential",
+        description="Phase B2 settlement: one payable at a time, or first a gridlock-resolving batch of payables that can settle together"
+    )
     show: ShowConfig = Field(default_factory=ShowConfig)
     export: ExportConfig = Field(default_factory=ExportConfig)
 
@@ -488,6 +504,16 @@ class DealerConfig(BaseModel):
         default_factory=RiskAssessmentConfig,
         description="Risk assessment configuration for trader decisions"
     )
+    quote_cache_size: int = Field(
+        0,
+        ge=0,
+        description="Entries of the dealer kernel quote cache (0 disables it)"
+    )
+    kernel_audit_every: int = Field(
+        0,
+        ge=0,
+        description="Cross-check every Nth dealer kernel recomputation against the float kernel (0 disables it)"
+    )
 
     @field_validator("ticket_size")
     @classmethod
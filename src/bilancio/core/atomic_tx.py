@@ -1,13 +1,137 @@
+"""Journaled transactions for System state.
+
+``atomic(system)`` opens a savepoint on the state's undo log. Every mutation
+made through the journaled helpers (``System`` registry gateway,
+``ops.primitives``, ``ops.banking``) records its inverse while a transaction
+is open. If the block raises, the log is unwound back to the savepoint in
+reverse order, so rollback costs O(changes) instead of a deep copy of the
+whole state. Savepoints nest: an inner ``atomic`` that fails only undoes its
+own changes, and an inner block that succeeds stays undoable by the outer one.
+
+Outside any transaction the helpers apply the mutation without recording.
+"""
+
 import copy
 from contextlib import contextmanager
+from typing import Any, Callable
+
+from bilancio.core.ids import IdList
+
+
+class UndoLog:
+    """Undo journal of inverse operations recorded while a transaction is open."""
+
+    __slots__ = ("entries", "depth", "transactions")
+
+    def __init__(self) -> None:
+        self.entries: list[Callable[[], None]] = []
+        self.depth = 0
+        # Savepoints opened so far (instrumentation)
+        self.transactions = 0
+
+    def __deepcopy__(self, memo: dict) -> "UndoLog":
+        # A copied state starts with a fresh journal; pending undo entries
+        # close over the original objects and must not leak into the copy.
+        return UndoLog()
+
+    @property
+    def active(self) -> bool:
+        return self.depth > 0
+
+    # ---- transaction control
+    def begin(self) -> int:
+        """Open a savepoint and return its mark."""
+        self.depth += 1
+        self.transactions += 1
+        return len(self.entries)
+
+    def rollback(self, mark: int) -> None:
+        """Undo every entry recorded after ``mark``, newest first."""
+        entries = self.entries
+        while len(entries) > mark:
+            entries.pop()()
+
+    def end(self) -> None:
+        """Close a savepoint; the outermost close discards the journal."""
+        self.depth -= 1
+        if self.depth == 0:
+            self.entries.clear()
+
+    # ---- recording
+    def record(self, undo: Callable[[], None]) -> None:
+        if self.depth:
+            self.entries.append(undo)
+
+    def setattr(self, obj: Any, name: str, value: Any) -> None:
+        if self.depth:
+            old = getattr(obj, name)
+            self.entries.append(lambda: setattr(obj, name, old))
+        setattr(obj, name, value)
+
+    def append(self, seq: list | IdList, item: Any) -> None:
+        seq.append(item)
+        if self.depth:
+            self.entries.append(seq.pop)
+
+    def remove(self, seq: list | IdList, item: Any) -> None:
+        """Remove ``item`` from ``seq``; undo reinserts it at the same position."""
+        if type(seq) is IdList:
+            token = seq.remove_with_token(item)
+            if self.depth:
+                self.entries.append(lambda: seq.restore(item, token))
+        elif self.depth:
+            idx = seq.index(item)
+            del seq[idx]
+            self.entries.append(lambda: seq.insert(idx, item))
+        else:
+            seq.remove(item)
+
+    def setitem(self, mapping: dict, key: Any, value: Any) -> None:
+        if self.depth:
+            if key in mapping:
+                old = mapping[key]
+                self.entries.append(lambda: mapping.__setitem__(key, old))
+            else:
+                self.entries.append(lambda: mapping.pop(key, None))
+        mapping[key] = value
+
+    def delitem(self, mapping: dict, key: Any) -> Any:
+        """Delete ``mapping[key]`` and return the removed value.
+
+        Undo re-inserts the entry; its iteration position moves to the end.
+        """
+        value = mapping.pop(key)
+        if self.depth:
+            self.entries.append(lambda: mapping.__setitem__(key, value))
+        return value
+
+    def add(self, members: set, item: Any) -> None:
+        if item in members:
+            return
+        members.add(item)
+        if self.depth:
+            self.entries.append(lambda: members.discard(item))
 
 
 @contextmanager
 def atomic(system):
     """Context manager for atomic operations - rollback on failure"""
-    snapshot = copy.deepcopy(system.state)
+    journal = getattr(system.state, "journal", None)
+    if journal is None:
+        # Duck-typed states without a journal fall back to a full snapshot.
+        snapshot = copy.deepcopy(system.state)
+        try:
+            yield
+        except Exception:
+            system.state = snapshot
+            raise
+        return
+
+    mark = journal.begin()
     try:
         yield
     except Exception:
-        system.state = snapshot
+        journal.rollback(mark)
         raise
+    finally:
+        journal.end()
@@ -0,0 +1,121 @@
+"""Append-only event store indexed by day and kind."""
+
+from typing import Any, Iterable, Optional
+
+Event = dict[str, Any]
+
+
+class EventStore(list):
+    """List of event dicts that also indexes events by ``day`` and ``kind``.
+
+    It is a real ``list`` so existing code that iterates, slices, extends or
+    serialises ``state.events`` keeps working. Appends (the normal path) update
+    the indexes in O(1); ``pop()`` of the last event, as done by the undo
+    journal, is O(1) as well. Any other in-place edit rebuilds the indexes.
+
+    Lookups return new lists in log order:
+
+    - ``for_day(day)``: all events of a day
+    - ``of_kind(kind, day=None)``: events of one kind, on a day or overall
+    """
+
+    def __init__(self, events: Iterable[Event] = ()) -> None:
+        super().__init__()
+        self._by_day: dict[Any, list[Event]] = {}
+        self._by_kind: dict[Any, list[Event]] = {}
+        self._by_day_kind: dict[tuple[Any, Any], list[Event]] = {}
+        self.extend(events)
+
+    def __reduce__(self):
+        return (type(self), (list(self),))
+
+    # ---- lookups
+    def for_day(self, day: int) -> list[Event]:
+        return list(self._by_day.get(day, ()))
+
+    def of_kind(self, kind: str, day: Optional[int] = None) -> list[Event]:
+        if day is None:
+            return list(self._by_kind.get(kind, ()))
+        return list(self._by_day_kind.get((day, kind), ()))
+
+    def days(self) -> list[Any]:
+        """Days that have at least one event, in order of first appearance."""
+        return list(self._by_day)
+
+    # ---- indexed mutations
+    def _index(self, event: Event) -> None:
+        day = event.get("day")
+        kind = event.get("kind")
+        self._by_day.setdefault(day, []).append(event)
+        self._by_kind.setdefault(kind, []).append(event)
+        self._by_day_kind.setdefault((day, kind), []).append(event)
+
+    def _unindex_last(self, event: Event) -> None:
+        day = event.get("day")
+        kind = event.get("kind")
+        for index, key in (
+            (self._by_day, day),
+            (self._by_kind, kind),
+            (self._by_day_kind, (day, kind)),
+        ):
+            bucket = index[key]
+            bucket.pop()
+            if not bucket:
+                del index[key]
+
+    def _reindex(self) -> None:
+        self._by_day.clear()
+        self._by_kind.clear()
+        self._by_day_kind.clear()
+        for event in self:
+            self._index(event)
+
+    def append(self, event: Event) -> None:
+        super().append(event)
+        self._index(event)
+
+    def extend(self, events: Iterable[Event]) -> None:
+        for event in events:
+            self.append(event)
+
+    def __iadd__(self, events: Iterable[Event]) -> "EventStore":
+        self.extend(events)
+        return self
+
+    def pop(self, index: int = -1) -> Event:
+        if index in (-1, len(self) - 1):
+            event = super().pop()
+            self._unindex_last(event)
+            return event
+        event = super().pop(index)
+        self._reindex()
+        return event
+
+    def clear(self) -> None:
+        super().clear()
+        self._reindex()
+
+    # Rare edits: apply, then rebuild the indexes.
+    def insert(self, index: int, event: Event) -> None:
+        super().insert(index, event)
+        self._reindex()
+
+    def remove(self, event: Event) -> None:
+        super().remove(event)
+        self._reindex()
+
+    def __setitem__(self, index, value) -> None:
+        super().__setitem__(index, value)
+        self._reindex()
+
+    def __delitem__(self, index) -> None:
+        super().__delitem__(index)
+        self._reindex()
+
+    def sort(self, *args, **kwargs) -> None:
+        super().sort(*args, **kwargs)
+        self._reindex()
+
+    def reverse(self) -> None:
+        super().reverse()
+        self._reindex()
@@ -1,10 +1,187 @@
 import uuid
+from bisect import insort
+from typing import Iterable, Iterator
 
 
 def new_id(prefix: str = "x") -> str:
-    # short, sortable-ish id; fine for MVP
+    # Random, process-global id. Code that has a System (or a simulation
+    # with its own IdAllocator) should allocate from it instead, so that
+    # runs are reproducible.
     return f"{prefix}_{uuid.uuid4().hex[:12]}"
 
+
+class IdAllocator:
+    """Deterministic counter-based id allocator.
+
+    Each prefix has its own counter: ``next("C")`` yields ``C_1``, ``C_2``, ...
+    In compact mode one counter is shared by all prefixes and ids are bare
+    integers rendered as strings (``"1"``, ``"2"``, ...).
+    """
+
+    __slots__ = ("compact", "_counters")
+
+    def __init__(self, compact: bool = False) -> None:
+        self.compact = compact
+        self._counters: dict[str, int] = {}
+
+    def next(self, prefix: str = "x") -> str:
+        key = "" if self.compact else prefix
+        n = self._counters.get(key, 0) + 1
+        self._counters[key] = n
+        return str(n) if self.compact else f"{prefix}_{n}"
+
 AgentId = str
 InstrId = str
 OpId = str
+
+
+class IdList:
+    """Insertion-ordered list of ids with O(1) membership, append and remove.
+
+    Drop-in for the ``list[InstrId]`` fields on agents: supports iteration,
+    ``in``, ``len``, ``append``, ``remove`` (first occurrence), ``pop``,
+    ``count``, ``copy`` and positional access. ``[0]``/``[-1]`` (and
+    ``first()``/``last()``) are O(1); other positions read a cached ordered
+    view, rebuilt in O(n) after a mutation.
+    Each entry carries a sequence token so a removed id can be restored to
+    its original position (used by the undo journal).
+    """
+
+    __slots__ = ("_items", "_where", "_next", "_unordered", "_view")
+
+    def __init__(self, ids: Iterable[str] = ()) -> None:
+        self._items: dict[int, str] = {}
+        self._where: dict[str, list[int]] = {}
+        self._next = 0
+        self._unordered = False
+        # Ordered list of the ids, for positional access (None when stale)
+        self._view: list[str] | None = None
+        for item in ids:
+            self.append(item)
+
+    def _ensure_order(self) -> None:
+        if self._unordered:
+            self._items = dict(sorted(self._items.items()))
+            self._unordered = False
+
+    def _ordered(self) -> list[str]:
+        view = self._view
+        if view is None:
+            self._ensure_order()
+            view = self._view = list(self._items.values())
+        return view
+
+    # ---- list API
+    def append(self, item: str) -> None:
+        self._view = None
+        token = self._next
+        self._next += 1
+        self._items[token] = item
+        tokens = self._where.get(item)
+        if tokens is None:
+            self._where[item] = [token]
+        else:
+            tokens.append(token)
+
+    def extend(self, items: Iterable[str]) -> None:
+        for item in items:
+            self.append(item)
+
+    def remove(self, item: str) -> None:
+        self.remove_with_token(item)
+
+    def pop(self) -> str:
+        self._view = None
+        self._ensure_order()
+        token, item = self._items.popitem()
+        tokens = self._where[item]
+        tokens.remove(token)
+        if not tokens:
+            del self._where[item]
+        return item
+
+    def insert(self, index: int, item: str) -> None:
+        items = list(self)
+        items.insert(index, item)
+        self.clear()
+        self.extend(items)
+
+    def clear(self) -> None:
+        self._view = None
+        self._items.clear()
+        self._where.clear()
+        self._unordered = False
+
+    def count(self, item: str) -> int:
+        return len(self._where.get(item, ()))
+
+    def index(self, item: str) -> int:
+        return self._ordered().index(item)
+
+    def first(self) -> str:
+        """The first id (IndexError if empty)."""
+        return self[0]
+
+    def last(self) -> str:
+        """The last id (IndexError if empty)."""
+        return self[-1]
+
+    def copy(self) -> "IdList":
+        return IdList(self)
+
+    def has_duplicates(self) -> bool:
+        return len(self._items) != len(self._where)
+
+    # ---- position tokens (undo journal)
+    def remove_with_token(self, item: str) -> int:
+        """Remove the first occurrence of ``item`` and return its position token."""
+        tokens = self._where.get(item)
+        if not tokens:
+            raise ValueError(f"{item!r} not in IdList")
+        self._view = None
+        token = tokens.pop(0)
+        if not tokens:
+            del self._where[item]
+        del self._items[token]
+        return token
+
+    def restore(self, item: str, token: int) -> None:
+        """Put ``item`` back at the position identified by ``token``."""
+        self._view = None
+        self._items[token] = item
+        insort(self._where.setdefault(item, []), token)
+        if token < self._next - 1:
+            self._unordered = True
+
+    # ---- container protocol
+    def __contains__(self, item: object) -> bool:
+        return item in self._where
+
+    def __iter__(self) -> Iterator[str]:
+        self._ensure_order()
+        return iter(self._items.values())
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __bool__(self) -> bool:
+        return bool(self._items)
+
+    def __getitem__(self, index):
+        if index == 0 or index == -1:
+            if not self._items:
+                raise IndexError("IdList index out of range")
+            self._ensure_order()
+            values = self._items.values()
+            return next(iter(values) if index == 0 else reversed(values))
+        return self._ordered()[index]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (IdList, list, tuple)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return repr(list(self))
@@ -1,3 +1,6 @@
+from bilancio.core.ids import IdList
+
+
 def assert_cb_cash_matches_outstanding(system):
     total = sum(c.amount for c in system.state.contracts.values() if c.kind == "cash")
     assert total == system.state.cb_cash_outstanding, "CB cash mismatch"
@@ -16,19 +19,72 @@ def assert_double_entry_numeric(system):
         if hasattr(c, 'amount') and c.amount < 0:
             raise AssertionError("negative amount detected")
 
-def assert_no_duplicate_refs(system):
+def _first_duplicate(ids):
+    if isinstance(ids, IdList) and not ids.has_duplicates():
+        return None
+    seen = set()
+    for item in ids:
+        if item in seen:
+            return item
+        seen.add(item)
+    return None
+
+
+def _agents(system, agent_ids):
+    agents = system.state.agents
+    if agent_ids is None:
+        return agents.items()
+    return ((aid, agents[aid]) for aid in agent_ids if aid in agents)
+
+
+def assert_contract_refs(system, contract_ids):
+    """Each listed contract is on its holder's assets and its issuer's liabilities."""
+    state = system.state
+    for cid in contract_ids:
+        c = state.contracts.get(cid)
+        if c is None:
+            continue
+        # For secondary market transfers (e.g., payables sold to dealers),
+        # check the effective holder, not the original asset_holder_id
+        effective_holder_id = getattr(c, 'effective_creditor', None) or c.asset_holder_id
+        assert cid in state.agents[effective_holder_id].asset_ids, f"{cid} missing on asset holder {effective_holder_id}"
+        assert cid in state.agents[c.liability_issuer_id].liability_ids, f"{cid} missing on issuer"
+
+def assert_no_negative_amounts(system, contract_ids):
+    """Incremental form of the negative balance/amount checks."""
+    contracts = system.state.contracts
+    for cid in contract_ids:
+        c = contracts.get(cid)
+        if c is None or not hasattr(c, 'amount') or c.amount >= 0:
+            continue
+        if c.kind in ("bank_deposit", "cash", "reserve_deposit"):
+            raise AssertionError("negative balance detected")
+        raise AssertionError("negative amount detected")
+
+def assert_amount_totals_match(system):
+    """Running means-of-payment totals agree with the contracts registry."""
+    totals = {}
+    for c in system.state.contracts.values():
+        if c.kind in ("bank_deposit", "cash", "reserve_deposit"):
+            totals[c.kind] = totals.get(c.kind, 0) + c.amount
+    for kind in ("bank_deposit", "cash", "reserve_deposit"):
+        assert system.state.amount_totals.get(kind, 0) == totals.get(kind, 0), f"{kind} running total mismatch"
+
+def assert_cb_totals_match(system):
+    """CB outstanding counters agree with the running cash/reserve totals (O(1))."""
+    totals = system.state.amount_totals
+    assert totals.get("cash", 0) == system.state.cb_cash_outstanding, "CB cash mismatch"
+    assert totals.get("reserve_deposit", 0) == system.state.cb_reserves_outstanding, "CB reserves mismatch"
+
+def assert_no_duplicate_refs(system, agent_ids=None):
     """No duplicate contract IDs in any agent's asset/liability lists."""
-    for aid, a in system.state.agents.items():
-        assets_seen = set()
-        for cid in a.asset_ids:
-            if cid in assets_seen:
-                raise AssertionError(f"duplicate asset ref {cid} on {aid}")
-            assets_seen.add(cid)
-        liabilities_seen = set()
-        for cid in a.liability_ids:
-            if cid in liabilities_seen:
-                raise AssertionError(f"duplicate liability ref {cid} on {aid}")
-            liabilities_seen.add(cid)
+    for aid, a in _agents(system, agent_ids):
+        cid = _first_duplicate(a.asset_ids)
+        if cid is not None:
+            raise AssertionError(f"duplicate asset ref {cid} on {aid}")
+        cid = _first_duplicate(a.liability_ids)
+        if cid is not None:
+            raise AssertionError(f"duplicate liability ref {cid} on {aid}")
 
 
 def assert_all_stock_ids_owned(system):
@@ -58,11 +114,42 @@ def assert_no_negative_stocks(system):
             raise AssertionError(f"Stock {stock_id} has negative quantity: {stock.quantity}")
 
 
-def assert_no_duplicate_stock_refs(system):
+def assert_no_duplicate_stock_refs(system, agent_ids=None):
     """No duplicate stock IDs in any agent's stock_ids."""
-    for aid, agent in system.state.agents.items():
-        stocks_seen = set()
+    for aid, agent in _agents(system, agent_ids):
+        stock_id = _first_duplicate(agent.stock_ids)
+        if stock_id is not None:
+            raise AssertionError(f"duplicate stock ref {stock_id} on {aid}")
+
+
+def assert_stock_refs(system, stock_ids, agent_ids):
+    """Incremental stock ownership check for touched lots and agents."""
+    state = system.state
+    for stock_id in stock_ids:
+        stock = state.stocks.get(stock_id)
+        if stock is None:
+            continue
+        if stock.quantity < 0:
+            raise AssertionError(f"Stock {stock_id} has negative quantity: {stock.quantity}")
+        if stock_id not in state.agents[stock.owner_id].stock_ids:
+            raise AssertionError(f"Stock {stock_id} in registry but no agent owns it")
+    for aid, agent in _agents(system, agent_ids):
         for stock_id in agent.stock_ids:
-            if stock_id in stocks_seen:
-                raise AssertionError(f"duplicate stock ref {stock_id} on {aid}")
-            stocks_seen.add(stock_id)
+            stock = state.stocks.get(stock_id)
+            if stock is not None and stock.owner_id != aid:
+                raise AssertionError(f"Stock {stock_id} owner_id {stock.owner_id} doesn't match owning agent {aid}")
+
+
+def assert_intraday_nets_match_events(system, days=None):
+    """The uncleared interbank net accumulator agrees with the ClientPayment events.
+
+    Checks the given days (default: every day still in the accumulator).
+    Zero nets are ignored on both sides.
+    """
+    from bilancio.engines.clearing import scan_intraday_nets
+
+    accumulated = system.state.intraday_nets
+    for day in (list(accumulated) if days is None else days):
+        nets = {pair: amt for pair, amt in accumulated.get(day, {}).items() if amt}
+        scanned = {pair: amt for pair, amt in scan_intraday_nets(system, day).items() if amt}
+        assert nets == scanned, f"intraday nets for day {day} do not match ClientPayment events"
@@ -12,6 +12,8 @@ Components:
 - assertions: C1-C6 programmatic invariant checks
 - events: Event logging system
 - trading: Trade execution logic (Events 1-2, 9-10)
+- ticket_schedule: Maturity-day and bucket-crossing index over tickets
+- snapshots: Delta-encoded storage of day snapshots
 - simulation: Dealer ring event loop orchestrator
 
 References:
@@ -32,8 +34,14 @@ from .models import (
 from .kernel import (
     M_MIN,
     KernelParams,
+    KernelAudit,
+    KernelQuotes,
+    QuoteCache,
     ExecutionResult,
     recompute_dealer_state,
+    recompute_dealer_state_batch,
+    audit_dealer_state,
+    kernel_quotes,
     can_interior_buy,
     can_interior_sell,
 )
@@ -54,6 +62,10 @@ from .events import EventLog
 
 from .trading import TradeExecutor
 
+from .ticket_schedule import TicketRegistry, TicketSchedule
+
+from .snapshots import SnapshotLog
+
 from .simulation import (
     DaySnapshot,
     DealerRingConfig,
@@ -77,8 +89,14 @@ __all__ = [
     # Kernel
     "M_MIN",
     "KernelParams",
+    "KernelAudit",
+    "KernelQuotes",
+    "QuoteCache",
     "ExecutionResult",
     "recompute_dealer_state",
+    "recompute_dealer_state_batch",
+    "audit_dealer_state",
+    "kernel_quotes",
     "can_interior_buy",
     "can_interior_sell",
     # Assertions
@@ -95,6 +113,11 @@ __all__ = [
     "EventLog",
     # Trading
     "TradeExecutor",
+    # Ticket schedule
+    "TicketRegistry",
+    "TicketSchedule",
+    # Snapshots
+    "SnapshotLog",
     # Simulation
     "DaySnapshot",
     "DealerRingConfig",
@@ -30,7 +30,7 @@ from decimal import Decimal, ROUND_HALF_UP
 import random
 from copy import deepcopy
 
-from bilancio.core.ids import AgentId, new_id
+from bilancio.core.ids import AgentId, IdAllocator
 
 from .models import (
     Ticket, DealerState, VBTState, TraderState,
@@ -40,6 +40,8 @@ from .kernel import KernelParams, recompute_dealer_state
 from .trading import TradeExecutor
 from .events import EventLog
 from .risk_assessment import RiskAssessor, RiskAssessmentParams
+from .ticket_schedule import TicketRegistry, TicketSchedule
+from .snapshots import SnapshotLog
 from .bank_integration import (
     BankAwareTraderState,
     BankDealerRingConfig,
@@ -129,13 +131,20 @@ class BankDealerSimulation:
         self.traders: dict[AgentId, BankAwareTraderState] = {}
         self.banks: dict[str, IntegratedBankState] = {}
         self.interbank_ledger = InterbankLedger()
-        self.all_tickets: dict[TicketId, Ticket] = {}
+        self.all_tickets: TicketRegistry = TicketRegistry()
 
         # Event log
         self.events = EventLog()
 
-        # Snapshots
-        self.snapshots: list[BankDealerDaySnapshot] = []
+        # Deterministic ids for market-maker agents
+        self.ids = IdAllocator()
+
+        # Snapshots, stored as per-day deltas
+        self.snapshots = SnapshotLog(
+            BankDealerDaySnapshot,
+            ("dealers", "vbts", "traders", "banks", "tickets"),
+            self.events,
+        )
 
         # Kernel params
         self.params = KernelParams(S=config.ticket_size)
@@ -144,6 +153,8 @@ class BankDealerSimulation:
 
         # Bucket config (use defaults if not specified)
         self.buckets = list(DEFAULT_BUCKETS)
+        # Maturity-day and bucket-crossing index over all_tickets
+        self.ticket_schedule = TicketSchedule(self.all_tickets, self.buckets, self._compute_bucket)
 
         # VBT anchors (defaults)
         self.vbt_anchors = {
@@ -176,7 +187,7 @@ class BankDealerSimulation:
             # Create dealer
             dealer = DealerState(
                 bucket_id=bucket_id,
-                agent_id=new_id(f"dealer_{bucket_id}"),
+                agent_id=self.ids.next(f"dealer_{bucket_id}"),
             )
             self.dealers[bucket_id] = dealer
 
@@ -184,7 +195,7 @@ class BankDealerSimulation:
             M, O = self.vbt_anchors.get(bucket_id, (Decimal(1), Decimal("0.30")))
             vbt = VBTState(
                 bucket_id=bucket_id,
-                agent_id=new_id(f"vbt_{bucket_id}"),
+                agent_id=self.ids.next(f"vbt_{bucket_id}"),
                 M=M,
                 O=O,
                 phi_M=self.phi_M,
@@ -562,14 +573,12 @@ class BankDealerSimulation:
     # =========================================================================
 
     def _update_maturities(self) -> None:
-        """Decrement remaining_tau for all tickets."""
-        for ticket in self.all_tickets.values():
-            if ticket.remaining_tau > 0:
-                ticket.remaining_tau -= 1
+        """Count remaining_tau down by one day (a TicketSchedule clock tick)."""
+        self.ticket_schedule.advance()
 
     def _rebucket_tickets(self) -> None:
-        """Reassign bucket_id based on remaining_tau."""
-        for ticket in self.all_tickets.values():
+        """Reassign bucket_id of tickets that crossed a bucket edge today."""
+        for ticket in self.ticket_schedule.crossing():
             old_bucket = ticket.bucket_id
             new_bucket = self._compute_bucket(ticket.remaining_tau)
 
@@ -1114,12 +1123,11 @@ class BankDealerSimulation:
         # Group maturing by issuer
         maturing_by_issuer: dict[AgentId, list[Ticket]] = {}
 
-        for ticket in self.all_tickets.values():
-            if ticket.maturity_day == self.day:
-                issuer_id = ticket.issuer_id
-                if issuer_id not in maturing_by_issuer:
-                    maturing_by_issuer[issuer_id] = []
-                maturing_by_issuer[issuer_id].append(ticket)
+        for ticket in self.ticket_schedule.maturing(self.day):
+            issuer_id = ticket.issuer_id
+            if issuer_id not in maturing_by_issuer:
+                maturing_by_issuer[issuer_id] = []
+            maturing_by_issuer[issuer_id].append(ticket)
 
         # Settle each issuer
         for issuer_id, tickets in maturing_by_issuer.items():
@@ -1370,7 +1378,7 @@ class BankDealerSimulation:
     # =========================================================================
 
     def _capture_snapshot(self) -> None:
-        """Capture deep copy of current state."""
+        """Record current state in the snapshot log (kept as per-day deltas)."""
         dealers_dict = {}
         for bucket_id, dealer in self.dealers.items():
             dealers_dict[bucket_id] = {
@@ -1430,18 +1438,14 @@ class BankDealerSimulation:
                 "bucket_id": ticket.bucket_id,
             }
 
-        day_events = [e for e in self.events.events if e.get("day") == self.day]
-
-        snapshot = BankDealerDaySnapshot(
-            day=self.day,
+        self.snapshots.record(
+            self.day,
             dealers=dealers_dict,
             vbts=vbts_dict,
             traders=traders_dict,
             banks=banks_dict,
             tickets=tickets_dict,
-            events=day_events,
         )
-        self.snapshots.append(snapshot)
 
     def get_metrics(self) -> dict:
         """
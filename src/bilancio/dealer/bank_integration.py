@@ -14,6 +14,7 @@ from decimal import Decimal
 from typing import Optional
 
 from bilancio.core.ids import AgentId, new_id
+from .models import ObligationList, TicketInventory, due_schedule, ticket_inventory
 
 
 # =============================================================================
@@ -102,10 +103,10 @@ class BankAwareTraderState:
     bank_id: str  # Which bank holds this trader's deposits
 
     # Payables held (assets) - same as TraderState
-    tickets_owned: list = field(default_factory=list)
+    tickets_owned: TicketInventory = field(default_factory=TicketInventory)
 
-    # Payables issued (liabilities) - same as TraderState
-    obligations: list = field(default_factory=list)
+    # Payables issued (liabilities) - same as TraderState, indexed by due day
+    obligations: ObligationList = field(default_factory=ObligationList)
 
     # Single-issuer constraint - same as TraderState
     asset_issuer_id: AgentId | None = None
@@ -119,6 +120,11 @@ class BankAwareTraderState:
     # Default status
     defaulted: bool = False
 
+    def __post_init__(self) -> None:
+        self.tickets_owned = ticket_inventory(self.tickets_owned)
+        if not isinstance(self.obligations, ObligationList):
+            self.obligations = ObligationList(self.obligations)
+
     @property
     def deposit_balance(self) -> Decimal:
         """Total deposit balance across all cohorts."""
@@ -135,20 +141,11 @@ class BankAwareTraderState:
 
         Includes both payable maturities AND loan repayments.
         """
-        payable_due = sum(
-            t.face for t in self.obligations if t.maturity_day == day
-        )
-        loan_due = sum(
-            loan.repayment_amount for loan in self.loans
-            if loan.maturity_day == day
-        )
-        return payable_due + loan_due
+        return self.payable_due(day) + self.loan_due(day)
 
     def payable_due(self, day: int) -> Decimal:
         """Payable obligations only (excluding loans)."""
-        return sum(
-            t.face for t in self.obligations if t.maturity_day == day
-        )
+        return due_schedule(self).due_on(day)
 
     def loan_due(self, day: int) -> Decimal:
         """Loan repayments due on a given day."""
@@ -166,22 +163,33 @@ class BankAwareTraderState:
         due = self.payment_due(day)
         return max(Decimal(0), due - self.deposit_balance)
 
+    def max_payment_due(self, start_day: int, end_day: int) -> Decimal:
+        """Largest payment_due(day) over [start_day, end_day]."""
+        if not self.loans:
+            return due_schedule(self).max_due_between(start_day, end_day)
+        # Loans are few; check their days alongside the payable due days
+        days = {loan.maturity_day for loan in self.loans if start_day <= loan.maturity_day <= end_day}
+        best = due_schedule(self).max_due_between(start_day, end_day)
+        return max([best] + [self.payment_due(d) for d in days])
+
+    def max_shortfall(self, start_day: int, end_day: int) -> Decimal:
+        """Largest shortfall(day) over [start_day, end_day]."""
+        return max(Decimal(0), self.max_payment_due(start_day, end_day) - self.deposit_balance)
+
     def earliest_liability_day(self, after_day: int) -> int | None:
         """
         Find the earliest liability date after the given day.
 
         Considers both payable obligations and loan maturities.
         """
-        future_payable_days = [
-            t.maturity_day for t in self.obligations
-            if t.maturity_day > after_day
-        ]
-        future_loan_days = [
+        future_days = [
             loan.maturity_day for loan in self.loans
             if loan.maturity_day > after_day
         ]
-        all_future = future_payable_days + future_loan_days
-        return min(all_future) if all_future else None
+        next_payable_day = due_schedule(self).next_day_after(after_day)
+        if next_payable_day is not None:
+            future_days.append(next_payable_day)
+        return min(future_days) if future_days else None
 
     def add_deposit(
         self,
@@ -17,7 +17,7 @@ from typing import Dict, List, Tuple, Set, Optional
 
 from bilancio.dealer.models import Ticket, TicketId, BucketConfig, DEFAULT_BUCKETS
 from bilancio.domain.instruments.credit import Payable
-from bilancio.core.ids import new_id
+from bilancio.core.ids import IdAllocator, new_id
 
 
 def assign_bucket(remaining_tau: int, bucket_configs: List[BucketConfig]) -> str:
@@ -63,6 +63,7 @@ def payables_to_tickets(
     current_day: int,
     bucket_configs: List[BucketConfig],
     ticket_size: Decimal = Decimal(1),
+    ids: Optional[IdAllocator] = None,
 ) -> Tuple[Dict[TicketId, Ticket], Dict[str, List[str]]]:
     """
     Convert outstanding Payable contracts to tradeable Tickets.
@@ -75,6 +76,7 @@ def payables_to_tickets(
         current_day: Current simulation day
         bucket_configs: Maturity bucket configurations
         ticket_size: Face value per ticket (default: 1)
+        ids: Optional allocator for deterministic ticket IDs
 
     Returns:
         Tuple of:
@@ -86,7 +88,7 @@ def payables_to_tickets(
         ValueError: If payable has already matured (due_day <= current_day)
 
     Notes:
-        - Ticket IDs are generated using new_id() for uniqueness
+        - Ticket IDs come from ``ids`` when given, otherwise from new_id()
         - Serial numbers are assigned sequentially for deterministic tie-breaking
         - Amount is converted from minor units to major units by dividing by 100
     """
@@ -124,7 +126,7 @@ def payables_to_tickets(
         # Create tickets for this payable
         ticket_ids: List[str] = []
         for serial in range(num_tickets):
-            ticket_id = new_id()
+            ticket_id = ids.next("T") if ids is not None else new_id()
             ticket = Ticket(
                 id=ticket_id,
                 issuer_id=payable.liability_issuer_id,
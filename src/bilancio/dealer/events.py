@@ -16,6 +16,8 @@ from decimal import Decimal
 from pathlib import Path
 from typing import Any
 
+from bilancio.core.events import EventStore
+
 
 @dataclass
 class EventLog:
@@ -31,13 +33,17 @@ class EventLog:
     - VBT anchor updates
     """
 
-    events: list[dict] = field(default_factory=list)
+    events: EventStore = field(default_factory=EventStore)
 
     # Indexed structures for efficient lookup
     defaults_by_day: dict[int, list[dict]] = field(default_factory=dict)
     trades_by_day: dict[int, list[dict]] = field(default_factory=dict)
     settlements_by_day: dict[int, list[dict]] = field(default_factory=dict)
 
+    def __post_init__(self) -> None:
+        if not isinstance(self.events, EventStore):
+            self.events = EventStore(self.events)
+
     def _serialize_value(self, value: Any) -> Any:
         """
         Convert value to JSON-serializable format.
@@ -440,7 +446,7 @@ class EventLog:
         Returns:
             List of events
         """
-        return [event for event in self.events if event.get("day") == day]
+        return self.events.for_day(day)
 
     def get_all_events(self) -> list[dict]:
         """
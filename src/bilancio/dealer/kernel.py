@@ -12,17 +12,140 @@ The kernel is the mathematical heart of the dealer system, computing:
 - Midline: Inventory-sensitive mid price p(x)
 - Clipped quotes: Final bid/ask quotes b_c(x), a_c(x)
 
-All arithmetic uses Decimal for precision - never float.
+All arithmetic on dealer state uses Decimal for precision - never float.
+recompute_dealer_state is the hot path of every simulation (it runs after
+each trade, and again each day on unchanged dealers); its formulas are
+evaluated once, on locals, and can be memoized in a bounded QuoteCache
+(off unless KernelParams.cache is set).
+
+Parameter sweeps that only need quotes and capacities, not dealer state,
+can use kernel_quotes, which evaluates the same formulas in binary floats
+(K* in integer-scaled arithmetic), or recompute_dealer_state_batch, which
+evaluates them over NumPy arrays of many dealers at once. A KernelAudit
+on KernelParams cross-checks a sample of the Decimal recomputations of a
+simulation against the float kernels.
 """
 
-from dataclasses import dataclass
-from decimal import Decimal, ROUND_FLOOR
+import math
+from dataclasses import dataclass, field
+from decimal import Decimal, ROUND_FLOOR, getcontext
+from typing import TYPE_CHECKING, NamedTuple
 
 from .models import DealerState, VBTState, Ticket
 
+if TYPE_CHECKING:
+    from numpy.typing import ArrayLike
+
 # Guard threshold - when M <= M_MIN, dealer pins to outside quotes
 M_MIN = Decimal("0.02")
 
+# Float kernels compute K* = floor(V/M) on prices scaled to integers with
+# this many decimal places; exact for inputs with at most that many places
+FLOAT_PLACES = 9
+_FLOAT_SCALE = 10 ** FLOAT_PLACES
+
+# Float kernels count an interior quote within this relative distance of
+# the outside quote as reaching it (pinned), absorbing float rounding
+PIN_TOLERANCE = 1e-12
+
+# Default tolerance of the float kernels against the Decimal kernel
+AUDIT_TOLERANCE = 1e-9
+
+
+class QuoteCache:
+    """
+    Bounded memo of kernel outputs, keyed on every kernel input.
+
+    The kernel outputs depend only on (a, cash, M, O, A, B, S), the guard
+    flag and the decimal context's precision and rounding, and the key
+    holds all of them, so an entry can never go stale: a changed VBT
+    anchor, dealer balance or decimal context is simply a new key, and
+    nothing has to be invalidated when state changes.
+
+    Entries are evicted least recently used first once maxsize is reached.
+
+    Attributes:
+        maxsize: Maximum number of cached states
+        hits: Lookups answered from the cache
+        misses: Lookups that ran the kernel
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: dict[tuple, tuple] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups answered from the cache (0.0 before any lookup)."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self) -> dict[str, float]:
+        """Hit/miss counters, for run summaries."""
+        return {
+            "quote_cache_hits": self.hits,
+            "quote_cache_misses": self.misses,
+            "quote_cache_hit_rate": self.hit_rate,
+        }
+
+    def get(self, key: tuple) -> tuple | None:
+        """Cached outputs for ``key``, or None (counted as a miss)."""
+        entries = self._entries
+        outputs = entries.pop(key, None)
+        if outputs is None:
+            self.misses += 1
+            return None
+        entries[key] = outputs  # most recently used last
+        self.hits += 1
+        return outputs
+
+    def put(self, key: tuple, outputs: tuple) -> None:
+        """Store outputs for ``key``, evicting the least recently used entry if full."""
+        entries = self._entries
+        if len(entries) >= self.maxsize:
+            del entries[next(iter(entries))]
+        entries[key] = outputs
+
+    def clear(self) -> None:
+        """Drop all entries and reset the counters."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+class KernelAudit:
+    """
+    Sampled cross-check of the float kernels against the Decimal kernel.
+
+    Every ``every``-th recomputation, the Decimal kernel fields of the
+    dealer are compared with the float kernels on the same inputs (see
+    audit_dealer_state), which raises on a mismatch.
+
+    Attributes:
+        every: Check every Nth recomputation (1 = every recomputation)
+        tolerance: Relative and absolute tolerance for the float fields
+        recomputes: Recomputations seen
+        checked: Recomputations cross-checked
+    """
+
+    def __init__(self, every: int = 100, tolerance: float = AUDIT_TOLERANCE):
+        self.every = every
+        self.tolerance = tolerance
+        self.recomputes = 0
+        self.checked = 0
+
+    def observe(self, dealer: DealerState, vbt: VBTState, params: "KernelParams") -> None:
+        """Count one recomputation of ``dealer``, checking it if it is sampled."""
+        self.recomputes += 1
+        if self.recomputes % self.every == 0:
+            self.checked += 1
+            audit_dealer_state(dealer, vbt, params, self.tolerance)
+
 
 @dataclass
 class KernelParams:
@@ -31,8 +154,16 @@ class KernelParams:
 
     Attributes:
         S: Standard ticket size (face value)
+        cache: Memo of kernel outputs (None = recompute every time)
+        audit: Sampled cross-check against the float kernel (None = off)
     """
     S: Decimal = Decimal(1)
+    cache: QuoteCache | None = field(default=None, compare=False, repr=False)
+    audit: KernelAudit | None = field(default=None, compare=False, repr=False)
+
+_ZERO = Decimal(0)
+_ONE = Decimal(1)
+_M_MIN_FLOAT = float(M_MIN)
 
 
 def recompute_dealer_state(
@@ -73,95 +204,131 @@ def recompute_dealer_state(
     O = vbt.O
     A = vbt.A
     B = vbt.B
+    a = len(dealer.inventory)
+    cash = dealer.cash
+    guard = M <= M_MIN
 
-    # Step 1: Compute current inventory
-    # a = number of tickets held
-    # x = face inventory = a * S
-    dealer.a = len(dealer.inventory)
-    dealer.x = S * dealer.a
-
-    # Step 2: Guard regime check
-    # If M <= M_MIN, collapse to outside-only (no interior market)
-    if M <= M_MIN:
-        dealer.V = dealer.cash
-        dealer.K_star = 0
-        dealer.X_star = Decimal(0)
-        dealer.N = 1
-        dealer.lambda_ = Decimal(1)
-        dealer.I = O  # Not used when pinned, but set for completeness
-        dealer.midline = M
-        dealer.bid = B
-        dealer.ask = A
-        dealer.is_pinned_bid = True
-        dealer.is_pinned_ask = True
-        return
-
-    # Step 3: Normal computation (M > M_MIN)
-
-    # V = Mid-valued inventory = M * a + C
-    # This is the dealer's "equity" valued at VBT mid
-    dealer.V = M * dealer.a + dealer.cash
-
-    # K* = floor(V / M)
-    # Maximum number of tickets dealer can buy without borrowing
-    # Uses ROUND_FLOOR to ensure integer result
-    K_star_decimal = (dealer.V / M).quantize(Decimal(1), rounding=ROUND_FLOOR)
-    dealer.K_star = int(K_star_decimal)
-
-    # X* = S * K*
-    # One-sided capacity in face units (max buyable face value)
-    dealer.X_star = S * dealer.K_star
-
-    # N = K* + 1
-    # Number of ladder rungs (including zero inventory)
-    dealer.N = dealer.K_star + 1
-
-    # λ = S / (X* + S)
-    # Layoff probability (reflecting random walk boundary condition)
-    # This is the risk-neutral probability of hitting the upper capacity bound
-    if dealer.X_star + S > 0:
-        dealer.lambda_ = S / (dealer.X_star + S)
+    cache = params.cache
+    if cache is None:
+        outputs = _kernel_outputs(a, cash, M, O, A, B, S, guard)
     else:
-        # Degenerate case: zero capacity
-        dealer.lambda_ = Decimal(1)
-
-    # I = λ * O
-    # Inside width (competitive equilibrium spread)
-    # Dealer spread is compressed by layoff probability
-    dealer.I = dealer.lambda_ * O
-
-    # Step 4: Inventory-sensitive midline (Section 8.4)
-    # p(x) = M - (O / (X* + 2S)) * (x - X*/2)
-    #
-    # This formula makes the midline:
-    # - Decrease as inventory increases (dealer wants to sell)
-    # - Increase as inventory decreases (dealer wants to buy)
-    # - Centered at balanced inventory x = X*/2
-    if dealer.X_star + 2 * S > 0:
-        slope = O / (dealer.X_star + 2 * S)
-        dealer.midline = M - slope * (dealer.x - dealer.X_star / 2)
+        # Decimals are keyed by str: equal values with different exponents
+        # give results that differ in representation
+        context = getcontext()
+        key = (
+            a, str(cash), str(M), str(O), str(A), str(B), str(S), guard,
+            context.prec, context.rounding,
+        )
+        outputs = cache.get(key)
+        if outputs is None:
+            outputs = _kernel_outputs(a, cash, M, O, A, B, S, guard)
+            cache.put(key, outputs)
+
+    dealer.a = a
+    (
+        dealer.x, dealer.V, dealer.K_star, dealer.X_star, dealer.N,
+        dealer.lambda_, dealer.I, dealer.midline, dealer.bid, dealer.ask,
+        dealer.is_pinned_bid, dealer.is_pinned_ask,
+    ) = outputs
+
+    if params.audit is not None:
+        params.audit.observe(dealer, vbt, params)
+
+
+def _kernel_outputs(
+    a: int,
+    cash: Decimal,
+    M: Decimal,
+    O: Decimal,
+    A: Decimal,
+    B: Decimal,
+    S: Decimal,
+    guard: bool,
+) -> tuple:
+    """Kernel fields after "a", in the order recompute_dealer_state assigns them."""
+    # Step 1: Face inventory x = a * S
+    x = S * a
+
+    # Step 2: Guard regime - collapse to outside-only quotes
+    if guard:
+        return (x, cash, 0, _ZERO, 1, _ONE, O, M, B, A, True, True)
+
+    # Step 3: Capacity V = M*a + C, K* = floor(V/M), X* = S*K*, N = K*+1
+    V = M * a + cash
+    K_star = int((V / M).quantize(_ONE, rounding=ROUND_FLOOR))
+    X_star = S * K_star
+
+    # Step 4: Layoff probability λ = S/(X*+S) and inside width I = λ*O
+    denominator = X_star + S
+    lambda_ = S / denominator if denominator > 0 else _ONE
+    I = lambda_ * O
+
+    # Step 5: Midline p(x) = M - O/(X*+2S) * (x - X*/2)
+    denominator = X_star + 2 * S
+    if denominator > 0:
+        midline = M - O / denominator * (x - X_star / 2)
     else:
-        # Degenerate case: zero capacity
-        dealer.midline = M
+        midline = M
 
-    # Step 5: Interior quotes (Section 8.5)
-    # a(x) = p(x) + I/2  (interior ask)
-    # b(x) = p(x) - I/2  (interior bid)
-    half_inside = dealer.I / 2
-    a_interior = dealer.midline + half_inside
-    b_interior = dealer.midline - half_inside
+    # Steps 6-7: Interior quotes p(x) ± I/2, clipped to [B, A]
+    half_inside = I / 2
+    ask = min(A, midline + half_inside)
+    bid = max(B, midline - half_inside)
 
-    # Step 6: Clipped quotes
-    # a_c(x) = min(A, a(x))  (clip ask at outside ask)
-    # b_c(x) = max(B, b(x))  (clip bid at outside bid)
-    dealer.ask = min(A, a_interior)
-    dealer.bid = max(B, b_interior)
+    return (x, V, K_star, X_star, K_star + 1, lambda_, I, midline, bid, ask, bid == B, ask == A)
 
-    # Step 7: Pin detection
-    # Dealer is "pinned" when its quote equals the outside quote
-    # This signals that the dealer wants to route to VBT
-    dealer.is_pinned_ask = (dealer.ask == A)
-    dealer.is_pinned_bid = (dealer.bid == B)
+
+def audit_dealer_state(
+    dealer: DealerState,
+    vbt: VBTState,
+    params: KernelParams,
+    tolerance: float = AUDIT_TOLERANCE,
+) -> None:
+    """
+    Check the float kernels against the Decimal kernel fields of a dealer.
+
+    Evaluates kernel_quotes and recompute_dealer_state_batch on the
+    dealer's inputs and compares each with the fields
+    recompute_dealer_state set: K* and the pin flags exactly, the prices
+    within ``tolerance`` (relative and absolute).
+
+    Args:
+        dealer: DealerState as left by recompute_dealer_state
+        vbt: VBTState providing anchor prices
+        params: KernelParams with ticket size S
+        tolerance: Tolerance for the float fields
+
+    Raises:
+        AssertionError: If a float kernel disagrees with the dealer
+    """
+    inputs = (
+        dealer.a, float(dealer.cash), float(vbt.M), float(vbt.O),
+        float(vbt.A), float(vbt.B), float(params.S),
+    )
+    _check_quotes(dealer, kernel_quotes(*inputs), tolerance, "kernel_quotes")
+
+    a, cash, M, O, A, B, S = ([value] for value in inputs)
+    batch = recompute_dealer_state_batch(a, cash, M, O, S, A=A, B=B)
+    _check_quotes(dealer, KernelQuotes(*(field[0] for field in batch)), tolerance, "batch kernel")
+
+
+def _check_quotes(
+    dealer: DealerState,
+    quotes: "KernelQuotes",
+    tolerance: float,
+    source: str,
+) -> None:
+    for name, got in zip(quotes._fields, quotes, strict=True):
+        expected = getattr(dealer, name)
+        if isinstance(expected, Decimal):
+            ok = math.isclose(got, expected, rel_tol=tolerance, abs_tol=tolerance)
+        else:
+            ok = got == expected
+        if not ok:
+            raise AssertionError(
+                f"Kernel audit failed for dealer {dealer.bucket_id}: "
+                f"{source} {name}={got}, Decimal kernel {expected}"
+            )
 
 
 def can_interior_buy(dealer: DealerState, params: KernelParams) -> bool:
@@ -232,3 +399,156 @@ class ExecutionResult:
     price: Decimal
     is_passthrough: bool
     ticket: Ticket | None = None
+
+
+class KernelQuotes(NamedTuple):
+    """
+    Kernel outputs in floats: scalars from kernel_quotes, arrays from
+    recompute_dealer_state_batch.
+    """
+    K_star: int
+    X_star: float
+    lambda_: float
+    I: float
+    midline: float
+    bid: float
+    ask: float
+    is_pinned_bid: bool
+    is_pinned_ask: bool
+
+
+def kernel_quotes(
+    a: int,
+    cash: float,
+    M: float,
+    O: float,
+    A: float,
+    B: float,
+    S: float = 1.0,
+) -> KernelQuotes:
+    """
+    Evaluate the L1 kernel in binary floats, without dealer state.
+
+    For parameter sweeps over (a, cash, M, O, S). K* = floor(V/M) is
+    computed on cash and M scaled to integers (FLOAT_PLACES decimal
+    places), so it equals the Decimal kernel's K* whenever the inputs have
+    at most that many places, including when V/M is an exact integer.
+    The prices then agree with recompute_dealer_state to float rounding.
+    An interior quote within PIN_TOLERANCE of the outside quote is pinned
+    to it; the pin flags differ from the Decimal kernel only when the
+    exact interior quote falls short of the outside one by less than that.
+    Simulations keep using the Decimal kernel.
+
+    Args:
+        a: Number of tickets held
+        cash: Dealer cash
+        M: VBT mid price
+        O: VBT outside spread
+        A: VBT outside ask
+        B: VBT outside bid
+        S: Standard ticket size (face value)
+
+    Returns:
+        KernelQuotes with capacity, layoff probability, width and quotes
+    """
+    if M <= _M_MIN_FLOAT:
+        return KernelQuotes(0, 0.0, 1.0, O, M, B, A, True, True)
+
+    M_scaled = round(M * _FLOAT_SCALE)
+    K_star = (M_scaled * a + round(cash * _FLOAT_SCALE)) // M_scaled
+    X_star = S * K_star
+    lambda_ = S / (X_star + S) if X_star + S > 0 else 1.0
+    I = lambda_ * O
+    if X_star + 2 * S > 0:
+        midline = M - O / (X_star + 2 * S) * (S * a - X_star / 2)
+    else:
+        midline = M
+    ask = midline + I / 2
+    bid = midline - I / 2
+    is_pinned_ask = ask >= A - PIN_TOLERANCE * max(1.0, abs(A))
+    is_pinned_bid = bid <= B + PIN_TOLERANCE * max(1.0, abs(B))
+    if is_pinned_ask:
+        ask = A
+    if is_pinned_bid:
+        bid = B
+    return KernelQuotes(K_star, X_star, lambda_, I, midline, bid, ask, is_pinned_bid, is_pinned_ask)
+
+
+def recompute_dealer_state_batch(
+    a: "ArrayLike",
+    cash: "ArrayLike",
+    M: "ArrayLike",
+    O: "ArrayLike",
+    S: "ArrayLike" = 1.0,
+    *,
+    A: "ArrayLike | None" = None,
+    B: "ArrayLike | None" = None,
+    O_min: float = 0.0,
+    clip_nonneg_B: bool = True,
+) -> KernelQuotes:
+    """
+    Evaluate the L1 kernel for many dealers at once, in NumPy floats.
+
+    Each element is one dealer: inputs are broadcast against each other,
+    so a scalar S (or M, O) applies to every dealer. Given the outside
+    quotes A and B, results equal those of kernel_quotes element by
+    element. Without them, A and B are derived from M and O in floats, as
+    VBTState.recompute_quotes does; they may then differ from a VBT's
+    Decimal quotes in the last bit, which PIN_TOLERANCE absorbs for the
+    pin flags.
+
+    K* is computed as in kernel_quotes, in int64 on cash and M scaled by
+    10**FLOAT_PLACES, so M*a + cash must stay below about 9e9.
+
+    NumPy is imported on first call, so importing the dealer package does
+    not load it.
+
+    Args:
+        a: Number of tickets held
+        cash: Dealer cash
+        M: VBT mid price
+        O: VBT outside spread
+        S: Standard ticket size (face value)
+        A: VBT outside ask (derived from M, O if omitted)
+        B: VBT outside bid (derived from M, O if omitted)
+        O_min: Minimum outside spread, when deriving A and B
+        clip_nonneg_B: Clip the derived outside bid at 0
+
+    Returns:
+        KernelQuotes of arrays (K_star as int64, pins as bool)
+    """
+    import numpy as np
+
+    M = np.asarray(M, dtype=float)
+    O = np.asarray(O, dtype=float)
+    if A is None or B is None:
+        half_spread = np.maximum(O, O_min) / 2
+        A = M + half_spread
+        B = M - half_spread
+        if clip_nonneg_B:
+            B = np.maximum(B, 0.0)
+    a, cash, M, O, S, A, B = np.broadcast_arrays(
+        np.asarray(a, dtype=np.int64),
+        *(np.asarray(v, dtype=float) for v in (cash, M, O, S, A, B)),
+    )
+
+    guard = M <= _M_MIN_FLOAT
+    M_scaled = np.where(guard, 1, np.rint(M * _FLOAT_SCALE).astype(np.int64))
+    V_scaled = M_scaled * a + np.rint(cash * _FLOAT_SCALE).astype(np.int64)
+    K_star = np.where(guard, 0, V_scaled // M_scaled)
+    X_star = S * K_star
+    with np.errstate(divide="ignore", invalid="ignore"):
+        lambda_ = np.where(guard | (X_star + S <= 0), 1.0, S / (X_star + S))
+        I = np.where(guard, O, lambda_ * O)
+        midline = np.where(
+            guard | (X_star + 2 * S <= 0),
+            M,
+            M - O / (X_star + 2 * S) * (S * a - X_star / 2),
+        )
+    ask = midline + I / 2
+    bid = midline - I / 2
+    is_pinned_ask = guard | (ask >= A - PIN_TOLERANCE * np.maximum(1.0, np.abs(A)))
+    is_pinned_bid = guard | (bid <= B + PIN_TOLERANCE * np.maximum(1.0, np.abs(B)))
+    ask = np.where(is_pinned_ask, A, ask)
+    bid = np.where(is_pinned_bid, B, bid)
+    return KernelQuotes(K_star, X_star, lambda_, I, midline, bid, ask, is_pinned_bid, is_pinned_ask)
@@ -19,10 +19,13 @@ References:
 
 from dataclasses import dataclass, field
 from decimal import Decimal
-from typing import Dict, List, Optional, Any
+from typing import TYPE_CHECKING, Dict, List, Optional, Any
 import json
 from pathlib import Path
 
+if TYPE_CHECKING:
+    from .kernel import QuoteCache
+
 
 @dataclass
 class TradeRecord:
@@ -544,6 +547,9 @@ class RunMetrics:
     run_id: str = ""
     regime: str = ""
 
+    # Kernel quote cache of the run, if enabled (its counters go in the summary)
+    quote_cache: Optional["QuoteCache"] = field(default=None, repr=False)
+
     @property
     def debt_to_money_ratio(self) -> Decimal:
         """
@@ -914,6 +920,9 @@ class RunMetrics:
             "vbt_mid_final": self._final_vbt_mids(),
             "dealer_premium_final_pct": self._final_dealer_premiums(),
             "vbt_premium_final_pct": self._final_vbt_premiums(),
+
+            # Kernel quote cache counters (only when the cache is enabled)
+            **(self.quote_cache.stats() if self.quote_cache is not None else {}),
         }
 
     # =========================================================================
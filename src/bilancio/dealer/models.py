@@ -4,13 +4,18 @@ Data models for the dealer ring simulation.
 This module defines the core data structures used in the dealer ring model:
 - Tickets: Tradable debt instruments with face value and maturity
 - Buckets: Maturity-based groupings of tickets
+- TicketInventory: Insertion-ordered, id-keyed set of held tickets
 - DealerState: Per-bucket dealer market-making state
 - VBTState: Per-bucket value-based trader state
+- DueSchedule / ObligationList: Per-day index of a trader's obligations
 - TraderState: Ring trader state with single-issuer constraint
 """
 
-from dataclasses import dataclass, field
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import MutableSequence
+from dataclasses import InitVar, dataclass, field
 from decimal import Decimal
+from itertools import islice
 
 from bilancio.core.ids import AgentId
 
@@ -45,7 +50,16 @@ DEFAULT_BUCKETS = [
 ]
 
 
-@dataclass
+class TauClock:
+    """Number of maturity updates a TicketSchedule has applied."""
+
+    __slots__ = ("now",)
+
+    def __init__(self) -> None:
+        self.now = 0
+
+
+@dataclass(slots=True)
 class Ticket:
     """
     A tradable debt instrument (ticket).
@@ -59,18 +73,190 @@ class Ticket:
         owner_id: Current holder of the ticket (the creditor)
         face: Face value S (typically 1)
         maturity_day: Absolute day when ticket matures
-        remaining_tau: Remaining days to maturity (updated each day)
+        remaining_tau: Remaining days to maturity (counts down each day)
         bucket_id: Maturity bucket assignment ("short" | "mid" | "long")
         serial: Serial number for deterministic tie-breaking
+
+    While a TicketSchedule runs the ticket, remaining_tau is not stored but
+    derived from the schedule's TauClock: it is the update at which the
+    countdown reaches 0 minus the updates so far (never below 0), so the
+    daily maturity update touches no ticket. Assigning remaining_tau moves
+    that update. It is not derived as maturity_day - day: the two are set
+    independently when tickets are created and need not agree.
     """
     id: TicketId
     issuer_id: AgentId
     owner_id: AgentId
     face: Decimal
     maturity_day: int
-    remaining_tau: int = 0
+    remaining_tau: InitVar[int] = 0
     bucket_id: str = ""
     serial: int = 0
+    # remaining_tau while no clock drives it
+    _tau: int = field(default=0, init=False, repr=False, compare=False)
+    # Clock of the schedule deriving remaining_tau, and the clock reading at
+    # which it reaches 0 (see TicketSchedule)
+    _clock: TauClock | None = field(default=None, init=False, repr=False, compare=False)
+    _expiry: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __post_init__(self, remaining_tau: int) -> None:
+        # The property below shadows the InitVar default in the class body
+        self._tau = 0 if isinstance(remaining_tau, property) else remaining_tau
+
+    @property
+    def remaining_tau(self) -> int:
+        clock = self._clock
+        if clock is None:
+            return self._tau
+        return max(0, self._expiry - clock.now)
+
+    @remaining_tau.setter
+    def remaining_tau(self, value: int) -> None:
+        clock = self._clock
+        if clock is None:
+            self._tau = value
+        else:
+            self._expiry = clock.now + value
+
+
+class TicketInventory(MutableSequence):
+    """
+    Insertion-ordered set of tickets, keyed by ticket id.
+
+    Used for dealer and VBT inventories and trader holdings. Membership
+    tests and removal are dict lookups rather than list scans, and
+    iteration follows the order tickets were added, as a list would, so
+    seeded runs stay reproducible. Positional access and edits that change
+    the order (insert, sort, item assignment) are supported but O(n).
+
+    As in a set, a ticket is held at most once: appending a ticket whose
+    id is already held leaves the inventory unchanged. Objects without an ``id`` (test doubles) are
+    keyed by identity.
+    """
+
+    __slots__ = ("_tickets",)
+
+    @staticmethod
+    def _key(ticket):
+        key = getattr(ticket, "id", None)
+        return id(ticket) if key is None else key
+
+    def __init__(self, iterable=()):
+        self._tickets: dict = {}
+        for ticket in iterable:
+            self.append(ticket)
+
+    def __reduce_ex__(self, protocol):
+        return (self.__class__, (list(self),))
+
+    def _replace(self, tickets) -> None:
+        """Reset the contents to ``tickets``, in that order."""
+        self._tickets = {}
+        for ticket in tickets:
+            self.append(ticket)
+
+    def _pop_id(self, key) -> Ticket:
+        return self._tickets.pop(key)
+
+    def get(self, ticket_id: TicketId) -> Ticket | None:
+        """The held ticket with id ``ticket_id``, or None."""
+        return self._tickets.get(ticket_id)
+
+    def __len__(self) -> int:
+        return len(self._tickets)
+
+    def __iter__(self):
+        return iter(self._tickets.values())
+
+    def __reversed__(self):
+        return reversed(self._tickets.values())
+
+    def __contains__(self, ticket) -> bool:
+        held = self._tickets.get(self._key(ticket))
+        return held is not None and (held is ticket or held == ticket)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self)[index]
+        n = len(self._tickets)
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError("inventory index out of range")
+        if index == n - 1:
+            return next(reversed(self._tickets.values()))
+        return next(islice(self._tickets.values(), index, None))
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (TicketInventory, list)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self)!r})"
+
+    def append(self, ticket: Ticket) -> None:
+        self._tickets.setdefault(self._key(ticket), ticket)
+
+    def extend(self, tickets) -> None:
+        for ticket in list(tickets):
+            self.append(ticket)
+
+    def remove(self, ticket: Ticket) -> None:
+        if ticket not in self:
+            raise ValueError(f"Ticket {self._key(ticket)} is not held")
+        self._pop_id(self._key(ticket))
+
+    def discard(self, ticket: Ticket) -> None:
+        """Remove ``ticket`` if it is held."""
+        if ticket in self:
+            self._pop_id(self._key(ticket))
+
+    def pop(self, index: int = -1) -> Ticket:
+        if not self._tickets:
+            raise IndexError("pop from empty inventory")
+        return self._pop_id(self._key(self[index]))
+
+    def clear(self) -> None:
+        self._replace(())
+
+    def index(self, ticket, start: int = 0, stop: int | None = None) -> int:
+        return list(self).index(ticket, start, len(self) if stop is None else stop)
+
+    def count(self, ticket) -> int:
+        return 1 if ticket in self else 0
+
+    def copy(self) -> "TicketInventory":
+        return self.__class__(self)
+
+    # Order-changing edits: rebuild (rare)
+    def insert(self, index: int, ticket: Ticket) -> None:
+        tickets = list(self)
+        tickets.insert(index, ticket)
+        self._replace(tickets)
+
+    def __setitem__(self, index, value) -> None:
+        tickets = list(self)
+        tickets[index] = value
+        self._replace(tickets)
+
+    def __delitem__(self, index) -> None:
+        tickets = list(self)
+        del tickets[index]
+        self._replace(tickets)
+
+    def sort(self, *, key=None, reverse: bool = False) -> None:
+        self._replace(sorted(self, key=key, reverse=reverse))
+
+    def reverse(self) -> None:
+        self._replace(list(reversed(self)))
+
+
+def ticket_inventory(tickets) -> TicketInventory:
+    """``tickets`` as a TicketInventory (returned as is if it already is one)."""
+    return tickets if isinstance(tickets, TicketInventory) else TicketInventory(tickets)
 
 
 @dataclass
@@ -85,7 +271,7 @@ class DealerState:
     Attributes:
         bucket_id: Maturity bucket identifier
         agent_id: Dealer's agent ID
-        inventory: List of tickets currently held
+        inventory: Tickets currently held (see TicketInventory)
         cash: Cash holdings
 
     Derived quantities (recomputed after each trade):
@@ -109,7 +295,7 @@ class DealerState:
     """
     bucket_id: str
     agent_id: AgentId = ""
-    inventory: list[Ticket] = field(default_factory=list)
+    inventory: TicketInventory = field(default_factory=TicketInventory)
     cash: Decimal = Decimal(0)
 
     # Derived quantities
@@ -131,6 +317,9 @@ class DealerState:
     is_pinned_bid: bool = False
     is_pinned_ask: bool = False
 
+    def __post_init__(self) -> None:
+        self.inventory = ticket_inventory(self.inventory)
+
     def ticket_ids_by_issuer(self) -> dict[AgentId, list[TicketId]]:
         """
         Group inventory tickets by issuer.
@@ -175,7 +364,7 @@ class VBTState:
         clip_nonneg_B: Clip bid to be non-negative (default True)
 
     Balance sheet:
-        inventory: List of tickets held
+        inventory: Tickets held (see TicketInventory)
         cash: Cash holdings
     """
     bucket_id: str
@@ -198,9 +387,12 @@ class VBTState:
     clip_nonneg_B: bool = True
 
     # Balance sheet
-    inventory: list[Ticket] = field(default_factory=list)
+    inventory: TicketInventory = field(default_factory=TicketInventory)
     cash: Decimal = Decimal(0)
 
+    def __post_init__(self) -> None:
+        self.inventory = ticket_inventory(self.inventory)
+
     def recompute_quotes(self) -> None:
         """
         Update A and B from M and O with optional clipping.
@@ -248,6 +440,113 @@ class VBTState:
         self.recompute_quotes()
 
 
+class DueSchedule:
+    """
+    Face value due per maturity day for a set of obligations.
+
+    Due days are kept sorted, so the next liability day and the due days
+    in a window are found by bisection instead of scanning every
+    obligation.
+    Per-day totals are summed in the order obligations were added, as a
+    scan of the obligation list would.
+    """
+
+    __slots__ = ("_tickets", "_due", "_days")
+
+    def __init__(self) -> None:
+        self._tickets: dict[int, list] = {}   # day -> obligations due that day
+        self._due: dict[int, Decimal] = {}    # day -> total face due that day
+        self._days: list[int] = []            # sorted due days
+
+    def add(self, ticket) -> None:
+        day = ticket.maturity_day
+        tickets = self._tickets.get(day)
+        if tickets is None:
+            self._tickets[day] = [ticket]
+            self._due[day] = 0 + ticket.face
+            insort(self._days, day)
+        else:
+            tickets.append(ticket)
+            self._due[day] += ticket.face
+
+    def discard(self, ticket) -> None:
+        day = ticket.maturity_day
+        tickets = self._tickets.get(day, [])
+        for i, t in enumerate(tickets):
+            if t is ticket:
+                del tickets[i]
+                break
+        else:
+            return
+        if tickets:
+            self._due[day] = sum(t.face for t in tickets)
+        else:
+            del self._tickets[day]
+            del self._due[day]
+            del self._days[bisect_left(self._days, day)]
+
+    def due_on(self, day: int) -> Decimal:
+        """Total face value due on ``day``."""
+        return self._due.get(day, 0)
+
+    def next_day_after(self, day: int) -> int | None:
+        """Earliest due day strictly after ``day``, or None."""
+        i = bisect_right(self._days, day)
+        return self._days[i] if i < len(self._days) else None
+
+    def max_due_between(self, start_day: int, end_day: int) -> Decimal:
+        """Largest amount due on any single day in [start_day, end_day]."""
+        lo = bisect_left(self._days, start_day)
+        hi = bisect_right(self._days, end_day)
+        due = self._due
+        return max((due[d] for d in self._days[lo:hi]), default=Decimal(0))
+
+
+class ObligationList(TicketInventory):
+    """
+    TicketInventory of a trader's issued tickets that keeps a DueSchedule
+    in step.
+
+    Every mutation also updates ``schedule``.
+    """
+
+    __slots__ = ("schedule",)
+
+    def __init__(self, iterable=()):
+        self.schedule = DueSchedule()
+        super().__init__(iterable)
+
+    def _replace(self, tickets) -> None:
+        self.schedule = DueSchedule()
+        super()._replace(tickets)
+
+    def _pop_id(self, key) -> Ticket:
+        ticket = super()._pop_id(key)
+        self.schedule.discard(ticket)
+        return ticket
+
+    def append(self, ticket) -> None:
+        if self._key(ticket) not in self._tickets:
+            super().append(ticket)
+            self.schedule.add(ticket)
+
+
+def due_schedule(holder) -> DueSchedule:
+    """
+    The DueSchedule of ``holder.obligations``.
+
+    Obligations assigned as a plain list after construction are not kept
+    in step; a schedule is built from them for this call.
+    """
+    obligations = holder.obligations
+    if isinstance(obligations, ObligationList):
+        return obligations.schedule
+    schedule = DueSchedule()
+    for ticket in obligations:
+        schedule.add(ticket)
+    return schedule
+
+
 @dataclass
 class TraderState:
     """
@@ -259,18 +558,24 @@ class TraderState:
     Attributes:
         agent_id: Trader's agent ID
         cash: Cash holdings
-        tickets_owned: List of tickets owned (assets)
-        obligations: List of tickets this agent issued (liabilities)
+        tickets_owned: Tickets owned (assets, see TicketInventory)
+        obligations: Tickets this agent issued (liabilities), indexed by
+            maturity day (see ObligationList)
         asset_issuer_id: Issuer of currently held tickets (single-issuer constraint)
         defaulted: True if agent has defaulted
     """
     agent_id: AgentId
     cash: Decimal = Decimal(0)
-    tickets_owned: list[Ticket] = field(default_factory=list)
-    obligations: list[Ticket] = field(default_factory=list)
+    tickets_owned: TicketInventory = field(default_factory=TicketInventory)
+    obligations: ObligationList = field(default_factory=ObligationList)
     asset_issuer_id: AgentId | None = None
     defaulted: bool = False
 
+    def __post_init__(self) -> None:
+        self.tickets_owned = ticket_inventory(self.tickets_owned)
+        if not isinstance(self.obligations, ObligationList):
+            self.obligations = ObligationList(self.obligations)
+
     def payment_due(self, day: int) -> Decimal:
         """
         Calculate total payment obligations due on a given day.
@@ -281,11 +586,7 @@ class TraderState:
         Returns:
             Total face value of tickets maturing on this day
         """
-        return sum(
-            ticket.face
-            for ticket in self.obligations
-            if ticket.maturity_day == day
-        )
+        return due_schedule(self).due_on(day)
 
     def shortfall(self, day: int) -> Decimal:
         """
@@ -300,6 +601,14 @@ class TraderState:
         due = self.payment_due(day)
         return max(Decimal(0), due - self.cash)
 
+    def max_payment_due(self, start_day: int, end_day: int) -> Decimal:
+        """Largest payment due on any single day in [start_day, end_day]."""
+        return due_schedule(self).max_due_between(start_day, end_day)
+
+    def max_shortfall(self, start_day: int, end_day: int) -> Decimal:
+        """Largest shortfall(day) over [start_day, end_day]."""
+        return max(Decimal(0), self.max_payment_due(start_day, end_day) - self.cash)
+
     def earliest_liability_day(self, after_day: int) -> int | None:
         """
         Find the earliest liability date after the given day.
@@ -310,9 +619,4 @@ class TraderState:
         Returns:
             Earliest maturity day > after_day, or None if no future liabilities
         """
-        future_days = [
-            ticket.maturity_day
-            for ticket in self.obligations
-            if ticket.maturity_day > after_day
-        ]
-        return min(future_days) if future_days else None
+        return due_schedule(self).next_day_after(after_day)
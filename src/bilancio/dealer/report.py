@@ -3,7 +3,7 @@
 from dataclasses import dataclass
 from decimal import Decimal
 from pathlib import Path
-from typing import Any, TYPE_CHECKING
+from typing import Any, Collection, Sequence, TYPE_CHECKING
 import html
 
 if TYPE_CHECKING:
@@ -141,7 +141,7 @@ def _fmt_decimal(d: Decimal | float | int | str | None, precision: int = 4) -> s
     return formatted
 
 
-def _render_header(config: "DealerRingConfig", snapshots: list, title: str, subtitle: str) -> str:
+def _render_header(config: "DealerRingConfig", snapshots: Sequence, title: str, subtitle: str) -> str:
     """Render header with config summary."""
     num_days = len(snapshots) - 1 if snapshots else 0  # -1 because Day 0 is setup
     num_buckets = len(config.buckets)
@@ -554,18 +554,21 @@ def _render_day_section(snapshot: "DaySnapshot", is_setup: bool = False) -> str:
 
 
 def generate_dealer_ring_html(
-    snapshots: list["DaySnapshot"],
+    snapshots: Sequence["DaySnapshot"],
     config: "DealerRingConfig",
     title: str | None = None,
     subtitle: str | None = None,
+    days: Collection[int] | None = None,
 ) -> str:
     """Generate complete HTML report for dealer ring simulation.
 
     Args:
-        snapshots: List of DaySnapshot objects, one per day (Day 0 = setup)
+        snapshots: DaySnapshot objects, one per day (Day 0 = setup); a
+            list or a simulation's SnapshotLog
         config: DealerRingConfig with simulation parameters
         title: Report title (default: "Dealer Ring Simulation")
         subtitle: Report subtitle (default: simulation description)
+        days: Only render these days (default: all)
 
     Returns:
         Complete HTML document as string
@@ -582,6 +585,8 @@ def generate_dealer_ring_html(
     # Render each day
     day_sections = []
     for i, snapshot in enumerate(snapshots):
+        if days is not None and snapshot.day not in days:
+            continue
         is_setup = (i == 0 and snapshot.day == 0)
         day_sections.append(_render_day_section(snapshot, is_setup=is_setup))
 
@@ -614,22 +619,24 @@ def generate_dealer_ring_html(
 
 
 def export_dealer_ring_html(
-    snapshots: list["DaySnapshot"],
+    snapshots: Sequence["DaySnapshot"],
     config: "DealerRingConfig",
     path: str | Path,
     title: str | None = None,
     subtitle: str | None = None,
+    days: Collection[int] | None = None,
 ) -> None:
     """Export dealer ring simulation to HTML file.
 
     Args:
-        snapshots: List of DaySnapshot objects, one per day
+        snapshots: DaySnapshot objects, one per day (list or SnapshotLog)
         config: DealerRingConfig with simulation parameters
         path: Output file path
         title: Report title
         subtitle: Report subtitle
+        days: Only render these days (default: all)
     """
-    html_content = generate_dealer_ring_html(snapshots, config, title, subtitle)
+    html_content = generate_dealer_ring_html(snapshots, config, title, subtitle, days)
     path = Path(path)
     path.parent.mkdir(parents=True, exist_ok=True)
     path.write_text(html_content, encoding="utf-8")
@@ -28,16 +28,18 @@ from copy import deepcopy
 # Uses 6 decimal places which is standard for financial calculations
 CASH_PRECISION = Decimal("0.000001")
 
-from bilancio.core.ids import AgentId, new_id
+from bilancio.core.ids import AgentId, IdAllocator
 from .models import (
     Ticket, DealerState, VBTState, TraderState,
     BucketConfig, DEFAULT_BUCKETS, TicketId,
 )
-from .kernel import KernelParams, recompute_dealer_state
+from .kernel import KernelAudit, KernelParams, QuoteCache, recompute_dealer_state
 from .trading import TradeExecutor
 from .events import EventLog
 from .assertions import run_all_assertions, assert_c6_anchor_timing
 from .risk_assessment import RiskAssessor, RiskAssessmentParams
+from .ticket_schedule import TicketRegistry, TicketSchedule
+from .snapshots import SnapshotLog, ticket_list
 
 
 @dataclass
@@ -45,7 +47,8 @@ class DaySnapshot:
     """
     Snapshot of simulation state at end of day.
 
-    Captures deep copies of all mutable state for reporting.
+    Captures copies of all mutable state for reporting. Simulations store
+    them in a SnapshotLog, which rebuilds them on access.
 
     Attributes:
         day: Day number (0 for initial setup, 1+ for each run_day)
@@ -63,6 +66,17 @@ class DaySnapshot:
     events: list[dict]         # Events for this day only
 
 
+# Ticket lists nested in DaySnapshot entities, with the fields of each entry
+SNAPSHOT_TICKET_LISTS = {
+    "dealers": {"inventory": ("id", "issuer_id", "face", "remaining_tau")},
+    "vbts": {"inventory": ("id", "issuer_id", "face", "remaining_tau")},
+    "traders": {
+        "tickets_owned": ("id", "issuer_id", "face", "remaining_tau", "bucket_id"),
+        "obligations": ("id", "owner_id", "face", "maturity_day"),
+    },
+}
+
+
 @dataclass
 class DealerRingConfig:
     """
@@ -85,6 +99,9 @@ class DealerRingConfig:
         seed: Random seed for reproducibility
         max_days: Default simulation duration
         enable_vbt_anchor_updates: Whether to update VBT anchors based on losses
+        quote_cache_size: Entries of the kernel QuoteCache (0 = no cache)
+        kernel_audit_every: Check every Nth kernel recomputation against
+            the float kernels with a KernelAudit (0 = no audit)
 
     References:
         - Section 8: Kernel parameters (ticket_size, M_min)
@@ -135,6 +152,11 @@ class DealerRingConfig:
     max_days: int = 30
     enable_vbt_anchor_updates: bool = True
 
+    # Kernel memoization (0 = recompute every time)
+    quote_cache_size: int = 0
+    # Sampled float-kernel cross-check (0 = off)
+    kernel_audit_every: int = 0
+
 
 class DealerRingSimulation:
     """
@@ -162,6 +184,7 @@ class DealerRingSimulation:
         vbts: Per-bucket VBT states
         traders: Ring trader states
         all_tickets: Global ticket registry by ID
+        ticket_schedule: Maturity-day and bucket-crossing index over all_tickets
         events: Event log for observability
         params: Kernel parameters
         executor: Trade executor
@@ -187,16 +210,30 @@ class DealerRingSimulation:
         self.dealers: dict[str, DealerState] = {}  # bucket -> dealer
         self.vbts: dict[str, VBTState] = {}        # bucket -> VBT
         self.traders: dict[AgentId, TraderState] = {}
-        self.all_tickets: dict[TicketId, Ticket] = {}  # Global ticket registry
+        self.all_tickets: TicketRegistry = TicketRegistry()  # Global ticket registry
+        # Maturity-day and bucket-crossing index over all_tickets
+        self.ticket_schedule = TicketSchedule(self.all_tickets, config.buckets, self._compute_bucket)
 
         # Event log
         self.events = EventLog()
 
-        # Snapshots for reporting
-        self.snapshots: list[DaySnapshot] = []
+        # Deterministic ids for market-maker agents
+        self.ids = IdAllocator()
+
+        # Snapshots for reporting, stored as per-day deltas
+        self.snapshots = SnapshotLog(
+            DaySnapshot,
+            ("dealers", "vbts", "traders", "tickets"),
+            self.events,
+            ticket_lists=SNAPSHOT_TICKET_LISTS,
+        )
 
         # Kernel params
-        self.params = KernelParams(S=config.ticket_size)
+        self.params = KernelParams(
+            S=config.ticket_size,
+            cache=QuoteCache(config.quote_cache_size) if config.quote_cache_size else None,
+            audit=KernelAudit(config.kernel_audit_every) if config.kernel_audit_every else None,
+        )
         self.executor = TradeExecutor(self.params, self.rng)
         self.risk_assessor = risk_assessor
 
@@ -219,7 +256,7 @@ class DealerRingSimulation:
             # Create dealer
             dealer = DealerState(
                 bucket_id=bucket_id,
-                agent_id=new_id(f"dealer_{bucket_id}"),
+                agent_id=self.ids.next(f"dealer_{bucket_id}"),
             )
             self.dealers[bucket_id] = dealer
 
@@ -227,7 +264,7 @@ class DealerRingSimulation:
             M, O = self.config.vbt_anchors.get(bucket_id, (Decimal(1), Decimal("0.30")))
             vbt = VBTState(
                 bucket_id=bucket_id,
-                agent_id=new_id(f"vbt_{bucket_id}"),
+                agent_id=self.ids.next(f"vbt_{bucket_id}"),
                 M=M,
                 O=O,
                 phi_M=self.config.phi_M,
@@ -238,12 +275,16 @@ class DealerRingSimulation:
             vbt.recompute_quotes()
             self.vbts[bucket_id] = vbt
 
+    def _ticket_list(self, tickets, section: str, field: str):
+        return ticket_list(tickets, self.all_tickets, SNAPSHOT_TICKET_LISTS[section][field])
+
     def _capture_snapshot(self) -> None:
         """
-        Capture deep copy of current state for reporting.
+        Capture current state for reporting.
 
-        Creates serializable dicts from all state objects.
-        Called at end of setup and after each day.
+        Creates serializable dicts from all state objects and records them
+        in the snapshot log, which keeps only what changed since the
+        previous day. Called at end of setup and after each day.
         """
         # Serialize dealer states
         dealers_dict = {}
@@ -265,10 +306,7 @@ class DealerRingSimulation:
                 "ask": dealer.ask,
                 "is_pinned_bid": dealer.is_pinned_bid,
                 "is_pinned_ask": dealer.is_pinned_ask,
-                "inventory": [
-                    {"id": t.id, "issuer_id": t.issuer_id, "face": t.face, "remaining_tau": t.remaining_tau}
-                    for t in dealer.inventory
-                ],
+                "inventory": self._ticket_list(dealer.inventory, "dealers", "inventory"),
             }
 
         # Serialize VBT states
@@ -282,10 +320,7 @@ class DealerRingSimulation:
                 "A": vbt.A,
                 "B": vbt.B,
                 "cash": vbt.cash,
-                "inventory": [
-                    {"id": t.id, "issuer_id": t.issuer_id, "face": t.face, "remaining_tau": t.remaining_tau}
-                    for t in vbt.inventory
-                ],
+                "inventory": self._ticket_list(vbt.inventory, "vbts", "inventory"),
             }
 
         # Serialize trader states
@@ -296,14 +331,8 @@ class DealerRingSimulation:
                 "cash": trader.cash,
                 "defaulted": trader.defaulted,
                 "asset_issuer_id": trader.asset_issuer_id,
-                "tickets_owned": [
-                    {"id": t.id, "issuer_id": t.issuer_id, "face": t.face, "remaining_tau": t.remaining_tau, "bucket_id": t.bucket_id}
-                    for t in trader.tickets_owned
-                ],
-                "obligations": [
-                    {"id": t.id, "owner_id": t.owner_id, "face": t.face, "maturity_day": t.maturity_day}
-                    for t in trader.obligations
-                ],
+                "tickets_owned": self._ticket_list(trader.tickets_owned, "traders", "tickets_owned"),
+                "obligations": self._ticket_list(trader.obligations, "traders", "obligations"),
             }
 
         # Serialize all tickets
@@ -319,18 +348,13 @@ class DealerRingSimulation:
                 "bucket_id": ticket.bucket_id,
             }
 
-        # Get events for this day only
-        day_events = [e for e in self.events.events if e.get("day") == self.day]
-
-        snapshot = DaySnapshot(
-            day=self.day,
+        self.snapshots.record(
+            self.day,
             dealers=dealers_dict,
             vbts=vbts_dict,
             traders=traders_dict,
             tickets=tickets_dict,
-            events=day_events,
         )
-        self.snapshots.append(snapshot)
 
     def setup_ring(
         self,
@@ -503,19 +527,22 @@ class DealerRingSimulation:
         Decrement remaining_tau for all tickets.
 
         This reflects the passage of one day. Tickets with remaining_tau
-        reaching 0 will mature during settlement (Phase 5).
+        reaching 0 will mature during settlement (Phase 5). remaining_tau
+        is derived from the schedule's clock, so this is one clock tick
+        (see TicketSchedule).
 
         References:
             - Section 11.1: Maturity updates
         """
-        for ticket in self.all_tickets.values():
-            if ticket.remaining_tau > 0:
-                ticket.remaining_tau -= 1
+        self.ticket_schedule.advance()
 
     def _rebucket_tickets(self) -> None:
         """
         Reassign bucket_id based on remaining_tau.
 
+        Only tickets whose remaining_tau crossed a bucket edge in today's
+        maturity update are checked.
+
         If dealer/VBT holds migrating ticket, execute internal sale:
         - Event 11: Dealer-to-dealer internal sale at old-bucket ask
         - Event 12: VBT-to-VBT internal sale at VBT mid M
@@ -525,7 +552,7 @@ class DealerRingSimulation:
             - Section 6.11: Internal dealer sale
             - Section 6.12: Internal VBT sale
         """
-        for ticket in self.all_tickets.values():
+        for ticket in self.ticket_schedule.crossing():
             old_bucket = ticket.bucket_id
             new_bucket = self._compute_bucket(ticket.remaining_tau)
 
@@ -1293,12 +1320,11 @@ class DealerRingSimulation:
         # Group maturing tickets by issuer
         maturing_by_issuer: dict[AgentId, list[Ticket]] = {}
 
-        for ticket in self.all_tickets.values():
-            if ticket.maturity_day == self.day:
-                issuer_id = ticket.issuer_id
-                if issuer_id not in maturing_by_issuer:
-                    maturing_by_issuer[issuer_id] = []
-                maturing_by_issuer[issuer_id].append(ticket)
+        for ticket in self.ticket_schedule.maturing(self.day):
+            issuer_id = ticket.issuer_id
+            if issuer_id not in maturing_by_issuer:
+                maturing_by_issuer[issuer_id] = []
+            maturing_by_issuer[issuer_id].append(ticket)
 
         # Settle each issuer
         for issuer_id, tickets in maturing_by_issuer.items():
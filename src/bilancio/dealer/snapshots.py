@@ -0,0 +1,267 @@
+"""
+Delta-encoded storage of day snapshots for the dealer simulations.
+
+A day snapshot serializes every dealer, VBT, trader and ticket into dicts.
+Keeping one full copy per day grows as O(days x tickets), although most
+entities do not change from one day to the next. A SnapshotLog stores the
+first snapshot in full and, for each later day, only the entities whose
+dicts changed, and rebuilds snapshot objects when they are read.
+
+Two encodings keep the deltas small:
+
+- Ticket lists nested in other entities (a dealer's inventory, a trader's
+  tickets_owned) are passed to the log as tuples of ticket ids (see
+  ticket_list) and are filled in from the tickets section on read.
+- A countdown field of the tickets section (remaining_tau) is stored as
+  the day it reaches 0, so a ticket whose countdown drops by one per day
+  is not stored again.
+
+The events of a day are not copied: the log keeps how many events the day
+had at capture time and reads them back from the EventLog.
+
+Random access does not replay from day 0: every KEYFRAME_INTERVAL days
+the log keeps a shallow copy of the stored records, and the last
+reconstructed position is cached, so a read rolls forward from the
+nearest of the two.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from typing import Any, Callable, NamedTuple
+
+from .events import EventLog
+from .models import Ticket, TicketId
+
+# section -> {field -> ticket fields of each entry of that nested list}
+TicketLists = dict[str, dict[str, tuple[str, ...]]]
+
+# Number of captured days between stored full frames
+KEYFRAME_INTERVAL = 32
+
+
+def ticket_list(
+    tickets: Iterable[Ticket],
+    registry: dict[TicketId, Ticket],
+    fields: tuple[str, ...],
+) -> tuple[TicketId, ...] | list[dict]:
+    """
+    A nested ticket list to pass to SnapshotLog.record.
+
+    The ticket ids, if every ticket is the one registered under its id (and
+    so appears in the snapshot's tickets section); otherwise the entries
+    themselves, as dicts of ``fields``.
+    """
+    ids = []
+    for ticket in tickets:
+        if registry.get(ticket.id) is not ticket:
+            return [{f: getattr(t, f) for f in fields} for t in tickets]
+        ids.append(ticket.id)
+    return tuple(ids)
+
+
+class SnapshotLog(Sequence):
+    """
+    Day snapshots stored as a full first frame plus per-day deltas.
+
+    Reads like the list of snapshots it replaces: ``len``, indexing,
+    slicing and iteration rebuild snapshot objects on demand (iteration
+    rolls forward one delta per day; indexing rolls forward from the
+    nearest keyframe or the last position read). ``for_day`` returns the
+    snapshot of a given day.
+
+    Attributes:
+        snapshot_cls: Snapshot type, built as snapshot_cls(day=..., events=..., **sections)
+        sections: Names of the entity sections (dict of key -> entity dict)
+        events: Event log the day events are read back from
+        ticket_lists: Fields of the nested ticket lists, per section and field
+        countdown: (section, field) of the per-day countdown, or None
+    """
+
+    def __init__(
+        self,
+        snapshot_cls: Callable[..., Any],
+        sections: tuple[str, ...],
+        events: EventLog,
+        ticket_lists: TicketLists | None = None,
+        countdown: tuple[str, str] | None = ("tickets", "remaining_tau"),
+    ):
+        self.snapshot_cls = snapshot_cls
+        self.sections = sections
+        self.events = events
+        self.ticket_lists = ticket_lists or {}
+        self.countdown = countdown
+        self.clear()
+
+    def clear(self) -> None:
+        """Drop all snapshots."""
+        self._days: list[int] = []
+        self._event_counts: list[int] = []
+        # Per captured day: section -> (changed records, removed keys, key order or None)
+        self._deltas: list[dict[str, tuple[dict, tuple, list | None]]] = []
+        # Latest stored record of every entity, to diff the next day against
+        self._records: dict[str, dict[str, Any]] = {name: {} for name in self.sections}
+        # Capture index -> records after that day's delta (every KEYFRAME_INTERVAL days)
+        self._keyframes: dict[int, dict[str, dict[str, Any]]] = {}
+        # Last capture index per day, for for_day
+        self._day_index: dict[int, int] = {}
+        # Last reconstructed (index, records), to roll forward from on the next read
+        self._cursor: tuple[int, dict[str, dict[str, Any]]] | None = None
+
+    # ------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------
+
+    def record(self, day: int, **sections: dict[str, dict]) -> None:
+        """
+        Store the snapshot of ``day``, given as one entity dict per section.
+
+        Nested ticket lists may be given as tuples of ticket ids.
+        """
+        delta = {}
+        for name in self.sections:
+            entities = sections[name]
+            records = self._records[name]
+            if self.countdown is not None and self.countdown[0] == name:
+                entities = {key: self._encode_countdown(entity, day) for key, entity in entities.items()}
+
+            changed = {}
+            for key, entity in entities.items():
+                if records.get(key, _MISSING) != entity:
+                    changed[key] = entity
+            removed = tuple(key for key in records if key not in entities)
+
+            records.update(changed)
+            for key in removed:
+                del records[key]
+            order = None
+            if list(records) != list(entities):
+                # Keys reordered: rebuild the stored order to match
+                order = list(entities)
+                self._records[name] = {key: records[key] for key in order}
+            delta[name] = (changed, removed, order)
+
+        index = len(self._days)
+        self._days.append(day)
+        self._event_counts.append(len(self.events.get_events_for_day(day)))
+        self._deltas.append(delta)
+        self._day_index[day] = index
+        if index % KEYFRAME_INTERVAL == KEYFRAME_INTERVAL - 1:
+            self._keyframes[index] = _copy_records(self._records)
+
+    def _encode_countdown(self, entity: dict, day: int) -> dict:
+        field = self.countdown[1]
+        value = entity.get(field)
+        if not isinstance(value, int) or value <= 0:
+            return entity
+        encoded = dict(entity)
+        encoded[field] = _Until(day + value)
+        return encoded
+
+    def _decode_countdown(self, entity: dict, day: int) -> dict:
+        field = self.countdown[1]
+        value = entity.get(field)
+        entity = dict(entity)
+        if isinstance(value, _Until):
+            entity[field] = max(0, value.day - day)
+        return entity
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._days)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        n = len(self._days)
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError("snapshot index out of range")
+        return self._build(self._seek(index), index)
+
+    def __iter__(self):
+        records = {name: {} for name in self.sections}
+        for i in range(len(self._days)):
+            self._apply(records, i)
+            yield self._build(records, i)
+
+    def days(self) -> list[int]:
+        """Captured days, in capture order."""
+        return list(self._days)
+
+    def for_day(self, day: int):
+        """The (last) snapshot captured on ``day``."""
+        index = self._day_index.get(day)
+        if index is None:
+            raise KeyError(f"No snapshot for day {day}")
+        return self[index]
+
+    def _seek(self, index: int) -> dict[str, dict]:
+        """Records as of capture ``index``, rolled forward from the nearest stored state."""
+        start, records = -1, None
+        keyframe = index - (index + 1) % KEYFRAME_INTERVAL
+        if keyframe in self._keyframes:
+            start = keyframe
+        if self._cursor is not None and start <= self._cursor[0] <= index:
+            start, records = self._cursor
+        elif start >= 0:
+            records = _copy_records(self._keyframes[start])
+        else:
+            records = {name: {} for name in self.sections}
+        for i in range(start + 1, index + 1):
+            self._apply(records, i)
+        self._cursor = (index, records)
+        return records
+
+    def _apply(self, records: dict[str, dict], index: int) -> None:
+        for name, (changed, removed, order) in self._deltas[index].items():
+            section = records[name]
+            section.update(changed)
+            for key in removed:
+                del section[key]
+            if order is not None:
+                records[name] = {key: section[key] for key in order}
+
+    def _build(self, records: dict[str, dict], index: int):
+        day = self._days[index]
+        sections = {}
+        # Tickets first: nested ticket lists are filled in from them
+        for name in sorted(self.sections, key=lambda name: name != "tickets"):
+            nested = self.ticket_lists.get(name)
+            counting = self.countdown is not None and self.countdown[0] == name
+            section = {}
+            for key, record in records[name].items():
+                entity = self._decode_countdown(record, day) if counting else dict(record)
+                if nested:
+                    self._decode_nested(entity, nested, sections["tickets"])
+                section[key] = entity
+            sections[name] = section
+        events = self.events.get_events_for_day(day)[: self._event_counts[index]]
+        return self.snapshot_cls(day=day, events=events, **{name: sections[name] for name in self.sections})
+
+    @staticmethod
+    def _decode_nested(entity: dict, nested: dict[str, tuple[str, ...]], tickets: dict[str, dict]) -> None:
+        for field, ticket_fields in nested.items():
+            entries = entity.get(field)
+            if isinstance(entries, tuple):
+                entity[field] = [
+                    {f: tickets[ticket_id][f] for f in ticket_fields} for ticket_id in entries
+                ]
+
+
+_MISSING = object()
+
+
+def _copy_records(records: dict[str, dict]) -> dict[str, dict]:
+    # Stored entity dicts are never mutated in place, so sharing them is safe
+    return {name: dict(section) for name, section in records.items()}
+
+
+class _Until(NamedTuple):
+    """Stored countdown value: the day the countdown reaches 0."""
+
+    day: int
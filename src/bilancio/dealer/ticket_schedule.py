@@ -0,0 +1,195 @@
+"""
+Maturity-day and bucket-crossing index over a simulation's ticket registry.
+
+The dealer simulations used to walk every ticket every day: to decrement
+remaining_tau, to re-bucket, and to find the tickets maturing today. A
+TicketSchedule indexes the registry as tickets are added and removed so
+that each day only touches:
+
+- tickets whose remaining_tau crosses a bucket edge that day, to re-bucket
+- tickets whose maturity_day is today, to settle
+
+No ticket is touched to count its remaining_tau down. While a ticket is
+in the registry its remaining_tau is derived from the schedule's TauClock
+(see Ticket), so the daily maturity update is a single clock tick. The
+countdown is not derived from maturity_day: the two are set independently
+when tickets are created. It counts from the remaining_tau the ticket had
+when it was indexed, and crossings are scheduled from that value in units
+of maturity updates.
+"""
+
+from __future__ import annotations
+
+from typing import Callable
+
+from .models import BucketConfig, TauClock, Ticket, TicketId
+
+
+def bucket_edges(buckets: list[BucketConfig], bucket_of: Callable[[int], str | None]) -> list[int]:
+    """
+    Remaining maturities tau >= 1 whose bucket differs from that of tau + 1.
+
+    A ticket re-buckets exactly when its remaining_tau drops onto one of
+    these values.
+    """
+    top = max(max(b.tau_min, b.tau_max or 0) for b in buckets) + 1 if buckets else 1
+    return [tau for tau in range(1, top + 1) if bucket_of(tau) != bucket_of(tau + 1)]
+
+
+class TicketRegistry(dict):
+    """
+    Ticket registry (id -> ticket) that reports changes to its TicketSchedule.
+
+    A plain dict for every read. Adding, replacing and removing entries,
+    through any dict method, updates the schedule's index immediately.
+    """
+
+    schedule: "TicketSchedule | None" = None
+
+    def __setitem__(self, ticket_id: TicketId, ticket: Ticket) -> None:
+        old = self.get(ticket_id)
+        super().__setitem__(ticket_id, ticket)
+        if old is ticket or self.schedule is None:
+            return
+        if old is not None:
+            self.schedule._remove(old)
+        self.schedule._add(ticket)
+
+    def __delitem__(self, ticket_id: TicketId) -> None:
+        ticket = self[ticket_id]
+        super().__delitem__(ticket_id)
+        if self.schedule is not None:
+            self.schedule._remove(ticket)
+
+    def pop(self, ticket_id: TicketId, *default):
+        if ticket_id not in self:
+            return super().pop(ticket_id, *default)
+        ticket = self[ticket_id]
+        del self[ticket_id]
+        return ticket
+
+    def popitem(self) -> tuple[TicketId, Ticket]:
+        ticket_id, ticket = super().popitem()
+        if self.schedule is not None:
+            self.schedule._remove(ticket)
+        return ticket_id, ticket
+
+    def setdefault(self, ticket_id: TicketId, ticket: Ticket | None = None):
+        if ticket_id not in self:
+            self[ticket_id] = ticket
+        return self[ticket_id]
+
+    def update(self, *args, **kwargs) -> None:
+        for ticket_id, ticket in dict(*args, **kwargs).items():
+            self[ticket_id] = ticket
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def clear(self) -> None:
+        tickets = list(self.values())
+        super().clear()
+        if self.schedule is not None:
+            for ticket in tickets:
+                self.schedule._remove(ticket)
+
+
+class TicketSchedule:
+    """
+    Index of a ticket registry by maturity day and bucket-crossing update.
+
+    The registry is shared with the simulation, which may add and remove
+    tickets directly; the registry reports each change to the schedule.
+
+    Attributes:
+        tickets: The simulation's ticket registry (id -> ticket)
+        clock: Maturity updates applied so far; drives remaining_tau of
+            the registered tickets
+    """
+
+    def __init__(
+        self,
+        tickets: TicketRegistry,
+        buckets: list[BucketConfig],
+        bucket_of: Callable[[int], str | None],
+    ):
+        self.tickets = tickets
+        self.clock = TauClock()
+        self._edges = bucket_edges(buckets, bucket_of)
+        self._position: dict[TicketId, int] = {}
+        self._by_maturity: dict[int, dict[TicketId, Ticket]] = {}
+        self._crossings: dict[int, list[Ticket]] = {}
+        self._added = 0
+        tickets.schedule = self
+        self.rebuild()
+
+    def rebuild(self) -> None:
+        """Drop the index and re-read the whole registry."""
+        for ticket_id in list(self._position):
+            ticket = self.tickets.get(ticket_id)
+            if ticket is not None:
+                self._detach(ticket)
+        self._position = {}
+        self._by_maturity = {}
+        self._crossings = {}
+        self._added = 0
+        for ticket in self.tickets.values():
+            self._add(ticket)
+
+    def _add(self, ticket: Ticket) -> None:
+        self._position[ticket.id] = self._added
+        self._added += 1
+        self._by_maturity.setdefault(ticket.maturity_day, {})[ticket.id] = ticket
+        tau = ticket.remaining_tau
+        if tau > 0:
+            # Hand the countdown to the clock
+            ticket._clock = self.clock
+            ticket.remaining_tau = tau
+        # Check the ticket's bucket at the next update (it may not match its
+        # tau yet), then at every update that lands on a bucket edge
+        update = self.clock.now + 1
+        self._crossings.setdefault(update, []).append(ticket)
+        for edge in self._edges:
+            if edge < tau - 1:
+                self._crossings.setdefault(update + tau - 1 - edge, []).append(ticket)
+
+    def _remove(self, ticket: Ticket) -> None:
+        # Scheduled crossings of the ticket are dropped when they come due
+        self._detach(ticket)
+        del self._position[ticket.id]
+        maturing = self._by_maturity.get(ticket.maturity_day)
+        if maturing is not None and maturing.get(ticket.id) is ticket:
+            del maturing[ticket.id]
+
+    def _detach(self, ticket: Ticket) -> None:
+        """Store the ticket's current remaining_tau in it again."""
+        if ticket._clock is self.clock:
+            tau = ticket.remaining_tau
+            ticket._clock = None
+            ticket.remaining_tau = tau
+
+    def advance(self) -> None:
+        """Count remaining_tau of every ticket still running down by one."""
+        self.clock.now += 1
+
+    def crossing(self) -> list[Ticket]:
+        """
+        Tickets whose bucket may have changed in the latest advance().
+
+        Returned once, in registry order, for the caller to re-bucket.
+        """
+        tickets = self.tickets
+        # Keyed by id: a ticket removed and added again may be listed twice
+        crossing = list({
+            ticket.id: ticket for ticket in self._crossings.pop(self.clock.now, ())
+            if tickets.get(ticket.id) is ticket
+        }.values())
+        position = self._position
+        crossing.sort(key=lambda t: position[t.id])
+        return crossing
+
+    def maturing(self, day: int) -> list[Ticket]:
+        """Tickets with maturity_day == day, in registry order."""
+        position = self._position
+        return sorted(self._by_maturity.get(day, {}).values(), key=lambda t: position[t.id])
@@ -3,7 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from enum import Enum
 
-from bilancio.core.ids import AgentId, InstrId
+from bilancio.core.ids import AgentId, IdList
 
 
 class AgentKind(Enum):
@@ -22,12 +22,12 @@ class AgentKind(Enum):
         return self.value
 
 
-@dataclass
+@dataclass(slots=True)
 class Agent:
     id: AgentId
     name: str
     kind: str  # Still accepts str for backward compatibility
-    asset_ids: list[InstrId] = field(default_factory=list)
-    liability_ids: list[InstrId] = field(default_factory=list)
-    stock_ids: list[InstrId] = field(default_factory=list)
+    asset_ids: IdList = field(default_factory=IdList)
+    liability_ids: IdList = field(default_factory=IdList)
+    stock_ids: IdList = field(default_factory=IdList)
     defaulted: bool = False
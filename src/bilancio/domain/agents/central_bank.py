@@ -4,7 +4,7 @@ from decimal import Decimal
 from bilancio.domain.agent import Agent
 
 
-@dataclass
+@dataclass(slots=True)
 class CentralBank(Agent):
     """
     Central Bank agent.
@@ -11,7 +11,7 @@ from dataclasses import dataclass, field
 from bilancio.domain.agent import Agent
 
 
-@dataclass
+@dataclass(slots=True)
 class Dealer(Agent):
     """
     Market maker agent for a maturity bucket in the dealer ring.
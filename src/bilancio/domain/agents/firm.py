@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from bilancio.domain.agent import Agent
 
 
-@dataclass
+@dataclass(slots=True)
 class Firm(Agent):
     """
     A firm/company agent that can:
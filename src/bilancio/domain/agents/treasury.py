@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from bilancio.domain.agent import Agent
 
 
-@dataclass
+@dataclass(slots=True)
 class Treasury(Agent):
     def __post_init__(self):
         self.kind = "treasury"
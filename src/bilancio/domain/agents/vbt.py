@@ -11,7 +11,7 @@ from dataclasses import dataclass, field
 from bilancio.domain.agent import Agent
 
 
-@dataclass
+@dataclass(slots=True)
 class VBT(Agent):
     """
     Value-Based Trader providing outside liquidity to the dealer ring.
@@ -5,7 +5,7 @@ from bilancio.core.ids import InstrId, AgentId
 
 StockId = InstrId  # reuse ID machinery
 
-@dataclass
+@dataclass(slots=True)
 class StockLot:
     id: StockId
     kind: str          # fixed: "stock_lot"
@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from bilancio.core.ids import AgentId, InstrId
 
 
-@dataclass
+@dataclass(slots=True)
 class Instrument:
     id: InstrId
     kind: str
@@ -18,7 +18,7 @@ from typing import Optional
 from .base import Instrument
 
 
-@dataclass
+@dataclass(slots=True)
 class CBLoan(Instrument):
     """
     Central Bank loan to a commercial bank.
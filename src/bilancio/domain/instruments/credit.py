@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from .base import Instrument
 
 
-@dataclass
+@dataclass(slots=True)
 class Payable(Instrument):
     """A payable instrument representing a credit obligation.
 
@@ -37,5 +37,5 @@ class Payable(Instrument):
         self.kind = "payable"
 
     def validate_type_invariants(self) -> None:
-        super().validate_type_invariants()
+        Instrument.validate_type_invariants(self)
         assert self.due_day is not None and self.due_day >= 0, "payable must have due_day"
@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from decimal import Decimal
 from bilancio.domain.instruments.base import Instrument
 
-@dataclass
+@dataclass(slots=True)
 class DeliveryObligation(Instrument):
     # amount = quantity promised (rename for clarity at call sites)
     sku: str
@@ -26,6 +26,6 @@ class DeliveryObligation(Instrument):
         
     def validate_type_invariants(self) -> None:
         # Standard bilateral instrument validation (holder != issuer)
-        super().validate_type_invariants()
+        Instrument.validate_type_invariants(self)
         assert self.unit_price >= 0, "unit_price must be non-negative"
         assert self.due_day >= 0, "due_day must be non-negative"
\ No newline at end of file
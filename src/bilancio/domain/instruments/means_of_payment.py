@@ -5,7 +5,7 @@ from typing import Optional
 from .base import Instrument
 
 
-@dataclass
+@dataclass(slots=True)
 class Cash(Instrument):
     """
     Bearer CB liability; issuer is CB; holder can be anyone per policy.
@@ -16,7 +16,7 @@ class Cash(Instrument):
         self.kind = "cash"
 
 
-@dataclass
+@dataclass(slots=True)
 class BankDeposit(Instrument):
     """
     Liability of a commercial bank; holder is typically household/firm.
@@ -28,7 +28,7 @@ class BankDeposit(Instrument):
         self.kind = "bank_deposit"
 
 
-@dataclass
+@dataclass(slots=True)
 class ReserveDeposit(Instrument):
     """
     Liability of the central bank; holders are banks/treasury per policy.
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from collections.abc import Sequence
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from bilancio.domain.agent import Agent
 from bilancio.domain.agents.bank import Bank
@@ -25,6 +25,14 @@ class PolicyEngine:
     holders: dict[InstrType, Sequence[AgentType]]
     # means-of-payment ranking per agent kind (least-preferred to keep first)
     mop_rank: dict[str, list[str]]
+    # answers memoized per (agent type, instrument type) and per agent kind;
+    # call invalidate() after editing issuers, holders or mop_rank
+    _issue_memo: dict[tuple[AgentType, InstrType], bool] = field(
+        default_factory=dict, init=False, repr=False, compare=False)
+    _hold_memo: dict[tuple[AgentType, InstrType], bool] = field(
+        default_factory=dict, init=False, repr=False, compare=False)
+    _order_memo: dict[str, tuple[str, ...]] = field(
+        default_factory=dict, init=False, repr=False, compare=False)
 
     @classmethod
     def default(cls) -> PolicyEngine:
@@ -54,11 +62,31 @@ class PolicyEngine:
             },
         )
 
+    def invalidate(self) -> None:
+        """Drop memoized answers; needed after changing the policy tables."""
+        self._issue_memo.clear()
+        self._hold_memo.clear()
+        self._order_memo.clear()
+
     def can_issue(self, agent: Agent, instr: Instrument) -> bool:
-        return any(isinstance(agent, t) for t in self.issuers.get(type(instr), ()))
+        key = (type(agent), type(instr))
+        allowed = self._issue_memo.get(key)
+        if allowed is None:
+            allowed = any(issubclass(key[0], t) for t in self.issuers.get(key[1], ()))
+            self._issue_memo[key] = allowed
+        return allowed
 
     def can_hold(self, agent: Agent, instr: Instrument) -> bool:
-        return any(isinstance(agent, t) for t in self.holders.get(type(instr), ()))
+        key = (type(agent), type(instr))
+        allowed = self._hold_memo.get(key)
+        if allowed is None:
+            allowed = any(issubclass(key[0], t) for t in self.holders.get(key[1], ()))
+            self._hold_memo[key] = allowed
+        return allowed
 
     def settlement_order(self, agent: Agent) -> Sequence[str]:
-        return self.mop_rank.get(agent.kind, [])
+        order = self._order_memo.get(agent.kind)
+        if order is None:
+            order = tuple(self.mop_rank.get(agent.kind, ()))
+            self._order_memo[agent.kind] = order
+        return order
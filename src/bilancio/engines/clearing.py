@@ -1,7 +1,5 @@
 """Clearing engine (Phase C) for intraday netting and settlement."""
 
-from collections import defaultdict
-
 from bilancio.core.atomic_tx import atomic
 from bilancio.core.errors import ValidationError
 from bilancio.domain.instruments.credit import Payable
@@ -9,55 +7,137 @@ from bilancio.domain.instruments.credit import Payable
 
 def compute_intraday_nets(system, day: int) -> dict[tuple[str, str], int]:
     """
-    Compute net amounts between banks from today's ClientPayment events.
-    
-    Scans events for ClientPayment events from today and calculates net amounts 
-    between each bank pair. Uses lexical ordering for bank pairs (a, b where a < b).
-    
+    Net amounts between banks from the day's ClientPayments, not yet cleared.
+
+    Reads the bilateral net accumulator maintained by ``client_payment``
+    (see System.record_interbank_payment); pairs appear in order of their first
+    payment that day. Uses lexical ordering for bank pairs (a, b where a < b).
+
     Convention: nets[(a,b)] > 0 means bank a owes bank b
-    
+
+    Unlike a scan of the event log (see scan_intraday_nets), this is not a
+    pure query over events:
+
+    - ``settle_intraday_nets`` consumes the day's accumulator, so after
+      Phase C this returns ``{}`` for that day.
+    - A ClientPayment event logged without going through
+      ``ops.banking.client_payment`` (or System.record_interbank_payment)
+      is not counted. ``System.assert_invariants`` checks that the
+      accumulator matches the events.
+
     Args:
         system: System instance
         day: Day to compute nets for
-        
+
     Returns:
         Dict mapping bank pairs to net amounts
     """
-    nets = defaultdict(int)
+    return dict(system.state.intraday_nets.get(day, {}))
 
-    # Scan events for ClientPayment events from today
-    for event in system.state.events:
-        if event.get("kind") == "ClientPayment" and event.get("day") == day:
-            debtor_bank = event.get("payer_bank")
-            creditor_bank = event.get("payee_bank")
-            amount = event.get("amount", 0)
 
-            if debtor_bank and creditor_bank and debtor_bank != creditor_bank:
-                # Use lexical ordering: ensure a < b
-                if debtor_bank < creditor_bank:
-                    # debtor_bank owes creditor_bank
-                    nets[(debtor_bank, creditor_bank)] += amount
-                else:
-                    # creditor_bank is owed by debtor_bank, so subtract from the reverse pair
-                    nets[(creditor_bank, debtor_bank)] -= amount
+def scan_intraday_nets(system, day: int) -> dict[tuple[str, str], int]:
+    """
+    Net amounts between banks, recomputed from the day's ClientPayment events.
+
+    Same convention as compute_intraday_nets, but derived from the event log
+    (so it is unaffected by clearing); used to check the accumulator.
+    """
+    nets: dict[tuple[str, str], int] = {}
+    for event in system.state.events.of_kind("ClientPayment", day):
+        debtor_bank = event.get("payer_bank")
+        creditor_bank = event.get("payee_bank")
+        amount = event.get("amount", 0)
+        if debtor_bank and creditor_bank and debtor_bank != creditor_bank:
+            if debtor_bank < creditor_bank:
+                pair, delta = (debtor_bank, creditor_bank), amount
+            else:
+                pair, delta = (creditor_bank, debtor_bank), -amount
+            nets[pair] = nets.get(pair, 0) + delta
+    return nets
+
+
+def compute_net_positions(nets: dict[tuple[str, str], int]) -> dict[str, int]:
+    """
+    Each bank's multilateral net position from bilateral nets.
 
-    return dict(nets)
+    A positive position means the bank owes that much to the other banks
+    taken together; a negative one means it is owed. Positions sum to zero.
+    Banks appear in order of their first pair in ``nets``.
+    """
+    positions: dict[str, int] = {}
+    for (bank_a, bank_b), net_amount in nets.items():
+        positions[bank_a] = positions.get(bank_a, 0) + net_amount
+        positions[bank_b] = positions.get(bank_b, 0) - net_amount
+    return positions
+
+
+def _create_overnight_payable(system, debtor_bank: str, creditor_bank: str, amount: int, day: int) -> None:
+    payable_id = system.new_contract_id("P")
+    overnight_payable = Payable(
+        id=payable_id,
+        kind="payable",
+        amount=amount,
+        denom="X",
+        asset_holder_id=creditor_bank,
+        liability_issuer_id=debtor_bank,
+        due_day=day + 1
+    )
+
+    system.add_contract(overnight_payable)
+    system.log("InterbankOvernightCreated",
+              debtor_bank=debtor_bank,
+              creditor_bank=creditor_bank,
+              amount=amount,
+              payable_id=payable_id,
+              due_day=day + 1)
+
+
+def _settle_with_reserves(system, debtor_bank: str, creditor_bank: str, amount: int) -> bool:
+    """Transfer ``amount`` reserves and log InterbankCleared; False if that fails."""
+    try:
+        with atomic(system):
+            system.transfer_reserves(debtor_bank, creditor_bank, amount)
+            system.log("InterbankCleared",
+                      debtor_bank=debtor_bank,
+                      creditor_bank=creditor_bank,
+                      amount=amount)
+    except ValidationError:
+        return False
+    return True
 
 
-def settle_intraday_nets(system, day: int):
+def settle_intraday_nets(system, day: int, mode: str | None = None):
     """
     Settle intraday nets between banks using reserves or creating overnight payables.
-    
-    For each net amount between banks:
+
+    In ``"bilateral"`` mode (the default), for each net amount between banks:
     - Try to transfer reserves if sufficient
     - If insufficient reserves, create overnight payable due tomorrow
     - Log InterbankCleared or InterbankOvernightCreated events
-    
+
+    In ``"multilateral"`` mode the bilateral nets are first collapsed into one
+    net position per bank (see settle_multilateral_nets), so each bank settles
+    a single amount against the system instead of one per counterparty.
+
     Args:
-        system: System instance  
+        system: System instance
         day: Current day
+        mode: "bilateral" or "multilateral"; defaults to system.state.clearing_mode
+
+    The day's net accumulator is consumed: it is reset once read.
     """
+    if mode is None:
+        mode = system.state.clearing_mode
+    if mode not in ("bilateral", "multilateral"):
+        raise ValueError(f"Unknown clearing mode: {mode}")
+
     nets = compute_intraday_nets(system, day)
+    if day in system.state.intraday_nets:
+        system.state.journal.delitem(system.state.intraday_nets, day)
+
+    if mode == "multilateral":
+        settle_multilateral_nets(system, day, nets)
+        return
 
     for (bank_a, bank_b), net_amount in nets.items():
         if net_amount == 0:
@@ -74,66 +154,66 @@ def settle_intraday_nets(system, day: int):
             creditor_bank = bank_a
             amount = -net_amount
 
-        # Try to transfer reserves
-        try:
-            with atomic(system):
-                # Find available reserves for debtor bank
-                debtor_reserve_ids = []
-                for cid in system.state.agents[debtor_bank].asset_ids:
-                    contract = system.state.contracts[cid]
-                    if contract.kind == "reserve_deposit":
-                        debtor_reserve_ids.append(cid)
-
-                if not debtor_reserve_ids:
-                    available_reserves = 0
-                else:
-                    available_reserves = sum(system.state.contracts[cid].amount for cid in debtor_reserve_ids)
-
-                if available_reserves >= amount:
-                    # Sufficient reserves - transfer them
-                    system.transfer_reserves(debtor_bank, creditor_bank, amount)
-                    system.log("InterbankCleared",
-                              debtor_bank=debtor_bank,
-                              creditor_bank=creditor_bank,
-                              amount=amount)
-                else:
-                    # Insufficient reserves - create overnight payable
-                    payable_id = system.new_contract_id("P")
-                    overnight_payable = Payable(
-                        id=payable_id,
-                        kind="payable",
-                        amount=amount,
-                        denom="X",
-                        asset_holder_id=creditor_bank,
-                        liability_issuer_id=debtor_bank,
-                        due_day=day + 1
-                    )
-
-                    system.add_contract(overnight_payable)
-                    system.log("InterbankOvernightCreated",
-                              debtor_bank=debtor_bank,
-                              creditor_bank=creditor_bank,
-                              amount=amount,
-                              payable_id=payable_id,
-                              due_day=day + 1)
-
-        except ValidationError:
-            # If transfer fails, create overnight payable as fallback
-            payable_id = system.new_contract_id("P")
-            overnight_payable = Payable(
-                id=payable_id,
-                kind="payable",
-                amount=amount,
-                denom="X",
-                asset_holder_id=creditor_bank,
-                liability_issuer_id=debtor_bank,
-                due_day=day + 1
-            )
+        # Transfer reserves if sufficient, otherwise (or if the transfer
+        # fails) create an overnight payable
+        available_reserves = system.holding_balance(debtor_bank, "reserve_deposit")
+        if available_reserves >= amount and _settle_with_reserves(system, debtor_bank, creditor_bank, amount):
+            continue
+        _create_overnight_payable(system, debtor_bank, creditor_bank, amount, day)
 
-            system.add_contract(overnight_payable)
-            system.log("InterbankOvernightCreated",
-                      debtor_bank=debtor_bank,
-                      creditor_bank=creditor_bank,
-                      amount=amount,
-                      payable_id=payable_id,
-                      due_day=day + 1)
+
+def match_net_positions(positions: dict[str, int]) -> list[tuple[str, str, int]]:
+    """
+    Pair net payers with net receivers so every position is settled.
+
+    Payers (positive positions) and receivers (negative) are each taken
+    largest first, ties by id, and matched greedily. Returns
+    ``(payer, receiver, amount)`` transfers, at most one fewer than the
+    number of non-zero positions.
+
+    Raises:
+        ValueError: If the positions do not sum to zero
+    """
+    if sum(positions.values()) != 0:
+        raise ValueError(f"Net positions must sum to zero, got {sum(positions.values())}")
+    payers = sorted(((amt, a) for a, amt in positions.items() if amt > 0), key=lambda p: (-p[0], p[1]))
+    receivers = sorted(((-amt, a) for a, amt in positions.items() if amt < 0), key=lambda p: (-p[0], p[1]))
+
+    transfers = []
+    r = 0
+    receiver_left = receivers[0][0] if receivers else 0
+    for owed, payer in payers:
+        while owed > 0:
+            amount = min(owed, receiver_left)
+            transfers.append((payer, receivers[r][1], amount))
+            owed -= amount
+            receiver_left -= amount
+            if receiver_left == 0 and r + 1 < len(receivers):
+                r += 1
+                receiver_left = receivers[r][0]
+    return transfers
+
+
+def settle_multilateral_nets(system, day: int, nets: dict[tuple[str, str], int]) -> None:
+    """
+    Settle bilateral nets through each bank's multilateral net position.
+
+    Net payers are matched against net receivers (see match_net_positions),
+    so every bank's position is settled in one pass. Each net payer pays
+    from its reserves up to its position; only the part it cannot cover
+    becomes overnight payables due tomorrow, split across the receivers it
+    was matched with.
+    """
+    positions = compute_net_positions(nets)
+    reserves_left: dict[str, int] = {}
+    for debtor_bank, creditor_bank, amount in match_net_positions(positions):
+        if debtor_bank not in reserves_left:
+            reserves_left[debtor_bank] = min(
+                positions[debtor_bank], system.holding_balance(debtor_bank, "reserve_deposit")
+            )
+        paid = min(amount, reserves_left[debtor_bank])
+        if paid and not _settle_with_reserves(system, debtor_bank, creditor_bank, paid):
+            paid = 0
+        reserves_left[debtor_bank] -= paid
+        if amount > paid:
+            _create_overnight_payable(system, debtor_bank, creditor_bank, amount - paid, day)
@@ -41,7 +41,7 @@ from bilancio.dealer.models import (
     DEFAULT_BUCKETS,
     TicketId,
 )
-from bilancio.dealer.kernel import KernelParams, recompute_dealer_state
+from bilancio.dealer.kernel import KernelAudit, KernelParams, QuoteCache, recompute_dealer_state
 from bilancio.dealer.trading import TradeExecutor
 from bilancio.dealer.simulation import DealerRingConfig
 from bilancio.dealer.metrics import (
@@ -182,9 +182,10 @@ def initialize_dealer_subsystem(
 
     subsystem = DealerSubsystem(
         bucket_configs=dealer_config.buckets,
-        params=KernelParams(S=dealer_config.ticket_size),
+        params=_kernel_params(dealer_config, dealer_config.ticket_size),
         rng=random.Random(dealer_config.seed),
     )
+    subsystem.metrics.quote_cache = subsystem.params.cache
 
     # Initialize risk assessor if params provided
     if risk_params:
@@ -412,10 +413,11 @@ def initialize_balanced_dealer_subsystem(
 
     subsystem = DealerSubsystem(
         bucket_configs=dealer_config.buckets,
-        params=KernelParams(S=face_value),  # Use face_value as ticket size
+        params=_kernel_params(dealer_config, face_value),  # Use face_value as ticket size
         rng=random.Random(dealer_config.seed),
         enabled=(mode == "active"),  # Disable trading for passive mode
     )
+    subsystem.metrics.quote_cache = subsystem.params.cache
 
     # Initialize risk assessor if params provided
     if risk_params:
@@ -602,6 +604,17 @@ def initialize_balanced_dealer_subsystem(
     return subsystem
 
 
+def _kernel_params(dealer_config: DealerRingConfig, ticket_size: Decimal) -> KernelParams:
+    """Kernel parameters with the quote cache and audit the config enables."""
+    cache_size = dealer_config.quote_cache_size
+    audit_every = dealer_config.kernel_audit_every
+    return KernelParams(
+        S=ticket_size,
+        cache=QuoteCache(cache_size) if cache_size else None,
+        audit=KernelAudit(audit_every) if audit_every else None,
+    )
+
+
 def _get_agent_cash(system, agent_id: str) -> Decimal:
     """
     Get total cash balance for an agent from the main system.
@@ -615,17 +628,32 @@ def _get_agent_cash(system, agent_id: str) -> Decimal:
     Returns:
         Total cash balance as Decimal
     """
-    agent = system.state.agents.get(agent_id)
-    if not agent:
+    if agent_id not in system.state.agents:
         return Decimal(0)
 
-    total_cash = Decimal(0)
-    for contract_id in agent.asset_ids:
-        contract = system.state.contracts.get(contract_id)
-        if contract and contract.kind == "cash":
-            total_cash += Decimal(contract.amount)
+    return Decimal(system.holding_balance(agent_id, "cash"))
 
-    return total_cash
+
+def _release_ticket(subsystem: DealerSubsystem, ticket: Ticket, bucket_id: str) -> None:
+    """
+    Remove a matured or orphaned ticket from every book that holds it.
+
+    The holders are looked up from the ticket itself (the dealer and VBT of
+    ``bucket_id``, the trader named by owner_id and the issuing trader)
+    rather than by scanning every trader's holdings.
+    """
+    dealer = subsystem.dealers.get(bucket_id)
+    vbt = subsystem.vbts.get(bucket_id)
+    if dealer and ticket in dealer.inventory:
+        dealer.inventory.remove(ticket)
+    if vbt and ticket in vbt.inventory:
+        vbt.inventory.remove(ticket)
+    holder = subsystem.traders.get(ticket.owner_id)
+    if holder and ticket in holder.tickets_owned:
+        holder.tickets_owned.remove(ticket)
+    issuer = subsystem.traders.get(ticket.issuer_id)
+    if issuer and ticket in issuer.obligations:
+        issuer.obligations.remove(ticket)
 
 
 def run_dealer_trading_phase(
@@ -702,20 +730,7 @@ def run_dealer_trading_phase(
     for ticket_id in orphaned_ticket_ids:
         ticket = subsystem.tickets.get(ticket_id)
         if ticket:
-            # Remove from inventories
-            bucket = ticket.bucket_id
-            dealer = subsystem.dealers.get(bucket)
-            vbt = subsystem.vbts.get(bucket)
-            if dealer and ticket in dealer.inventory:
-                dealer.inventory.remove(ticket)
-            if vbt and ticket in vbt.inventory:
-                vbt.inventory.remove(ticket)
-            # Remove from trader holdings
-            for trader in subsystem.traders.values():
-                if ticket in trader.tickets_owned:
-                    trader.tickets_owned.remove(ticket)
-                if ticket in trader.obligations:
-                    trader.obligations.remove(ticket)
+            _release_ticket(subsystem, ticket, ticket.bucket_id)
             # Remove ticket
             del subsystem.tickets[ticket_id]
 
@@ -736,19 +751,8 @@ def run_dealer_trading_phase(
         # Mark matured tickets for cleanup (remaining_tau = 0 means due today or past)
         if ticket.remaining_tau == 0:
             matured_ticket_ids.append(ticket.id)
-            # Remove from inventories before deletion
-            old_dealer = subsystem.dealers.get(old_bucket)
-            old_vbt = subsystem.vbts.get(old_bucket)
-            if old_dealer and ticket in old_dealer.inventory:
-                old_dealer.inventory.remove(ticket)
-            if old_vbt and ticket in old_vbt.inventory:
-                old_vbt.inventory.remove(ticket)
-            # Remove from trader holdings
-            for trader in subsystem.traders.values():
-                if ticket in trader.tickets_owned:
-                    trader.tickets_owned.remove(ticket)
-                if ticket in trader.obligations:
-                    trader.obligations.remove(ticket)
+            # Remove from inventories and holdings before deletion
+            _release_ticket(subsystem, ticket, old_bucket)
             continue
 
         new_bucket = _assign_bucket(ticket.remaining_tau, subsystem.bucket_configs)
@@ -796,9 +800,7 @@ def run_dealer_trading_phase(
     horizon = 10  # Look ahead this many days for upcoming obligations
     for trader_id, trader in subsystem.traders.items():
         # Check for shortfall on any of the next 'horizon' days
-        upcoming_shortfall = Decimal(0)
-        for day_offset in range(horizon + 1):
-            upcoming_shortfall = max(upcoming_shortfall, trader.shortfall(current_day + day_offset))
+        upcoming_shortfall = trader.max_shortfall(current_day, current_day + horizon)
         if upcoming_shortfall > 0 and trader.tickets_owned:
             eligible_sellers.append(trader_id)
 
@@ -807,9 +809,7 @@ def run_dealer_trading_phase(
     eligible_buyers = []
     # Only allow buying if trader has significant surplus above obligations
     for trader_id, trader in subsystem.traders.items():
-        max_upcoming_dues = Decimal(0)
-        for day_offset in range(horizon + 1):
-            max_upcoming_dues = max(max_upcoming_dues, trader.payment_due(current_day + day_offset))
+        max_upcoming_dues = trader.max_payment_due(current_day, current_day + horizon)
         surplus = trader.cash - max_upcoming_dues
         if surplus > Decimal(500):  # Only if significant surplus
             eligible_buyers.append(trader_id)
@@ -1176,10 +1176,10 @@ def sync_dealer_to_system(
             new_holder_agent = system.state.agents.get(new_holder)
 
             if old_holder_agent and payable_id in old_holder_agent.asset_ids:
-                old_holder_agent.asset_ids.remove(payable_id)
+                system._detach_asset(old_holder_agent, payable)
 
             if new_holder_agent and payable_id not in new_holder_agent.asset_ids:
-                new_holder_agent.asset_ids.append(payable_id)
+                system._attach_asset(new_holder_agent, payable)
 
             # Update payable's holder_id (secondary market holder)
             # Keep asset_holder_id as the original creditor
@@ -1213,20 +1213,19 @@ def sync_dealer_to_system(
             agent = system.state.agents.get(trader_id)
             if agent:
                 remaining_to_burn = abs(delta)
-                for contract_id in list(agent.asset_ids):
+                for contract_id in system.holding_ids(trader_id, "cash"):
                     if remaining_to_burn <= 0:
                         break
-                    contract = system.state.contracts.get(contract_id)
-                    if contract and contract.kind == "cash":
-                        if contract.amount <= remaining_to_burn:
-                            # Remove entire contract
-                            remaining_to_burn -= contract.amount
-                            agent.asset_ids.remove(contract_id)
-                            del system.state.contracts[contract_id]
-                        else:
-                            # Reduce contract amount
-                            contract.amount -= round(remaining_to_burn)
-                            remaining_to_burn = 0
+                    contract = system.state.contracts[contract_id]
+                    if contract.amount <= remaining_to_burn:
+                        # Remove entire contract
+                        remaining_to_burn -= contract.amount
+                        system._detach_asset(agent, contract)
+                        system._unregister_contract(contract_id)
+                    else:
+                        # Reduce contract amount
+                        system.set_amount(contract, contract.amount - round(remaining_to_burn))
+                        remaining_to_burn = 0
 
 
 def _capture_dealer_snapshots(
@@ -0,0 +1,117 @@
+"""Optional per-phase instrumentation for run_day.
+
+Attach a PhaseTimer to a system (``system.phase_timer = PhaseTimer()``) and
+run_day records, for every phase of every day, the wall time spent, the
+events emitted, the contracts created and removed, and the atomic
+transactions opened. Without a timer run_day does no extra work.
+"""
+
+from __future__ import annotations
+
+import csv
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, fields
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Dict, Iterator, List
+
+@dataclass
+class PhaseRecord:
+    """Counters for one phase of one simulated day."""
+
+    day: int
+    phase: str
+    wall_time_s: float
+    events: int
+    contracts_created: int
+    contracts_removed: int
+    atomic_entries: int
+
+
+def _counters(system) -> tuple[int, int, int, int]:
+    state = system.state
+    return (
+        len(state.events),
+        state.contracts_created,
+        state.contracts_removed,
+        state.journal.transactions,
+    )
+
+
+class PhaseTimer:
+    """Collects PhaseRecords for the days run while attached to a system."""
+
+    def __init__(self) -> None:
+        self.records: List[PhaseRecord] = []
+
+    @contextmanager
+    def phase(self, system, day: int, name: str) -> Iterator[None]:
+        """Measure the enclosed block as phase ``name`` of ``day``."""
+        before = _counters(system)
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = perf_counter() - start
+            after = _counters(system)
+            self.records.append(PhaseRecord(
+                day,
+                name,
+                elapsed,
+                *(b - a for a, b in zip(before, after)),
+            ))
+
+    def summary(self) -> Dict[str, Any]:
+        return summarize_phase_timings(self.records)
+
+    def to_csv(self, path: Path | str) -> None:
+        """Write one row per (day, phase) to ``path``."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("w", newline="") as fh:
+            writer = csv.DictWriter(fh, fieldnames=[f.name for f in fields(PhaseRecord)])
+            writer.writeheader()
+            for record in self.records:
+                writer.writerow(asdict(record))
+
+
+def read_phase_timings_csv(path: Path | str) -> List[PhaseRecord]:
+    """Load records written by PhaseTimer.to_csv."""
+    records = []
+    with Path(path).open(newline="") as fh:
+        for row in csv.DictReader(fh):
+            records.append(PhaseRecord(
+                day=int(row["day"]),
+                phase=row["phase"],
+                wall_time_s=float(row["wall_time_s"]),
+                events=int(row["events"]),
+                contracts_created=int(row["contracts_created"]),
+                contracts_removed=int(row["contracts_removed"]),
+                atomic_entries=int(row["atomic_entries"]),
+            ))
+    return records
+
+
+def summarize_phase_timings(records: List[PhaseRecord]) -> Dict[str, Any]:
+    """Totals over all days: wall time per phase, overall counters, slowest phase.
+
+    Keys are flat so the summary fits a registry row: ``time_<phase>_s`` for
+    each phase seen, plus ``phase_time_total_s``, ``phase_events``,
+    ``phase_contracts_created``, ``phase_contracts_removed``,
+    ``phase_atomic_entries`` and ``slowest_phase``.
+    """
+    per_phase: Dict[str, float] = {}
+    totals = {"events": 0, "contracts_created": 0, "contracts_removed": 0, "atomic_entries": 0}
+    for record in records:
+        per_phase[record.phase] = per_phase.get(record.phase, 0.0) + record.wall_time_s
+        for key in totals:
+            totals[key] += getattr(record, key)
+
+    summary: Dict[str, Any] = {
+        f"time_{phase}_s": round(seconds, 6) for phase, seconds in per_phase.items()
+    }
+    summary["phase_time_total_s"] = round(sum(per_phase.values()), 6)
+    for key, value in totals.items():
+        summary[f"phase_{key}"] = value
+    summary["slowest_phase"] = max(per_phase, key=per_phase.get) if per_phase else ""
+    return summary
@@ -6,12 +6,18 @@ from typing import List, Tuple
 
 from bilancio.core.atomic_tx import atomic
 from bilancio.core.errors import DefaultError, ValidationError
+from bilancio.engines.clearing import match_net_positions
 from bilancio.ops.banking import client_payment
 from bilancio.ops.aliases import get_alias_for_id
 
 DEFAULT_MODE_FAIL_FAST = "fail-fast"
 DEFAULT_MODE_EXPEL = "expel-agent"
 
+SETTLEMENT_MODE_SEQUENTIAL = "sequential"
+SETTLEMENT_MODE_LSM = "lsm"
+
+_MEANS_OF_PAYMENT = ("bank_deposit", "cash", "reserve_deposit")
+
 # Plan 024: Track settled payables for rollover
 _settled_payables_for_rollover: List[Tuple[str, str, int, int, int]] = []
 # List of (debtor_id, creditor_id, amount, maturity_distance, current_day)
@@ -46,50 +52,42 @@ def _get_default_mode(system) -> str:
 
 
 def due_payables(system, day: int):
-    """Scan contracts for payables with due_day == day."""
-    for c in system.state.contracts.values():
-        if c.kind == "payable" and getattr(c, "due_day", None) == day:
+    """Yield payables with due_day == day from the state's due-day index."""
+    contracts = system.state.contracts
+    for cid in system.contract_ids_due(day):
+        c = contracts.get(cid)
+        if c is not None and c.kind == "payable":
             yield c
 
 
 def due_delivery_obligations(system, day: int):
-    """Scan contracts for delivery obligations with due_day == day."""
-    for c in system.state.contracts.values():
-        if c.kind == "delivery_obligation" and getattr(c, "due_day", None) == day:
+    """Yield delivery obligations with due_day == day from the state's due-day index."""
+    contracts = system.state.contracts
+    for cid in system.contract_ids_due(day):
+        c = contracts.get(cid)
+        if c is not None and c.kind == "delivery_obligation":
             yield c
 
 
 def _pay_with_deposits(system, debtor_id, creditor_id, amount) -> int:
     """Pay using bank deposits. Returns amount actually paid."""
-    debtor_deposit_ids = []
-    for cid in system.state.agents[debtor_id].asset_ids:
-        contract = system.state.contracts[cid]
-        if contract.kind == "bank_deposit":
-            debtor_deposit_ids.append(cid)
+    debtor_deposit_id = system.first_holding_id(debtor_id, "bank_deposit")
 
-    if not debtor_deposit_ids:
+    if debtor_deposit_id is None:
         return 0
 
-    available = sum(system.state.contracts[cid].amount for cid in debtor_deposit_ids)
+    available = system.holding_balance(debtor_id, "bank_deposit")
     if available == 0:
         return 0
 
     pay_amount = min(amount, available)
 
-    debtor_bank_id = None
-    creditor_bank_id = None
+    debtor_bank_id = system.state.contracts[debtor_deposit_id].liability_issuer_id
 
-    if debtor_deposit_ids:
-        debtor_bank_id = system.state.contracts[debtor_deposit_ids[0]].liability_issuer_id
+    creditor_deposit_id = system.first_holding_id(creditor_id, "bank_deposit")
 
-    creditor_deposit_ids = []
-    for cid in system.state.agents[creditor_id].asset_ids:
-        contract = system.state.contracts[cid]
-        if contract.kind == "bank_deposit":
-            creditor_deposit_ids.append(cid)
-
-    if creditor_deposit_ids:
-        creditor_bank_id = system.state.contracts[creditor_deposit_ids[0]].liability_issuer_id
+    if creditor_deposit_id is not None:
+        creditor_bank_id = system.state.contracts[creditor_deposit_id].liability_issuer_id
     else:
         creditor_bank_id = debtor_bank_id
 
@@ -105,16 +103,7 @@ def _pay_with_deposits(system, debtor_id, creditor_id, amount) -> int:
 
 def _pay_with_cash(system, debtor_id, creditor_id, amount) -> int:
     """Pay using cash. Returns amount actually paid."""
-    debtor_cash_ids = []
-    for cid in system.state.agents[debtor_id].asset_ids:
-        contract = system.state.contracts[cid]
-        if contract.kind == "cash":
-            debtor_cash_ids.append(cid)
-
-    if not debtor_cash_ids:
-        return 0
-
-    available = sum(system.state.contracts[cid].amount for cid in debtor_cash_ids)
+    available = system.holding_balance(debtor_id, "cash")
     if available == 0:
         return 0
 
@@ -132,16 +121,7 @@ def _pay_bank_to_bank_with_reserves(system, debtor_bank_id, creditor_bank_id, am
     if debtor_bank_id == creditor_bank_id:
         return 0
 
-    debtor_reserve_ids = []
-    for cid in system.state.agents[debtor_bank_id].asset_ids:
-        contract = system.state.contracts[cid]
-        if contract.kind == "reserve_deposit":
-            debtor_reserve_ids.append(cid)
-
-    if not debtor_reserve_ids:
-        return 0
-
-    available = sum(system.state.contracts[cid].amount for cid in debtor_reserve_ids)
+    available = system.holding_balance(debtor_bank_id, "reserve_deposit")
     if available == 0:
         return 0
 
@@ -193,30 +173,31 @@ def _remove_contract(system, contract_id):
     contract = system.state.contracts[contract_id]
     contract_kind = contract.kind
     contract_amount = getattr(contract, "amount", 0)
+    journal = system.state.journal
 
     # For secondary market transfers (e.g., payables sold to dealers),
     # remove from the effective holder, not the original asset_holder_id
     effective_holder_id = getattr(contract, 'effective_creditor', None) or contract.asset_holder_id
     effective_holder = system.state.agents.get(effective_holder_id)
     if effective_holder and contract_id in effective_holder.asset_ids:
-        effective_holder.asset_ids.remove(contract_id)
+        system._detach_asset(effective_holder, contract)
 
     # Also check original asset_holder in case it wasn't transferred properly
     if effective_holder_id != contract.asset_holder_id:
         original_holder = system.state.agents.get(contract.asset_holder_id)
         if original_holder and contract_id in original_holder.asset_ids:
-            original_holder.asset_ids.remove(contract_id)
+            system._detach_asset(original_holder, contract)
 
     liability_issuer = system.state.agents[contract.liability_issuer_id]
     if contract_id in liability_issuer.liability_ids:
-        liability_issuer.liability_ids.remove(contract_id)
+        journal.remove(liability_issuer.liability_ids, contract_id)
 
-    del system.state.contracts[contract_id]
+    system._unregister_contract(contract_id)
 
     if contract_kind == "cash":
-        system.state.cb_cash_outstanding -= contract_amount
+        system._adjust_state("cb_cash_outstanding", -contract_amount)
     elif contract_kind == "reserve_deposit":
-        system.state.cb_reserves_outstanding -= contract_amount
+        system._adjust_state("cb_reserves_outstanding", -contract_amount)
 
 
 def _action_references_agent(action_dict, agent_id: str) -> bool:
@@ -237,6 +218,89 @@ def _action_references_agent(action_dict, agent_id: str) -> bool:
     return False
 
 
+def _action_ref_keys(action_dict) -> set[str]:
+    """Agent ids, contract ids and aliases that a scheduled action may reference."""
+    keys: set[str] = set()
+    if not isinstance(action_dict, dict) or len(action_dict) != 1:
+        return keys
+
+    action_name, payload = next(iter(action_dict.items()))
+    if not isinstance(payload, dict):
+        return keys
+
+    for field in _ACTION_AGENT_FIELDS.get(action_name, ()):
+        value = payload.get(field)
+        if isinstance(value, str):
+            keys.add(value)
+        elif isinstance(value, list):
+            keys.update(v for v in value if isinstance(v, str))
+    for field in (*_ACTION_CONTRACT_FIELDS.get(action_name, ()), "contract_id", "contract_alias", "alias"):
+        value = payload.get(field)
+        if isinstance(value, str):
+            keys.add(value)
+    return keys
+
+
+def schedule_action(system, day: int, action_dict) -> None:
+    """Stage ``action_dict`` to run at Phase B1 of ``day``.
+
+    Scheduled actions must be staged through this function (or removed by
+    the default cancellation below) so the reference index on State stays
+    in step with scheduled_actions_by_day.
+    """
+    state = system.state
+    journal = state.journal
+    actions = state.scheduled_actions_by_day.get(day)
+    if actions is None:
+        journal.setitem(state.scheduled_actions_by_day, day, [action_dict])
+    else:
+        journal.append(actions, action_dict)
+
+    refs = state.scheduled_refs_by_day.get(day)
+    if refs is None:
+        refs = set()
+        journal.setitem(state.scheduled_refs_by_day, day, refs)
+    for key in _action_ref_keys(action_dict):
+        if key in refs:
+            continue
+        journal.add(refs, key)
+        days = state.scheduled_days_by_ref.get(key)
+        if days is None:
+            journal.setitem(state.scheduled_days_by_ref, key, {day})
+        else:
+            journal.add(days, day)
+
+
+def _reindex_scheduled_day(system, day: int) -> None:
+    """Re-derive the reference index entry of ``day`` from its remaining actions."""
+    state = system.state
+    journal = state.journal
+    refs_by_day = state.scheduled_refs_by_day
+    days_by_ref = state.scheduled_days_by_ref
+
+    refs: set[str] = set()
+    for action_dict in state.scheduled_actions_by_day.get(day, ()):
+        refs |= _action_ref_keys(action_dict)
+    old = refs_by_day.get(day, set())
+    for key in old - refs:
+        days = days_by_ref[key]
+        if len(days) == 1:
+            journal.delitem(days_by_ref, key)
+        else:
+            days.discard(day)
+            journal.record(lambda days=days: days.add(day))
+    for key in refs - old:
+        days = days_by_ref.get(key)
+        if days is None:
+            journal.setitem(days_by_ref, key, {day})
+        else:
+            journal.add(days, day)
+    if refs:
+        journal.setitem(refs_by_day, day, refs)
+    elif day in refs_by_day:
+        journal.delitem(refs_by_day, day)
+
+
 def _cancel_scheduled_actions_for_agent(
     system,
     agent_id: str,
@@ -249,7 +313,19 @@ def _cancel_scheduled_actions_for_agent(
     if not system.state.scheduled_actions_by_day:
         return
 
-    for day, actions in list(system.state.scheduled_actions_by_day.items()):
+    days_by_ref = system.state.scheduled_days_by_ref
+    days: set[int] = set()
+    for key in {agent_id} | cancelled_contract_ids | cancelled_aliases:
+        days |= days_by_ref.get(key, set())
+    if not days:
+        return
+
+    journal = system.state.journal
+    scheduled = system.state.scheduled_actions_by_day
+    for day in sorted(days):
+        actions = scheduled.get(day)
+        if actions is None:
+            continue
         remaining = []
         for action_dict in actions:
             if _action_references_agent(action_dict, agent_id) or _action_references_contract(action_dict, cancelled_contract_ids, cancelled_aliases):
@@ -263,10 +339,13 @@ def _cancel_scheduled_actions_for_agent(
                 )
                 continue
             remaining.append(action_dict)
+        if len(remaining) == len(actions):
+            continue
         if remaining:
-            system.state.scheduled_actions_by_day[day] = remaining
+            journal.setitem(system.state.scheduled_actions_by_day, day, remaining)
         else:
-            del system.state.scheduled_actions_by_day[day]
+            journal.delitem(system.state.scheduled_actions_by_day, day)
+        _reindex_scheduled_day(system, day)
 
 
 def _action_references_contract(action_dict, contract_ids: set[str], aliases: set[str]) -> bool:
@@ -317,8 +396,8 @@ def _expel_agent(
     if agent.kind == "central_bank":
         raise DefaultError("Central bank cannot default")
 
-    agent.defaulted = True
-    system.state.defaulted_agent_ids.add(agent_id)
+    system.state.journal.setattr(agent, "defaulted", True)
+    system.state.journal.add(system.state.defaulted_agent_ids, agent_id)
 
     system.log(
         "AgentDefaulted",
@@ -335,10 +414,13 @@ def _expel_agent(
 
     # Remove any aliases provided for already-cancelled contracts
     for alias in list(cancelled_aliases):
-        system.state.aliases.pop(alias, None)
+        system.pop_alias(alias)
 
-    for cid, contract in list(system.state.contracts.items()):
-        if contract.liability_issuer_id != agent_id:
+    contracts = system.state.contracts
+    # The agent's liability list is the issuer index for its obligations
+    for cid in list(agent.liability_ids):
+        contract = contracts.get(cid)
+        if contract is None or contract.liability_issuer_id != agent_id:
             continue
         if trigger_contract_id and cid == trigger_contract_id:
             continue
@@ -364,7 +446,7 @@ def _expel_agent(
         _remove_contract(system, cid)
         cancelled_contract_ids.add(cid)
         if alias:
-            system.state.aliases.pop(alias, None)
+            system.pop_alias(alias)
 
     _cancel_scheduled_actions_for_agent(system, agent_id, cancelled_contract_ids, cancelled_aliases)
 
@@ -458,131 +540,260 @@ def settle_due_delivery_obligations(system, day: int):
             )
 
 
-def settle_due(system, day: int, *, rollover_enabled: bool = False):
-    """Settle all obligations due today (payables and delivery obligations).
+def _pay_with(system, method: str, debtor_id, creditor_id, amount) -> int:
+    """Pay using one means of payment. Returns amount actually paid."""
+    if method == "bank_deposit":
+        return _pay_with_deposits(system, debtor_id, creditor_id, amount)
+    if method == "cash":
+        return _pay_with_cash(system, debtor_id, creditor_id, amount)
+    if method == "reserve_deposit":
+        return _pay_bank_to_bank_with_reserves(system, debtor_id, creditor_id, amount)
+    raise ValidationError(f"unknown payment method {method}")
 
-    Args:
-        system: The system to settle
-        day: Current simulation day
-        rollover_enabled: If True, create new payables for successfully settled ones (Plan 024)
 
-    Returns:
-        List of settled payable info for rollover: [(debtor_id, creditor_id, amount, maturity_distance)]
-    """
-    settled_for_rollover = []
+def _record_payable_settled(system, payable, rollover_enabled: bool, settled_for_rollover: list) -> None:
+    """Remove a fully paid payable, log PayableSettled and queue it for rollover."""
+    debtor_id = payable.liability_issuer_id
+    _remove_contract(system, payable.id)
+    alias = get_alias_for_id(system, payable.id)
+    system.log(
+        "PayableSettled",
+        pid=payable.id,
+        contract_id=payable.id,
+        alias=alias,
+        debtor=debtor_id,
+        creditor=payable.effective_creditor,
+        amount=payable.amount,
+    )
 
-    for payable in list(due_payables(system, day)):
-        if payable.id not in system.state.contracts:
-            continue
+    # Plan 024: Track for rollover (only if successfully settled AND rollover enabled)
+    maturity_distance = getattr(payable, 'maturity_distance', None)
+    if rollover_enabled and maturity_distance is not None:
+        # Use original creditor for rollover, not secondary market holder
+        settled_for_rollover.append((
+            debtor_id,
+            payable.asset_holder_id,
+            payable.amount,
+            maturity_distance,
+        ))
+
+
+def _liquidity(system, agent) -> int:
+    """Means of payment an agent can draw on under its settlement order."""
+    return sum(
+        system.holding_balance(agent.id, method)
+        for method in system.policy.settlement_order(agent)
+        if method in _MEANS_OF_PAYMENT
+    )
 
-        debtor = system.state.agents[payable.liability_issuer_id]
+
+def select_lsm_batch(system, payables) -> list:
+    """Payables that can settle together, each debtor funding only its net outflow.
+
+    Starts from every payable of a non-defaulted debtor and, while some
+    debtor's net outflow within the batch (payables owed minus payables
+    due to it) exceeds its means of payment, drops that debtor's smallest
+    payable (ties by id), keeping as much of the day's value in the batch as
+    possible. Dropping a payable can leave its creditor short
+    in turn, so creditors are re-checked. The result is the largest such
+    fixpoint and does not depend on the order of ``payables``; it is
+    returned in that order.
+    """
+    agents = system.state.agents
+    net: dict[str, int] = {}
+    by_debtor: dict[str, list] = {}
+    batch: set[str] = set()
+    for payable in payables:
+        debtor = agents[payable.liability_issuer_id]
         if getattr(debtor, "defaulted", False):
             continue
+        creditor_id = payable.effective_creditor
+        batch.add(payable.id)
+        net[debtor.id] = net.get(debtor.id, 0) + payable.amount
+        net[creditor_id] = net.get(creditor_id, 0) - payable.amount
+        by_debtor.setdefault(debtor.id, []).append(payable)
+    for owed in by_debtor.values():
+        owed.sort(key=lambda p: (p.amount, p.id), reverse=True)  # smallest last
+
+    liquidity: dict[str, int] = {}
+    pending = sorted(by_debtor, reverse=True)
+    queued = set(pending)
+    while pending:
+        agent_id = pending.pop()
+        queued.discard(agent_id)
+        if agent_id not in liquidity:
+            liquidity[agent_id] = _liquidity(system, agents[agent_id])
+        owed = by_debtor[agent_id]
+        while owed and net[agent_id] > liquidity[agent_id]:
+            payable = owed.pop()
+            batch.discard(payable.id)
+            creditor_id = payable.effective_creditor
+            net[agent_id] -= payable.amount
+            net[creditor_id] += payable.amount
+            if by_debtor.get(creditor_id) and creditor_id not in queued:
+                pending.append(creditor_id)
+                queued.add(creditor_id)
+
+    return [p for p in payables if p.id in batch]
+
+
+def settle_lsm_batch(system, payables, rollover_enabled: bool, settled_for_rollover: list) -> int:
+    """Settle the payables selected by select_lsm_batch as one atomic batch.
+
+    Offsetting obligations cancel out: only each agent's net position moves,
+    from net payers to net receivers (see clearing.match_net_positions),
+    using the payer's settlement order. If any of those payments falls
+    short, or raises a ValidationError or DefaultError, the batch is rolled
+    back and nothing is settled, leaving the payables to the sequential
+    pass. Returns the number of payables settled.
+    """
+    batch = select_lsm_batch(system, payables)
+    if not batch:
+        return 0
 
-        # Use effective_creditor to handle secondary market transfers
-        # (holder_id if transferred, otherwise original asset_holder_id)
+    positions: dict[str, int] = {}
+    for payable in batch:
+        debtor_id = payable.liability_issuer_id
         creditor_id = payable.effective_creditor
-        creditor = system.state.agents[creditor_id]
-        order = system.policy.settlement_order(debtor)
+        positions[debtor_id] = positions.get(debtor_id, 0) + payable.amount
+        positions[creditor_id] = positions.get(creditor_id, 0) - payable.amount
+    transfers = match_net_positions(positions)
 
-        remaining = payable.amount
-        payments_summary: list[dict] = []
+    agents = system.state.agents
+    try:
+        with atomic(system):
+            for payer_id, receiver_id, amount in transfers:
+                remaining = amount
+                for method in system.policy.settlement_order(agents[payer_id]):
+                    if remaining == 0:
+                        break
+                    remaining -= _pay_with(system, method, payer_id, receiver_id, remaining)
+                if remaining != 0:
+                    raise ValidationError(f"{payer_id} could not pay {remaining} of its net position")
 
-        # Save payable info before potential removal
-        payable_amount = payable.amount
-        payable_maturity_distance = getattr(payable, 'maturity_distance', None)
-        original_creditor = payable.asset_holder_id  # Original creditor for rollover
+            system.log(
+                "SettlementBatch",
+                payables=len(batch),
+                gross_amount=sum(p.amount for p in batch),
+                net_amount=sum(amount for _, _, amount in transfers),
+            )
+            for payable in batch:
+                _record_payable_settled(system, payable, rollover_enabled, settled_for_rollover)
+    except (ValidationError, DefaultError):
+        return 0
+    return len(batch)
 
-        with atomic(system):
-            for method in order:
-                if remaining == 0:
-                    break
-
-                if method == "bank_deposit":
-                    paid_now = _pay_with_deposits(system, debtor.id, creditor.id, remaining)
-                elif method == "cash":
-                    paid_now = _pay_with_cash(system, debtor.id, creditor.id, remaining)
-                elif method == "reserve_deposit":
-                    paid_now = _pay_bank_to_bank_with_reserves(system, debtor.id, creditor.id, remaining)
-                else:
-                    raise ValidationError(f"unknown payment method {method}")
-
-                remaining -= paid_now
-                if paid_now > 0:
-                    payments_summary.append({"method": method, "amount": paid_now})
-
-            if remaining != 0:
-                if _get_default_mode(system) == DEFAULT_MODE_FAIL_FAST:
-                    raise DefaultError(f"Insufficient funds to settle payable {payable.id}: {remaining} still owed")
 
-                alias = get_alias_for_id(system, payable.id)
-                cancelled_contract_ids = {payable.id}
-                cancelled_aliases = {alias} if alias else set()
-                amount_paid = payable.amount - remaining
-
-                if amount_paid > 0:
-                    payload = {
-                        "contract_id": payable.id,
-                        "alias": alias,
-                        "debtor": debtor.id,
-                        "creditor": creditor.id,
-                        "contract_kind": payable.kind,
-                        "settlement_kind": "payable",
-                        "amount_paid": amount_paid,
-                        "shortfall": remaining,
-                        "original_amount": payable.amount,
-                    }
-                    if payments_summary:
-                        payload["distribution"] = payments_summary
-                    system.log("PartialSettlement", **payload)
+def _settle_payable(system, payable, rollover_enabled: bool, settled_for_rollover: list) -> None:
+    """Settle one due payable on its own, defaulting the debtor on a shortfall."""
+    if payable.id not in system.state.contracts:
+        return
 
-                system.log(
-                    "ObligationDefaulted",
-                    contract_id=payable.id,
-                    alias=alias,
-                    debtor=debtor.id,
-                    creditor=creditor.id,
-                    contract_kind=payable.kind,
-                    shortfall=remaining,
-                    amount_paid=amount_paid,
-                    original_amount=payable.amount,
-                    amount=remaining,
-                )
+    debtor = system.state.agents[payable.liability_issuer_id]
+    if getattr(debtor, "defaulted", False):
+        return
 
-                _remove_contract(system, payable.id)
-                _expel_agent(
-                    system,
-                    debtor.id,
-                    trigger_contract_id=payable.id,
-                    trigger_kind=payable.kind,
-                    trigger_shortfall=remaining,
-                    cancelled_contract_ids=cancelled_contract_ids,
-                    cancelled_aliases=cancelled_aliases,
-                )
-                # Defaulted - no rollover
-                continue
+    # Use effective_creditor to handle secondary market transfers
+    # (holder_id if transferred, otherwise original asset_holder_id)
+    creditor_id = payable.effective_creditor
+    creditor = system.state.agents[creditor_id]
+    order = system.policy.settlement_order(debtor)
+
+    remaining = payable.amount
+    payments_summary: list[dict] = []
+
+    with atomic(system):
+        for method in order:
+            if remaining == 0:
+                break
+
+            paid_now = _pay_with(system, method, debtor.id, creditor.id, remaining)
+            remaining -= paid_now
+            if paid_now > 0:
+                payments_summary.append({"method": method, "amount": paid_now})
+
+        if remaining != 0:
+            if _get_default_mode(system) == DEFAULT_MODE_FAIL_FAST:
+                raise DefaultError(f"Insufficient funds to settle payable {payable.id}: {remaining} still owed")
 
-            _remove_contract(system, payable.id)
             alias = get_alias_for_id(system, payable.id)
+            cancelled_contract_ids = {payable.id}
+            cancelled_aliases = {alias} if alias else set()
+            amount_paid = payable.amount - remaining
+
+            if amount_paid > 0:
+                payload = {
+                    "contract_id": payable.id,
+                    "alias": alias,
+                    "debtor": debtor.id,
+                    "creditor": creditor.id,
+                    "contract_kind": payable.kind,
+                    "settlement_kind": "payable",
+                    "amount_paid": amount_paid,
+                    "shortfall": remaining,
+                    "original_amount": payable.amount,
+                }
+                if payments_summary:
+                    payload["distribution"] = payments_summary
+                system.log("PartialSettlement", **payload)
+
             system.log(
-                "PayableSettled",
-                pid=payable.id,
+                "ObligationDefaulted",
                 contract_id=payable.id,
                 alias=alias,
                 debtor=debtor.id,
                 creditor=creditor.id,
-                amount=payable_amount,
+                contract_kind=payable.kind,
+                shortfall=remaining,
+                amount_paid=amount_paid,
+                original_amount=payable.amount,
+                amount=remaining,
             )
 
-            # Plan 024: Track for rollover (only if successfully settled AND rollover enabled)
-            if rollover_enabled and payable_maturity_distance is not None:
-                # Use original creditor for rollover, not secondary market holder
-                settled_for_rollover.append((
-                    debtor.id,
-                    original_creditor,
-                    payable_amount,
-                    payable_maturity_distance,
-                ))
+            _remove_contract(system, payable.id)
+            _expel_agent(
+                system,
+                debtor.id,
+                trigger_contract_id=payable.id,
+                trigger_kind=payable.kind,
+                trigger_shortfall=remaining,
+                cancelled_contract_ids=cancelled_contract_ids,
+                cancelled_aliases=cancelled_aliases,
+            )
+            # Defaulted - no rollover
+            return
+
+        _record_payable_settled(system, payable, rollover_enabled, settled_for_rollover)
+
+
+def settle_due(system, day: int, *, rollover_enabled: bool = False, mode: str | None = None):
+    """Settle all obligations due today (payables and delivery obligations).
+
+    Args:
+        system: The system to settle
+        day: Current simulation day
+        rollover_enabled: If True, create new payables for successfully settled ones (Plan 024)
+        mode: "sequential" settles payables one by one in due order; "lsm" first
+            settles the largest batch of payables that can settle together
+            (see settle_lsm_batch), then the rest sequentially. Defaults to
+            system.state.settlement_mode.
+
+    Returns:
+        List of settled payable info for rollover: [(debtor_id, creditor_id, amount, maturity_distance)]
+    """
+    if mode is None:
+        mode = system.state.settlement_mode
+    if mode not in (SETTLEMENT_MODE_SEQUENTIAL, SETTLEMENT_MODE_LSM):
+        raise ValueError(f"Unknown settlement mode: {mode}")
+
+    settled_for_rollover = []
+
+    payables = list(due_payables(system, day))
+    if mode == SETTLEMENT_MODE_LSM:
+        settle_lsm_batch(system, payables, rollover_enabled, settled_for_rollover)
+
+    for payable in payables:
+        _settle_payable(system, payable, rollover_enabled, settled_for_rollover)
 
     settle_due_delivery_obligations(system, day)
 
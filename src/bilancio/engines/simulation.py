@@ -1,19 +1,13 @@
 """Simulation engines for financial scenario analysis."""
 
 import random
+from contextlib import nullcontext
 from dataclasses import dataclass
 from typing import Any, Protocol
 
 from bilancio.engines.clearing import settle_intraday_nets
 from bilancio.engines.settlement import settle_due, rollover_settled_payables
-
-
-IMPACT_EVENTS = {
-    "PayableSettled",
-    "DeliveryObligationSettled",
-    "InterbankCleared",
-    "InterbankOvernightCreated",
-}
+from bilancio.engines.system import IMPACT_EVENTS  # noqa: F401  (re-exported)
 
 
 @dataclass
@@ -24,14 +18,13 @@ class DayReport:
 
 
 def _impacted_today(system, day: int) -> int:
-    return sum(1 for e in system.state.events if e.get("day") == day and e.get("kind") in IMPACT_EVENTS)
+    # Counted by System.log as IMPACT_EVENTS are logged
+    return system.state.impacted_by_day.get(day, 0)
 
 
 def _has_open_obligations(system) -> bool:
-    for c in system.state.contracts.values():
-        if c.kind in ("payable", "delivery_obligation"):
-            return True
-    return False
+    # Maintained by the contract registry on add/remove
+    return system.state.open_obligations > 0
 
 
 class SimulationEngine(Protocol):
@@ -137,56 +130,69 @@ def run_day(system, enable_dealer: bool = False):
         system: System instance to run the day for
         enable_dealer: If True, run dealer trading phase between scheduled actions and settlements
 
-    Note: Rollover is controlled by system.state.rollover_enabled (Plan 024)
+    Note: Rollover is controlled by system.state.rollover_enabled (Plan 024).
+    If ``system.phase_timer`` is set (see engines.instrumentation), each phase
+    is timed and counted.
     """
     current_day = system.state.day
     rollover_enabled = getattr(system.state, 'rollover_enabled', False)
+    timer = getattr(system, 'phase_timer', None)
+
+    def phase(name: str):
+        # Per-phase counters when a PhaseTimer is attached, otherwise a no-op
+        if timer is None:
+            return nullcontext()
+        return timer.phase(system, current_day, name)
 
     # Phase A: Log PhaseA event (reserved)
-    system.log("PhaseA")
+    with phase("PhaseA"):
+        system.log("PhaseA")
 
     # Phase B: two subphases — B1 scheduled actions, B2 settlements
-    system.log("PhaseB")  # Phase B bucket marker
-    # B1: Execute scheduled actions for this day (if any)
-    system.log("SubphaseB1")
-    try:
-        actions_today = system.state.scheduled_actions_by_day.get(current_day, [])
-        if actions_today:
-            # Lazy import to avoid heavy imports at module load
-            from bilancio.config.apply import apply_action
-            agents = system.state.agents
-            for action_dict in actions_today:
-                apply_action(system, action_dict, agents)
-    except Exception:
-        # Allow scheduled-action errors to bubble via apply_action's own error handling
-        # but keep guard to ensure the simulation loop stability
-        raise
+    with phase("SubphaseB1"):
+        system.log("PhaseB")  # Phase B bucket marker
+        # B1: Execute scheduled actions for this day (if any)
+        system.log("SubphaseB1")
+        try:
+            if system.state.scheduled_actions_by_day.get(current_day):
+                # Lazy import to avoid heavy imports at module load
+                from bilancio.config.apply import compiled_actions_for_day
+                for action in compiled_actions_for_day(system, current_day):
+                    action(system)
+        except Exception:
+            # Allow scheduled-action errors to bubble via the compiled action's own error handling
+            # but keep guard to ensure the simulation loop stability
+            raise
 
     # SubphaseB_Dealer: Run dealer trading phase (optional)
     if enable_dealer and hasattr(system.state, 'dealer_subsystem') and system.state.dealer_subsystem is not None:
-        system.log("SubphaseB_Dealer")
-        # Lazy import to avoid circular dependencies
-        from bilancio.engines.dealer_integration import run_dealer_trading_phase, sync_dealer_to_system
+        with phase("SubphaseB_Dealer"):
+            system.log("SubphaseB_Dealer")
+            # Lazy import to avoid circular dependencies
+            from bilancio.engines.dealer_integration import run_dealer_trading_phase, sync_dealer_to_system
 
-        # Run dealer trading and collect events
-        dealer_events = run_dealer_trading_phase(system.state.dealer_subsystem, system, current_day)
-        system.state.events.extend(dealer_events)
+            # Run dealer trading and collect events
+            dealer_events = run_dealer_trading_phase(system.state.dealer_subsystem, system, current_day)
+            system.log_events(dealer_events)
 
-        # Sync dealer state back to main system
-        sync_dealer_to_system(system.state.dealer_subsystem, system)
+            # Sync dealer state back to main system
+            sync_dealer_to_system(system.state.dealer_subsystem, system)
 
     # B2: Automated settlements due today
-    system.log("SubphaseB2")
-    settled_for_rollover = settle_due(system, current_day, rollover_enabled=rollover_enabled)
+    with phase("SubphaseB2"):
+        system.log("SubphaseB2")
+        settled_for_rollover = settle_due(system, current_day, rollover_enabled=rollover_enabled)
 
     # Plan 024: Rollover - create new payables for settled ones
     if rollover_enabled and settled_for_rollover:
-        system.log("SubphaseB_Rollover")
-        rollover_settled_payables(system, current_day, settled_for_rollover)
+        with phase("SubphaseB_Rollover"):
+            system.log("SubphaseB_Rollover")
+            rollover_settled_payables(system, current_day, settled_for_rollover)
 
     # Phase C: Clear intraday nets for the current day
-    system.log("PhaseC")  # optional: helps timeline
-    settle_intraday_nets(system, current_day)
+    with phase("PhaseC"):
+        system.log("PhaseC")  # optional: helps timeline
+        settle_intraday_nets(system, current_day)
 
     # Increment system day
     system.state.day += 1
@@ -3,10 +3,12 @@ from __future__ import annotations
 from contextlib import contextmanager
 from dataclasses import dataclass, field
 from decimal import Decimal
+from typing import Any, Iterable
 
-from bilancio.core.atomic_tx import atomic
+from bilancio.core.atomic_tx import UndoLog, atomic
 from bilancio.core.errors import ValidationError
-from bilancio.core.ids import AgentId, InstrId, new_id
+from bilancio.core.events import EventStore
+from bilancio.core.ids import AgentId, IdAllocator, IdList, InstrId
 from bilancio.domain.agent import Agent
 from bilancio.domain.instruments.base import Instrument
 from bilancio.domain.instruments.cb_loan import CBLoan
@@ -14,39 +16,132 @@ from bilancio.domain.instruments.means_of_payment import Cash, ReserveDeposit
 from bilancio.domain.instruments.delivery import DeliveryObligation
 from bilancio.domain.goods import StockLot
 from bilancio.domain.policy import PolicyEngine
+from bilancio.ops.aliases import AliasMap
 from bilancio.ops.primitives import consume, merge, split
 from bilancio.ops.primitives_stock import split_stock, merge_stock
 
+# Contract kinds settled on their due_day (indexed in State.due_index)
+DUE_KINDS = ("payable", "delivery_obligation")
+# Event kinds that count as activity for the stability check in run_until_stable
+IMPACT_EVENTS = frozenset({
+    "PayableSettled",
+    "DeliveryObligationSettled",
+    "InterbankCleared",
+    "InterbankOvernightCreated",
+})
+# Means-of-payment kinds tracked per holder in State.holdings
+HOLDING_KINDS = ("cash", "bank_deposit", "reserve_deposit")
+
+
+@dataclass(slots=True)
+class Holding:
+    """Contract ids and running balance of one holder's means of payment of a kind."""
+    ids: IdList = field(default_factory=IdList)
+    balance: int = 0
+
+
+def _index_add(journal: UndoLog, index: dict, key, contract_id: InstrId) -> None:
+    bucket = index.get(key)
+    if bucket is None:
+        bucket = {}
+        journal.setitem(index, key, bucket)
+    journal.setitem(bucket, contract_id, None)
+
+
+def _index_discard(journal: UndoLog, index: dict, key, contract_id: InstrId) -> None:
+    bucket = index.get(key)
+    if bucket is None or contract_id not in bucket:
+        return
+    journal.delitem(bucket, contract_id)
+    if not bucket:
+        journal.delitem(index, key)
+
 
 @dataclass
 class State:
     agents: dict[AgentId, Agent] = field(default_factory=dict)
     contracts: dict[InstrId, Instrument] = field(default_factory=dict)
     stocks: dict[InstrId, StockLot] = field(default_factory=dict)
-    events: list[dict] = field(default_factory=list)
+    events: EventStore = field(default_factory=EventStore)
     day: int = 0
     cb_cash_outstanding: int = 0
     cb_reserves_outstanding: int = 0
     cb_loans_outstanding: int = 0  # Total CB loans to banks (principal)
     phase: str = "simulation"
-    # Aliases for created contracts (alias -> contract_id)
-    aliases: dict[str, str] = field(default_factory=dict)
+    # Aliases for created contracts (alias -> contract_id, with reverse index)
+    aliases: AliasMap = field(default_factory=AliasMap)
     # Scheduled actions to run at Phase B1 by day (day -> list of action dicts)
     scheduled_actions_by_day: dict[int, list[dict]] = field(default_factory=dict)
+    # Reference index over scheduled_actions_by_day, used when cancelling a
+    # defaulted agent's actions. Maintained by settlement.schedule_action and
+    # the cancellation rewrite:
+    # day -> agent/contract ids and aliases its actions reference
+    scheduled_refs_by_day: dict[int, set[str]] = field(default_factory=dict, repr=False)
+    # referenced agent/contract id or alias -> days with such actions
+    scheduled_days_by_ref: dict[str, set[int]] = field(default_factory=dict, repr=False)
+    # Parsed scheduled actions bound to their handlers, revalidated per day on
+    # use: day -> (action list, its length, list of CompiledAction)
+    compiled_actions_by_day: dict[int, tuple] = field(default_factory=dict, repr=False)
     # Track agents that have defaulted and been expelled from future activity
     defaulted_agent_ids: set[AgentId] = field(default_factory=set)
     # Plan 024: Enable continuous rollover of settled payables
     rollover_enabled: bool = False
+    # Keep one cash/reserve record per (holder, issuer, denom), debited and
+    # credited in place, instead of splitting and merging pieces on transfer
+    pooled_holdings: bool = False
+    # Phase C: "bilateral" settles each bank pair, "multilateral" each bank's net position
+    clearing_mode: str = "bilateral"
+    # Phase B2: "sequential" settles payables one by one, "lsm" batches those that can settle together
+    settlement_mode: str = "sequential"
+    # Open payables/delivery obligations by due day (due_day -> ordered set of ids)
+    due_index: dict[int, dict[InstrId, None]] = field(default_factory=dict)
+    # Contract ids by instrument kind (kind -> ordered set of ids)
+    kind_index: dict[str, dict[InstrId, None]] = field(default_factory=dict)
+    # Means-of-payment holdings keyed by (holder, kind) and (holder, kind, issuer)
+    holdings: dict[tuple, Holding] = field(default_factory=dict)
+    # Bilateral interbank nets from today's client payments, consumed by
+    # Phase C: day -> {(bank_a, bank_b): net}, a < b, net > 0 means a owes b
+    intraday_nets: dict[int, dict[tuple[AgentId, AgentId], int]] = field(default_factory=dict)
+    # Number of IMPACT_EVENTS logged per day (day -> count)
+    impacted_by_day: dict[int, int] = field(default_factory=dict)
+    # Number of open payables and delivery obligations
+    open_obligations: int = 0
+    # Outstanding amount of each means-of-payment kind (kind -> total)
+    amount_totals: dict[str, int] = field(default_factory=dict)
+    # Contracts registered/unregistered so far, rolled-back work included
+    # (operation counts for instrumentation, not balances)
+    contracts_created: int = 0
+    contracts_removed: int = 0
+    # Contracts, agents and stock lots touched since the last invariant check
+    dirty_contracts: dict[InstrId, None] = field(default_factory=dict, repr=False)
+    dirty_agents: dict[AgentId, None] = field(default_factory=dict, repr=False)
+    dirty_stocks: dict[InstrId, None] = field(default_factory=dict, repr=False)
+    # Undo journal backing atomic() transactions
+    journal: UndoLog = field(default_factory=UndoLog, repr=False, compare=False)
 
 class System:
-    def __init__(self, policy: PolicyEngine | None = None, default_mode: str = "fail-fast"):
+    def __init__(self, policy: PolicyEngine | None = None, default_mode: str = "fail-fast",
+                 compact_ids: bool = False):
         self.policy = policy or PolicyEngine.default()
         self.state = State()
         self.default_mode = default_mode
+        # Deterministic ids: same inputs -> same ids, events and artifacts
+        self.ids = IdAllocator(compact=compact_ids)
+        # Optional engines.instrumentation.PhaseTimer used by run_day
+        self.phase_timer = None
 
     # ---- ID helpers
-    def new_agent_id(self, prefix="A") -> AgentId: return new_id(prefix)
-    def new_contract_id(self, prefix="C") -> InstrId: return new_id(prefix)
+    def _new_id(self, prefix: str) -> str:
+        state = self.state
+        while True:
+            candidate = self.ids.next(prefix)
+            # Skip ids already taken by explicitly named agents/contracts/stocks
+            if candidate not in state.contracts and candidate not in state.agents and candidate not in state.stocks:
+                return candidate
+
+    def new_agent_id(self, prefix="A") -> AgentId: return self._new_id(prefix)
+    def new_contract_id(self, prefix="C") -> InstrId: return self._new_id(prefix)
+    def new_stock_id(self, prefix="S") -> InstrId: return self._new_id(prefix)
 
     # ---- phase management
     @contextmanager
@@ -61,7 +156,11 @@ class System:
 
     # ---- registry gateway
     def add_agent(self, agent: Agent) -> None:
-        self.state.agents[agent.id] = agent
+        for name in ("asset_ids", "liability_ids", "stock_ids"):
+            if not isinstance(getattr(agent, name), IdList):
+                setattr(agent, name, IdList(getattr(agent, name)))
+        self.state.journal.setitem(self.state.agents, agent.id, agent)
+        self.state.dirty_agents[agent.id] = None
 
     def add_contract(self, c: Instrument) -> None:
         # type invariants
@@ -74,41 +173,262 @@ class System:
         if not self.policy.can_issue(issuer, c):
             raise ValidationError(f"{issuer.kind} cannot issue {c.kind}")
 
-        self.state.contracts[c.id] = c
-        holder.asset_ids.append(c.id)
-        issuer.liability_ids.append(c.id)
+        self._register_contract(c)
+        self._attach_asset(holder, c)
+        self.state.journal.append(issuer.liability_ids, c.id)
+
+    def remove_contract(self, contract_id: InstrId) -> Instrument:
+        """Detach a contract from its holder and issuer and drop it from the registry."""
+        c = self.state.contracts[contract_id]
+        self._detach_asset(self.state.agents[c.asset_holder_id], c)
+        self.state.journal.remove(self.state.agents[c.liability_issuer_id].liability_ids, contract_id)
+        self._unregister_contract(contract_id)
+        return c
+
+    def _register_contract(self, c: Instrument) -> None:
+        """Insert a contract into the registry and its kind/due-day indexes."""
+        journal = self.state.journal
+        journal.setitem(self.state.contracts, c.id, c)
+        self.state.contracts_created += 1
+        _index_add(journal, self.state.kind_index, c.kind, c.id)
+        if c.kind in DUE_KINDS:
+            _index_add(journal, self.state.due_index, c.due_day, c.id)
+            self._adjust_state("open_obligations", 1)
+        elif c.kind in HOLDING_KINDS:
+            self._adjust_total(c.kind, c.amount)
+        self._mark_dirty(c)
+
+    def _unregister_contract(self, contract_id: InstrId) -> Instrument:
+        """Drop a contract from the registry and its indexes (agent lists untouched)."""
+        journal = self.state.journal
+        c = journal.delitem(self.state.contracts, contract_id)
+        self.state.contracts_removed += 1
+        _index_discard(journal, self.state.kind_index, c.kind, contract_id)
+        if c.kind in DUE_KINDS:
+            _index_discard(journal, self.state.due_index, c.due_day, contract_id)
+            self._adjust_state("open_obligations", -1)
+        elif c.kind in HOLDING_KINDS:
+            self._adjust_total(c.kind, -c.amount)
+        self._mark_dirty(c)
+        return c
+
+    def contract_ids_due(self, day: int) -> list[InstrId]:
+        """Ids of open payables and delivery obligations with due_day == day."""
+        return list(self.state.due_index.get(day, ()))
+
+    def contract_ids_of_kind(self, kind: str) -> list[InstrId]:
+        """Ids of all contracts of the given kind, in registry order."""
+        return list(self.state.kind_index.get(kind, ()))
+
+    def set_amount(self, c: Instrument, amount: int) -> None:
+        """Set a contract's amount in place."""
+        journal = self.state.journal
+        if c.kind in HOLDING_KINDS:
+            delta = amount - c.amount
+            for h in self._holdings_for(c.asset_holder_id, c):
+                journal.setattr(h, "balance", h.balance + delta)
+            self._adjust_total(c.kind, delta)
+        journal.setattr(c, "amount", amount)
+        self.state.dirty_contracts[c.id] = None
+
+    def move_asset(self, contract_id: InstrId, from_agent_id: AgentId, to_agent_id: AgentId) -> None:
+        """Reassign a contract's asset side from one holder to another."""
+        c = self.state.contracts[contract_id]
+        self._detach_asset(self.state.agents[from_agent_id], c)
+        self.state.journal.setattr(c, "asset_holder_id", to_agent_id)
+        self._attach_asset(self.state.agents[to_agent_id], c)
+
+    # ---- holdings index
+    def _holdings_for(self, agent_id: AgentId, c: Instrument) -> tuple[Holding, Holding]:
+        """Return the (holder, kind) and (holder, kind, issuer) holdings for a contract."""
+        holdings = self.state.holdings
+        key = (agent_id, c.kind)
+        key_by_issuer = (agent_id, c.kind, c.liability_issuer_id)
+        h = holdings.get(key)
+        if h is None:
+            h = holdings[key] = Holding()
+        h_by_issuer = holdings.get(key_by_issuer)
+        if h_by_issuer is None:
+            h_by_issuer = holdings[key_by_issuer] = Holding()
+        return h, h_by_issuer
+
+    def _attach_asset(self, agent: Agent, c: Instrument) -> None:
+        """Append a contract to an agent's assets and its holdings index."""
+        journal = self.state.journal
+        journal.append(agent.asset_ids, c.id)
+        self.state.dirty_agents[agent.id] = None
+        self.state.dirty_contracts[c.id] = None
+        if c.kind in HOLDING_KINDS:
+            for h in self._holdings_for(agent.id, c):
+                journal.append(h.ids, c.id)
+                journal.setattr(h, "balance", h.balance + c.amount)
+
+    def _detach_asset(self, agent: Agent, c: Instrument) -> None:
+        """Remove a contract from an agent's assets and its holdings index."""
+        journal = self.state.journal
+        journal.remove(agent.asset_ids, c.id)
+        self.state.dirty_agents[agent.id] = None
+        self.state.dirty_contracts[c.id] = None
+        if c.kind in HOLDING_KINDS:
+            for h in self._holdings_for(agent.id, c):
+                journal.remove(h.ids, c.id)
+                journal.setattr(h, "balance", h.balance - c.amount)
+
+    def holding_ids(self, agent_id: AgentId, kind: str, issuer_id: AgentId | None = None) -> list[InstrId]:
+        """Ids of an agent's cash/deposit/reserve contracts, optionally for one issuer."""
+        key = (agent_id, kind) if issuer_id is None else (agent_id, kind, issuer_id)
+        h = self.state.holdings.get(key)
+        return list(h.ids) if h is not None else []
+
+    def first_holding_id(self, agent_id: AgentId, kind: str, issuer_id: AgentId | None = None) -> InstrId | None:
+        """Id of an agent's oldest cash/deposit/reserve contract (optionally for one issuer), or None."""
+        key = (agent_id, kind) if issuer_id is None else (agent_id, kind, issuer_id)
+        h = self.state.holdings.get(key)
+        return h.ids.first() if h is not None and h.ids else None
+
+    def holding_balance(self, agent_id: AgentId, kind: str, issuer_id: AgentId | None = None) -> int:
+        """Total amount of an agent's cash/deposit/reserve contracts, optionally for one issuer."""
+        key = (agent_id, kind) if issuer_id is None else (agent_id, kind, issuer_id)
+        h = self.state.holdings.get(key)
+        return h.balance if h is not None else 0
+
+    def set_alias(self, alias: str, contract_id: InstrId) -> None:
+        self.state.journal.setitem(self.state.aliases, alias, contract_id)
+
+    def pop_alias(self, alias: str) -> InstrId | None:
+        if alias not in self.state.aliases:
+            return None
+        return self.state.journal.delitem(self.state.aliases, alias)
+
+    def _adjust_state(self, name: str, delta: int) -> None:
+        """Add ``delta`` to a numeric State counter (e.g. cb_cash_outstanding)."""
+        self.state.journal.setattr(self.state, name, getattr(self.state, name) + delta)
+
+    def _adjust_total(self, kind: str, delta: int) -> None:
+        totals = self.state.amount_totals
+        self.state.journal.setitem(totals, kind, totals.get(kind, 0) + delta)
+
+    # ---- dirty tracking for incremental invariant checks
+    def _mark_dirty(self, c: Instrument) -> None:
+        """Record a contract and both of its counterparties as touched."""
+        state = self.state
+        state.dirty_contracts[c.id] = None
+        state.dirty_agents[c.asset_holder_id] = None
+        state.dirty_agents[c.liability_issuer_id] = None
+
+    def _mark_stock_dirty(self, stock_id: InstrId, *owner_ids: AgentId) -> None:
+        state = self.state
+        state.dirty_stocks[stock_id] = None
+        for owner_id in owner_ids:
+            state.dirty_agents[owner_id] = None
 
     # ---- events
     def log(self, kind: str, **payload) -> None:
-        self.state.events.append({"kind": kind, "day": self.state.day, "phase": self.state.phase, **payload})
+        state = self.state
+        state.journal.append(
+            state.events,
+            {"kind": kind, "day": state.day, "phase": state.phase, **payload},
+        )
+        if kind in IMPACT_EVENTS:
+            self._count_impact(state.day)
+
+    def log_events(self, events: Iterable[dict[str, Any]]) -> None:
+        """Append already-built event dicts (e.g. from the dealer subsystem).
+
+        Unlike extending ``state.events`` directly, this keeps the
+        ``impacted_by_day`` counter in step with the log.
+        """
+        state = self.state
+        for event in events:
+            state.journal.append(state.events, event)
+            if event.get("kind") in IMPACT_EVENTS:
+                self._count_impact(event.get("day", state.day))
+
+    def _count_impact(self, day: int) -> None:
+        counts = self.state.impacted_by_day
+        self.state.journal.setitem(counts, day, counts.get(day, 0) + 1)
+
+    def record_interbank_payment(
+        self, payer_bank: AgentId, payee_bank: AgentId, amount: int
+    ) -> None:
+        """
+        Add a cross-bank client payment to today's bilateral net accumulator.
+
+        Called by ``client_payment`` for every ClientPayment it logs, so Phase C
+        does not have to rediscover the day's flows from the event log. Updates
+        go through the undo journal and are rolled back with the payment.
+
+        Convention (as in compute_intraday_nets): for the lexically ordered pair
+        (a, b), a positive net means bank a owes bank b.
+        """
+        if not payer_bank or not payee_bank or payer_bank == payee_bank:
+            return
+        state = self.state
+        journal = state.journal
+        day_nets = state.intraday_nets.get(state.day)
+        if day_nets is None:
+            day_nets = {}
+            journal.setitem(state.intraday_nets, state.day, day_nets)
+        if payer_bank < payee_bank:
+            pair, delta = (payer_bank, payee_bank), amount
+        else:
+            pair, delta = (payee_bank, payer_bank), -amount
+        journal.setitem(day_nets, pair, day_nets.get(pair, 0) + delta)
 
     # ---- invariants (MVP)
-    def assert_invariants(self) -> None:
+    def assert_invariants(self, mode: str = "full") -> None:
+        """Check balance-sheet invariants.
+
+        ``full`` walks every contract, agent and stock lot. ``incremental``
+        only checks what was touched since the previous check (recorded by
+        the registry and mutation helpers) plus the O(1) CB totals and
+        today's interbank net accumulator, so a daily check costs in
+        proportion to that day's activity.
+        """
         from bilancio.core.invariants import (
+            assert_amount_totals_match,
             assert_cb_cash_matches_outstanding,
             assert_cb_reserves_match,
+            assert_cb_totals_match,
+            assert_contract_refs,
             assert_double_entry_numeric,
+            assert_intraday_nets_match_events,
+            assert_no_negative_amounts,
             assert_no_negative_balances,
             assert_no_duplicate_refs,
             assert_all_stock_ids_owned,
             assert_no_negative_stocks,
             assert_no_duplicate_stock_refs,
+            assert_stock_refs,
         )
-        for cid, c in self.state.contracts.items():
-            # For secondary market transfers (e.g., payables sold to dealers),
-            # check the effective holder, not the original asset_holder_id
-            effective_holder_id = getattr(c, 'effective_creditor', None) or c.asset_holder_id
-            assert cid in self.state.agents[effective_holder_id].asset_ids, f"{cid} missing on asset holder {effective_holder_id}"
-            assert cid in self.state.agents[c.liability_issuer_id].liability_ids, f"{cid} missing on issuer"
-        assert_no_duplicate_refs(self)
-        assert_cb_cash_matches_outstanding(self)
-        assert_cb_reserves_match(self)
-        assert_no_negative_balances(self)
-        assert_double_entry_numeric(self)
-        # Stock-related invariants
-        assert_all_stock_ids_owned(self)
-        assert_no_negative_stocks(self)
-        assert_no_duplicate_stock_refs(self)
+        state = self.state
+        if mode == "full":
+            assert_contract_refs(self, state.contracts)
+            assert_no_duplicate_refs(self)
+            assert_cb_cash_matches_outstanding(self)
+            assert_cb_reserves_match(self)
+            assert_amount_totals_match(self)
+            assert_no_negative_balances(self)
+            assert_double_entry_numeric(self)
+            # Stock-related invariants
+            assert_all_stock_ids_owned(self)
+            assert_no_negative_stocks(self)
+            assert_no_duplicate_stock_refs(self)
+            assert_intraday_nets_match_events(self)
+        elif mode == "incremental":
+            assert_contract_refs(self, state.dirty_contracts)
+            assert_no_duplicate_refs(self, state.dirty_agents)
+            assert_cb_totals_match(self)
+            assert_no_negative_amounts(self, state.dirty_contracts)
+            assert_stock_refs(self, state.dirty_stocks, state.dirty_agents)
+            assert_no_duplicate_stock_refs(self, state.dirty_agents)
+            if state.day in state.intraday_nets:
+                assert_intraday_nets_match_events(self, (state.day,))
+        else:
+            raise ValueError(f"Unknown invariant check mode: {mode!r}")
+        state.dirty_contracts.clear()
+        state.dirty_agents.clear()
+        state.dirty_stocks.clear()
 
     # ---- bootstrap helper
     def bootstrap_cb(self, cb: Agent) -> None:
@@ -124,14 +444,20 @@ class System:
     def mint_cash(self, to_agent_id: AgentId, amount: int, denom="X", alias: str | None = None) -> str:
         cb_id = next((aid for aid,a in self.state.agents.items() if a.kind == "central_bank"), None)
         assert cb_id, "CentralBank must exist"
-        instr_id = self.new_contract_id("C")
-        c = Cash(
-            id=instr_id, kind="cash", amount=amount, denom=denom,
-            asset_holder_id=to_agent_id, liability_issuer_id=cb_id
-        )
+        instr_id = None
+        if self.state.pooled_holdings and alias is None:
+            instr_id = self._pooled_record_id(to_agent_id, "cash", cb_id, denom)
         with atomic(self):
-            self.add_contract(c)
-            self.state.cb_cash_outstanding += amount
+            if instr_id is not None:
+                pooled = self.state.contracts[instr_id]
+                self.set_amount(pooled, pooled.amount + amount)
+            else:
+                instr_id = self.new_contract_id("C")
+                self.add_contract(Cash(
+                    id=instr_id, kind="cash", amount=amount, denom=denom,
+                    asset_holder_id=to_agent_id, liability_issuer_id=cb_id
+                ))
+            self._adjust_state("cb_cash_outstanding", amount)
             # Include alias if provided (for UI linking)
             if alias is not None:
                 self.log("CashMinted", to=to_agent_id, amount=amount, instr_id=instr_id, alias=alias)
@@ -143,9 +469,8 @@ class System:
         # pull from holder's cash instruments (simple greedy)
         with atomic(self):
             remaining = amount
-            cash_ids = [cid for cid in self.state.agents[from_agent_id].asset_ids
-                        if self.state.contracts[cid].kind == "cash"]
-            for cid in list(cash_ids):
+            cash_ids = self.holding_ids(from_agent_id, "cash")
+            for cid in cash_ids:
                 instr = self.state.contracts[cid]
                 take = min(instr.amount, remaining)
                 consume(self, cid, take)
@@ -153,34 +478,34 @@ class System:
                 if remaining == 0: break
             if remaining != 0:
                 raise ValidationError("insufficient cash to retire")
-            self.state.cb_cash_outstanding -= amount
+            self._adjust_state("cb_cash_outstanding", -amount)
             self.log("CashRetired", frm=from_agent_id, amount=amount)
 
     def transfer_cash(self, from_agent_id: AgentId, to_agent_id: AgentId, amount: int) -> str:
         if from_agent_id == to_agent_id:
             raise ValidationError("no-op transfer")
+        if self.state.pooled_holdings:
+            with atomic(self):
+                self._transfer_pooled("cash", from_agent_id, to_agent_id, amount, "CashTransferred")
+            return "ok"
         with atomic(self):
             remaining = amount
             # collect cash pieces and split as needed
-            for cid in list(self.state.agents[from_agent_id].asset_ids):
-                instr = self.state.contracts.get(cid)
-                if not instr or instr.kind != "cash": continue
+            for cid in self.holding_ids(from_agent_id, "cash"):
+                instr = self.state.contracts[cid]
                 piece_id = cid
                 if instr.amount > remaining:
                     piece_id = split(self, cid, remaining)
                 piece = self.state.contracts[piece_id]
                 # move holder
-                self.state.agents[from_agent_id].asset_ids.remove(piece_id)
-                self.state.agents[to_agent_id].asset_ids.append(piece_id)
-                piece.asset_holder_id = to_agent_id
+                self.move_asset(piece_id, from_agent_id, to_agent_id)
                 self.log("CashTransferred", frm=from_agent_id, to=to_agent_id, amount=min(remaining, piece.amount), instr_id=piece_id)
                 remaining -= piece.amount
                 if remaining == 0: break
             if remaining != 0:
                 raise ValidationError("insufficient cash")
             # optional coalesce at receiver (merge duplicates)
-            rx_ids = [cid for cid in self.state.agents[to_agent_id].asset_ids
-                      if self.state.contracts[cid].kind == "cash"]
+            rx_ids = self.holding_ids(to_agent_id, "cash")
             # naive coalesce: pairwise merge same-key
             seen = {}
             for cid in rx_ids:
@@ -192,6 +517,46 @@ class System:
                     seen[k] = cid
         return "ok"
 
+    def _pooled_record_id(self, agent_id: AgentId, kind: str, issuer_id: AgentId,
+                          denom: str) -> InstrId | None:
+        """The agent's balance record of ``kind`` issued by ``issuer_id`` in ``denom``."""
+        contracts = self.state.contracts
+        for cid in self.holding_ids(agent_id, kind, issuer_id):
+            if contracts[cid].denom == denom:
+                return cid
+        return None
+
+    def _transfer_pooled(self, kind: str, from_agent_id: AgentId, to_agent_id: AgentId,
+                         amount: int, event_kind: str) -> None:
+        """Pooled-holdings transfer: debit the payer's records and credit the
+        payee's matching record in place. Each leg logs ``event_kind`` with the
+        debited (``from_instr_id``) and credited (``instr_id``) records."""
+        contracts = self.state.contracts
+        remaining = amount
+        for cid in self.holding_ids(from_agent_id, kind):
+            src = contracts[cid]
+            take = min(src.amount, remaining)
+            if take == 0:
+                continue
+            dst_id = self._pooled_record_id(to_agent_id, kind, src.liability_issuer_id, src.denom)
+            if dst_id is None:
+                # Payee has no record for this issuer yet: hand over a piece
+                dst_id = cid if take == src.amount else split(self, cid, take)
+                self.move_asset(dst_id, from_agent_id, to_agent_id)
+            else:
+                self.set_amount(src, src.amount - take)
+                dst = contracts[dst_id]
+                self.set_amount(dst, dst.amount + take)
+                if src.amount == 0:
+                    self.remove_contract(cid)
+            self.log(event_kind, frm=from_agent_id, to=to_agent_id, amount=take,
+                     instr_id=dst_id, from_instr_id=cid)
+            remaining -= take
+            if remaining == 0:
+                break
+        if remaining != 0:
+            raise ValidationError("insufficient cash" if kind == "cash" else "insufficient reserves")
+
     # ---- reserve operations
     def _central_bank_id(self) -> str:
         """Find and return the central bank agent ID"""
@@ -203,14 +568,20 @@ class System:
     def mint_reserves(self, to_bank_id: str, amount: int, denom="X", alias: str | None = None) -> str:
         """Mint reserves to a bank"""
         cb_id = self._central_bank_id()
-        instr_id = self.new_contract_id("R")
-        c = ReserveDeposit(
-            id=instr_id, kind="reserve_deposit", amount=amount, denom=denom,
-            asset_holder_id=to_bank_id, liability_issuer_id=cb_id
-        )
+        instr_id = None
+        if self.state.pooled_holdings and alias is None:
+            instr_id = self._pooled_record_id(to_bank_id, "reserve_deposit", cb_id, denom)
         with atomic(self):
-            self.add_contract(c)
-            self.state.cb_reserves_outstanding += amount
+            if instr_id is not None:
+                pooled = self.state.contracts[instr_id]
+                self.set_amount(pooled, pooled.amount + amount)
+            else:
+                instr_id = self.new_contract_id("R")
+                self.add_contract(ReserveDeposit(
+                    id=instr_id, kind="reserve_deposit", amount=amount, denom=denom,
+                    asset_holder_id=to_bank_id, liability_issuer_id=cb_id
+                ))
+            self._adjust_state("cb_reserves_outstanding", amount)
             if alias is not None:
                 self.log("ReservesMinted", to=to_bank_id, amount=amount, instr_id=instr_id, alias=alias)
             else:
@@ -221,28 +592,28 @@ class System:
         """Transfer reserves between banks"""
         if from_bank_id == to_bank_id:
             raise ValidationError("no-op transfer")
+        if self.state.pooled_holdings:
+            with atomic(self):
+                self._transfer_pooled("reserve_deposit", from_bank_id, to_bank_id, amount, "ReservesTransferred")
+            return
         with atomic(self):
             remaining = amount
             # collect reserve pieces and split as needed
-            for cid in list(self.state.agents[from_bank_id].asset_ids):
-                instr = self.state.contracts.get(cid)
-                if not instr or instr.kind != "reserve_deposit": continue
+            for cid in self.holding_ids(from_bank_id, "reserve_deposit"):
+                instr = self.state.contracts[cid]
                 piece_id = cid
                 if instr.amount > remaining:
                     piece_id = split(self, cid, remaining)
                 piece = self.state.contracts[piece_id]
                 # move holder
-                self.state.agents[from_bank_id].asset_ids.remove(piece_id)
-                self.state.agents[to_bank_id].asset_ids.append(piece_id)
-                piece.asset_holder_id = to_bank_id
+                self.move_asset(piece_id, from_bank_id, to_bank_id)
                 self.log("ReservesTransferred", frm=from_bank_id, to=to_bank_id, amount=min(remaining, piece.amount), instr_id=piece_id)
                 remaining -= piece.amount
                 if remaining == 0: break
             if remaining != 0:
                 raise ValidationError("insufficient reserves")
             # optional coalesce at receiver (merge duplicates)
-            rx_ids = [cid for cid in self.state.agents[to_bank_id].asset_ids
-                      if self.state.contracts[cid].kind == "reserve_deposit"]
+            rx_ids = self.holding_ids(to_bank_id, "reserve_deposit")
             # naive coalesce: pairwise merge same-key
             seen = {}
             for cid in rx_ids:
@@ -258,9 +629,8 @@ class System:
         with atomic(self):
             # consume reserves
             remaining = amount
-            reserve_ids = [cid for cid in self.state.agents[bank_id].asset_ids
-                          if self.state.contracts[cid].kind == "reserve_deposit"]
-            for cid in list(reserve_ids):
+            reserve_ids = self.holding_ids(bank_id, "reserve_deposit")
+            for cid in reserve_ids:
                 instr = self.state.contracts[cid]
                 take = min(instr.amount, remaining)
                 consume(self, cid, take)
@@ -269,9 +639,9 @@ class System:
             if remaining != 0:
                 raise ValidationError("insufficient reserves to convert")
             # update outstanding reserves
-            self.state.cb_reserves_outstanding -= amount
+            self._adjust_state("cb_reserves_outstanding", -amount)
             # mint equivalent cash
-            self.state.cb_cash_outstanding += amount
+            self._adjust_state("cb_cash_outstanding", amount)
             cb_id = self._central_bank_id()
             instr_id = self.new_contract_id("C")
             c = Cash(
@@ -286,9 +656,8 @@ class System:
         with atomic(self):
             # consume cash
             remaining = amount
-            cash_ids = [cid for cid in self.state.agents[bank_id].asset_ids
-                       if self.state.contracts[cid].kind == "cash"]
-            for cid in list(cash_ids):
+            cash_ids = self.holding_ids(bank_id, "cash")
+            for cid in cash_ids:
                 instr = self.state.contracts[cid]
                 take = min(instr.amount, remaining)
                 consume(self, cid, take)
@@ -297,9 +666,9 @@ class System:
             if remaining != 0:
                 raise ValidationError("insufficient cash to convert")
             # update outstanding cash
-            self.state.cb_cash_outstanding -= amount
+            self._adjust_state("cb_cash_outstanding", -amount)
             # mint equivalent reserves
-            self.state.cb_reserves_outstanding += amount
+            self._adjust_state("cb_reserves_outstanding", amount)
             cb_id = self._central_bank_id()
             instr_id = self.new_contract_id("R")
             c = ReserveDeposit(
@@ -349,7 +718,7 @@ class System:
                 issuance_day=day,
             )
             self.add_contract(reserve)
-            self.state.cb_reserves_outstanding += amount
+            self._adjust_state("cb_reserves_outstanding", amount)
 
             # 2. Create the CB loan (bank's liability to CB)
             loan_id = self.new_contract_id("L")
@@ -364,7 +733,7 @@ class System:
                 issuance_day=day,
             )
             self.add_contract(loan)
-            self.state.cb_loans_outstanding += amount
+            self._adjust_state("cb_loans_outstanding", amount)
 
             self.log("CBLoanCreated",
                      bank_id=bank_id,
@@ -405,10 +774,9 @@ class System:
         with atomic(self):
             # 1. Consume reserves from bank (repayment amount)
             remaining = repayment_amount
-            reserve_ids = [cid for cid in self.state.agents[bank_id].asset_ids
-                          if self.state.contracts[cid].kind == "reserve_deposit"]
+            reserve_ids = self.holding_ids(bank_id, "reserve_deposit")
 
-            for cid in list(reserve_ids):
+            for cid in reserve_ids:
                 instr = self.state.contracts[cid]
                 take = min(instr.amount, remaining)
                 consume(self, cid, take)
@@ -419,14 +787,11 @@ class System:
             if remaining != 0:
                 raise ValidationError(f"Insufficient reserves to repay CB loan: needed {repayment_amount}, short by {remaining}")
 
-            self.state.cb_reserves_outstanding -= repayment_amount
+            self._adjust_state("cb_reserves_outstanding", -repayment_amount)
 
             # 2. Cancel the loan
-            cb_id = loan.asset_holder_id
-            self.state.agents[cb_id].asset_ids.remove(loan_id)
-            self.state.agents[bank_id].liability_ids.remove(loan_id)
-            del self.state.contracts[loan_id]
-            self.state.cb_loans_outstanding -= principal
+            self.remove_contract(loan_id)
+            self._adjust_state("cb_loans_outstanding", -principal)
 
             self.log("CBLoanRepaid",
                      bank_id=bank_id,
@@ -440,8 +805,8 @@ class System:
     def get_cb_loans_due(self, day: int) -> list[str]:
         """Get all CB loans that are due on the given day."""
         due_loans = []
-        for cid, contract in self.state.contracts.items():
-            if contract.kind == "cb_loan" and contract.is_due(day):
+        for cid in self.contract_ids_of_kind("cb_loan"):
+            if self.state.contracts[cid].is_due(day):
                 due_loans.append(cid)
         return due_loans
 
@@ -469,9 +834,9 @@ class System:
 
         with atomic(self):
             # Find all reserve deposits due for interest
-            for cid in list(self.state.contracts.keys()):
+            for cid in self.contract_ids_of_kind("reserve_deposit"):
                 contract = self.state.contracts.get(cid)
-                if contract is None or contract.kind != "reserve_deposit":
+                if contract is None:
                     continue
 
                 # Check if this reserve has interest and is due
@@ -497,10 +862,10 @@ class System:
                     issuance_day=day,
                 )
                 self.add_contract(interest_reserve)
-                self.state.cb_reserves_outstanding += interest
+                self._adjust_state("cb_reserves_outstanding", interest)
 
                 # Update the original contract's last interest day
-                contract.last_interest_day = day
+                self.state.journal.setattr(contract, "last_interest_day", day)
 
                 total_interest += interest
 
@@ -558,7 +923,7 @@ class System:
 
         with atomic(self):
             self.add_contract(reserve)
-            self.state.cb_reserves_outstanding += amount
+            self._adjust_state("cb_reserves_outstanding", amount)
             if alias is not None:
                 self.log("ReservesMinted", to=to_bank_id, amount=amount, instr_id=instr_id, alias=alias)
             else:
@@ -568,17 +933,12 @@ class System:
 
     # ---- deposit helpers
     def deposit_ids(self, customer_id: str, bank_id: str) -> list[str]:
-        """Filter customer assets for bank_deposit issued by bank_id"""
-        out = []
-        for cid in self.state.agents[customer_id].asset_ids:
-            c = self.state.contracts[cid]
-            if c.kind == "bank_deposit" and c.liability_issuer_id == bank_id:
-                out.append(cid)
-        return out
+        """Customer's bank_deposit contracts issued by bank_id"""
+        return self.holding_ids(customer_id, "bank_deposit", bank_id)
 
     def total_deposit(self, customer_id: str, bank_id: str) -> int:
         """Calculate total deposit amount for customer at bank"""
-        return sum(self.state.contracts[cid].amount for cid in self.deposit_ids(customer_id, bank_id))
+        return self.holding_balance(customer_id, "bank_deposit", bank_id)
 
     # ---- obligation settlement
 
@@ -606,16 +966,16 @@ class System:
             holder = self.state.agents[contract.asset_holder_id]
             if contract_id not in holder.asset_ids:
                 raise ValidationError(f"Contract {contract_id} not in holder's assets")
-            holder.asset_ids.remove(contract_id)
+            self._detach_asset(holder, contract)
             
             # Remove from issuer's liabilities
             issuer = self.state.agents[contract.liability_issuer_id]
             if contract_id not in issuer.liability_ids:
                 raise ValidationError(f"Contract {contract_id} not in issuer's liabilities")
-            issuer.liability_ids.remove(contract_id)
+            self.state.journal.remove(issuer.liability_ids, contract_id)
             
             # Remove contract from registry
-            del self.state.contracts[contract_id]
+            self._unregister_contract(contract_id)
             
             # Log the settlement
             self.log("ObligationSettled",
@@ -628,7 +988,7 @@ class System:
     # ---- stock operations (inventory)
     def create_stock(self, owner_id: AgentId, sku: str, quantity: int, unit_price: Decimal, divisible: bool=True) -> InstrId:
         """Create a new stock lot (inventory)."""
-        stock_id = new_id("S")
+        stock_id = self.new_stock_id()
         stock = StockLot(
             id=stock_id,
             kind="stock_lot",
@@ -639,8 +999,9 @@ class System:
             divisible=divisible
         )
         with atomic(self):
-            self.state.stocks[stock_id] = stock
-            self.state.agents[owner_id].stock_ids.append(stock_id)
+            self.state.journal.setitem(self.state.stocks, stock_id, stock)
+            self.state.journal.append(self.state.agents[owner_id].stock_ids, stock_id)
+            self._mark_stock_dirty(stock_id, owner_id)
             self.log("StockCreated", owner=owner_id, sku=sku, qty=quantity, unit_price=unit_price, stock_id=stock_id)
         return stock_id
 
@@ -671,9 +1032,11 @@ class System:
         
         # Transfer ownership
         moving_stock = self.state.stocks[moving_id]
-        self.state.agents[from_owner].stock_ids.remove(moving_id)
-        self.state.agents[to_owner].stock_ids.append(moving_id)
-        moving_stock.owner_id = to_owner
+        journal = self.state.journal
+        journal.remove(self.state.agents[from_owner].stock_ids, moving_id)
+        journal.append(self.state.agents[to_owner].stock_ids, moving_id)
+        journal.setattr(moving_stock, "owner_id", to_owner)
+        self._mark_stock_dirty(moving_id, from_owner, to_owner)
         
         self.log("StockTransferred", 
                 frm=from_owner, 
@@ -740,16 +1103,16 @@ class System:
         holder = self.state.agents[contract.asset_holder_id]
         if obligation_id not in holder.asset_ids:
             raise ValidationError(f"Contract {obligation_id} not in holder's assets")
-        holder.asset_ids.remove(obligation_id)
+        self._detach_asset(holder, contract)
         
         # Remove from issuer's liabilities
         issuer = self.state.agents[contract.liability_issuer_id]
         if obligation_id not in issuer.liability_ids:
             raise ValidationError(f"Contract {obligation_id} not in issuer's liabilities")
-        issuer.liability_ids.remove(obligation_id)
+        self.state.journal.remove(issuer.liability_ids, obligation_id)
         
         # Remove contract from registry
-        del self.state.contracts[obligation_id]
+        self._unregister_contract(obligation_id)
         
         # Log the cancellation with alias (if any) and contract_id for UI consistency
         from bilancio.ops.aliases import get_alias_for_id
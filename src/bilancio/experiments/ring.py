@@ -12,6 +12,7 @@ import yaml
 from pydantic import BaseModel, Field, ValidationError, model_validator
 
 from bilancio.analysis.metrics_computer import MetricsComputer
+from bilancio.engines.instrumentation import read_phase_timings_csv, summarize_phase_timings
 from bilancio.config.models import RingExplorerGeneratorConfig
 from bilancio.runners import LocalExecutor, RunOptions, ExecutionResult
 from bilancio.runners.protocols import SimulationExecutor
@@ -659,6 +660,7 @@ class RingSweepRunner:
             "phi_total": str(phi_total) if phi_total is not None else "",
             "delta_total": str(delta_total) if delta_total is not None else "",
         }
+        success_metrics.update(self._phase_timing_metrics(out_dir))
         self._upsert_registry(
             run_id=run_id,
             phase=phase,
@@ -672,6 +674,7 @@ class RingSweepRunner:
                 "metrics_csv": self._rel_path(output_paths["metrics_csv"]),
                 "metrics_html": self._rel_path(output_paths["metrics_html"]),
                 "run_html": self._rel_path(run_html_path),
+                **self._phase_timing_artifact(out_dir),
             },
         )
 
@@ -942,6 +945,7 @@ class RingSweepRunner:
             "phi_total": str(phi_total) if phi_total is not None else "",
             "delta_total": str(delta_total) if delta_total is not None else "",
         }
+        success_metrics.update(self._phase_timing_metrics(prepared.out_dir))
         self._upsert_registry(
             run_id=prepared.run_id,
             phase=prepared.phase,
@@ -955,6 +959,7 @@ class RingSweepRunner:
                 "metrics_csv": self._rel_path(output_paths["metrics_csv"]),
                 "metrics_html": self._rel_path(output_paths["metrics_html"]),
                 "run_html": self._rel_path(run_html_path),
+                **self._phase_timing_artifact(prepared.out_dir),
             },
         )
 
@@ -965,6 +970,17 @@ class RingSweepRunner:
             modal_call_id=result.modal_call_id
         )
 
+    def _phase_timing_metrics(self, out_dir: Path) -> Dict[str, Any]:
+        """Per-phase timing summary for the registry, if the run exported one."""
+        path = out_dir / "phase_timings.csv"
+        if not path.exists():
+            return {}
+        return summarize_phase_timings(read_phase_timings_csv(path))
+
+    def _phase_timing_artifact(self, out_dir: Path) -> Dict[str, str]:
+        path = out_dir / "phase_timings.csv"
+        return {"phase_timings_csv": self._rel_path(path)} if path.exists() else {}
+
     def _rel_path(self, absolute: Path) -> str:
         try:
             return str(Path("..").joinpath(absolute.relative_to(self.base_dir)))
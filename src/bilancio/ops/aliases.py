@@ -3,9 +3,85 @@ from __future__ import annotations
 from typing import Optional
 
 
+class AliasMap(dict):
+    """alias -> contract_id mapping that also indexes contract_id -> aliases.
+
+    Behaves like the plain dict stored on ``State.aliases`` (item assignment,
+    ``del``, ``pop``, ``update`` ...) and keeps the reverse index in step, so
+    looking up the alias of a contract is O(1).
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__()
+        self._by_id: dict[str, list[str]] = {}
+        self.update(*args, **kwargs)
+
+    def __reduce__(self):
+        return (type(self), (dict(self),))
+
+    def __setitem__(self, alias: str, contract_id: str) -> None:
+        if alias in self:
+            old = super().__getitem__(alias)
+            if old == contract_id:
+                return
+            self._unlink(alias, old)
+        super().__setitem__(alias, contract_id)
+        self._by_id.setdefault(contract_id, []).append(alias)
+
+    def __delitem__(self, alias: str) -> None:
+        contract_id = super().pop(alias)
+        self._unlink(alias, contract_id)
+
+    def pop(self, alias: str, *default):
+        if alias not in self:
+            if default:
+                return default[0]
+            raise KeyError(alias)
+        contract_id = super().pop(alias)
+        self._unlink(alias, contract_id)
+        return contract_id
+
+    def popitem(self):
+        alias, contract_id = super().popitem()
+        self._unlink(alias, contract_id)
+        return alias, contract_id
+
+    def setdefault(self, alias: str, default=None):
+        if alias not in self:
+            self[alias] = default
+        return super().__getitem__(alias)
+
+    def update(self, *args, **kwargs) -> None:
+        for alias, contract_id in dict(*args, **kwargs).items():
+            self[alias] = contract_id
+
+    def clear(self) -> None:
+        super().clear()
+        self._by_id.clear()
+
+    def copy(self) -> AliasMap:
+        return AliasMap(self)
+
+    def alias_for(self, contract_id: str) -> Optional[str]:
+        """Return the first alias registered for contract_id, if any."""
+        aliases = self._by_id.get(contract_id)
+        return aliases[0] if aliases else None
+
+    def _unlink(self, alias: str, contract_id: str) -> None:
+        aliases = self._by_id.get(contract_id)
+        if aliases is None:
+            return
+        aliases.remove(alias)
+        if not aliases:
+            del self._by_id[contract_id]
+
+
 def get_alias_for_id(system, contract_id: str) -> Optional[str]:
     """Return the alias for a given contract_id, if any."""
-    for alias, cid in (system.state.aliases or {}).items():
+    aliases = system.state.aliases
+    if isinstance(aliases, AliasMap):
+        return aliases.alias_for(contract_id)
+    for alias, cid in (aliases or {}).items():
         if cid == contract_id:
             return alias
     return None
@@ -14,4 +90,3 @@ def get_alias_for_id(system, contract_id: str) -> Optional[str]:
 def get_id_for_alias(system, alias: str) -> Optional[str]:
     """Return the contract id for a given alias, if any."""
     return (system.state.aliases or {}).get(alias)
-
@@ -9,8 +9,7 @@ def deposit_cash(system, customer_id: str, bank_id: str, amount: int) -> str:
     # collect payer cash, splitting as needed
     with atomic(system):
         remaining = amount
-        cash_ids = [cid for cid in list(system.state.agents[customer_id].asset_ids)
-                    if system.state.contracts[cid].kind == "cash"]
+        cash_ids = system.holding_ids(customer_id, "cash")
         moved_piece_ids = []
         for cid in cash_ids:
             instr = system.state.contracts[cid]
@@ -18,9 +17,7 @@ def deposit_cash(system, customer_id: str, bank_id: str, amount: int) -> str:
                 cid = split(system, cid, remaining)
                 instr = system.state.contracts[cid]
             # move holder to bank (issuer CB unchanged)
-            system.state.agents[customer_id].asset_ids.remove(cid)
-            system.state.agents[bank_id].asset_ids.append(cid)
-            instr.asset_holder_id = bank_id
+            system.move_asset(cid, customer_id, bank_id)
             moved_piece_ids.append(cid)
             remaining -= instr.amount
             if remaining == 0:
@@ -30,7 +27,8 @@ def deposit_cash(system, customer_id: str, bank_id: str, amount: int) -> str:
 
         # credit/ensure deposit
         dep_id = coalesce_deposits(system, customer_id, bank_id)
-        system.state.contracts[dep_id].amount += amount
+        dep = system.state.contracts[dep_id]
+        system.set_amount(dep, dep.amount + amount)
         system.log("CashDeposited", customer=customer_id, bank=bank_id, amount=amount,
                    cash_piece_ids=moved_piece_ids, deposit_id=dep_id)
         return dep_id
@@ -47,23 +45,18 @@ def withdraw_cash(system, customer_id: str, bank_id: str, amount: int) -> str:
         for dep_id in dep_ids:
             dep = system.state.contracts[dep_id]
             take = min(dep.amount, remaining)
-            dep.amount -= take
+            system.set_amount(dep, dep.amount - take)
             remaining -= take
             if dep.amount == 0 and take > 0:
                 # remove empty instrument
-                holder = system.state.agents[customer_id]
-                issuer = system.state.agents[bank_id]
-                holder.asset_ids.remove(dep_id)
-                issuer.liability_ids.remove(dep_id)
-                del system.state.contracts[dep_id]
+                system.remove_contract(dep_id)
             if remaining == 0:
                 break
         if remaining != 0:
             raise ValidationError("insufficient deposit balance")
 
         # 2) move cash from bank vault → customer (require sufficient cash on hand)
-        bank_cash_ids = [cid for cid in list(system.state.agents[bank_id].asset_ids)
-                         if system.state.contracts[cid].kind == "cash"]
+        bank_cash_ids = system.holding_ids(bank_id, "cash")
         remaining = amount
         moved_piece_ids = []
         for cid in bank_cash_ids:
@@ -71,9 +64,7 @@ def withdraw_cash(system, customer_id: str, bank_id: str, amount: int) -> str:
             if instr.amount > remaining:
                 cid = split(system, cid, remaining)
                 instr = system.state.contracts[cid]
-            system.state.agents[bank_id].asset_ids.remove(cid)
-            system.state.agents[customer_id].asset_ids.append(cid)
-            instr.asset_holder_id = customer_id
+            system.move_asset(cid, bank_id, customer_id)
             moved_piece_ids.append(cid)
             remaining -= instr.amount
             if remaining == 0:
@@ -97,32 +88,25 @@ def client_payment(system, payer_id: str, payer_bank: str, payee_id: str, payee_
         for dep_id in dep_ids:
             dep = system.state.contracts[dep_id]
             take = min(dep.amount, remaining)
-            dep.amount -= take
+            system.set_amount(dep, dep.amount - take)
             remaining -= take
             deposit_paid += take
             if dep.amount == 0 and take > 0:
-                holder = system.state.agents[payer_id]
-                issuer = system.state.agents[payer_bank]
-                holder.asset_ids.remove(dep_id)
-                issuer.liability_ids.remove(dep_id)
-                del system.state.contracts[dep_id]
+                system.remove_contract(dep_id)
             if remaining == 0:
                 break
 
         # Optional fallback: use payer's cash for the remainder (real-world "pay cash")
         cash_paid = 0
         if remaining and allow_cash_fallback:
-            cash_ids = [cid for cid in list(system.state.agents[payer_id].asset_ids)
-                        if system.state.contracts[cid].kind == "cash"]
+            cash_ids = system.holding_ids(payer_id, "cash")
             for cid in cash_ids:
                 instr = system.state.contracts[cid]
                 if instr.amount > remaining:
                     cid = split(system, cid, remaining)
                     instr = system.state.contracts[cid]
                 # move payer cash → payee (physical cash handover)
-                system.state.agents[payer_id].asset_ids.remove(cid)
-                system.state.agents[payee_id].asset_ids.append(cid)
-                instr.asset_holder_id = payee_id
+                system.move_asset(cid, payer_id, payee_id)
                 cash_paid += instr.amount
                 remaining -= instr.amount
                 if remaining == 0:
@@ -133,7 +117,8 @@ def client_payment(system, payer_id: str, payer_bank: str, payee_id: str, payee_
 
         # 2) credit payee's deposit at payee_bank (only the deposit portion, not cash)
         dep_rx = coalesce_deposits(system, payee_id, payee_bank)
-        system.state.contracts[dep_rx].amount += deposit_paid
+        dep = system.state.contracts[dep_rx]
+        system.set_amount(dep, dep.amount + deposit_paid)
 
         # 3) Log payment events with proper classification
         if deposit_paid > 0:
@@ -152,6 +137,7 @@ def client_payment(system, payer_id: str, payer_bank: str, payee_id: str, payee_
                           payee=payee_id, 
                           payee_bank=payee_bank, 
                           amount=deposit_paid)
+                system.record_interbank_payment(payer_bank, payee_bank, deposit_paid)
         
         if cash_paid > 0:
             # Cash payment was used as fallback
@@ -1,6 +1,5 @@
 
 from bilancio.core.errors import ValidationError
-from bilancio.core.ids import new_id
 from bilancio.domain.instruments.base import Instrument
 
 
@@ -21,9 +20,9 @@ def split(system, instr_id: str, amount: int) -> str:
     if not is_divisible(instr):
         raise ValidationError("instrument is not divisible")
     # reduce original
-    instr.amount -= amount
+    system.set_amount(instr, instr.amount - amount)
     # create twin
-    twin_id = new_id("C")
+    twin_id = system.new_contract_id("C")
     twin = type(instr)(
         id=twin_id,
         kind=instr.kind,
@@ -43,13 +42,9 @@ def merge(system, a_id: str, b_id: str) -> str:
     b = system.state.contracts[b_id]
     if fungible_key(a) != fungible_key(b):
         raise ValidationError("instruments are not fungible-compatible")
-    a.amount += b.amount
+    system.set_amount(a, a.amount + b.amount)
     # detach b from registries
-    holder = system.state.agents[b.asset_holder_id]
-    issuer = system.state.agents[b.liability_issuer_id]
-    holder.asset_ids.remove(b_id)
-    issuer.liability_ids.remove(b_id)
-    del system.state.contracts[b_id]
+    system.remove_contract(b_id)
     system.log("InstrumentMerged", keep=a_id, removed=b_id)
     return a_id
 
@@ -57,13 +52,9 @@ def consume(system, instr_id: str, amount: int) -> None:
     instr = system.state.contracts[instr_id]
     if amount <= 0 or amount > instr.amount:
         raise ValidationError("invalid consume amount")
-    instr.amount -= amount
+    system.set_amount(instr, instr.amount - amount)
     if instr.amount == 0:
-        holder = system.state.agents[instr.asset_holder_id]
-        issuer = system.state.agents[instr.liability_issuer_id]
-        holder.asset_ids.remove(instr_id)
-        issuer.liability_ids.remove(instr_id)
-        del system.state.contracts[instr_id]
+        system.remove_contract(instr_id)
 
 def coalesce_deposits(system, customer_id: str, bank_id: str) -> str:
     """Coalesce all deposits for a customer at a bank into a single instrument"""
@@ -4,7 +4,7 @@ from decimal import Decimal
 from typing import TYPE_CHECKING
 
 from bilancio.core.errors import ValidationError
-from bilancio.core.ids import InstrId, new_id
+from bilancio.core.ids import InstrId
 from bilancio.domain.goods import StockLot
 
 if TYPE_CHECKING:
@@ -26,7 +26,7 @@ def split_stock(system: 'System', stock_id: InstrId, quantity: int) -> InstrId:
         raise ValidationError("Invalid split quantity")
     
     # Create new stock lot with split quantity
-    new_id_val = new_id("S")
+    new_id_val = system.new_stock_id()
     new_stock = StockLot(
         id=new_id_val,
         kind="stock_lot",
@@ -38,11 +38,14 @@ def split_stock(system: 'System', stock_id: InstrId, quantity: int) -> InstrId:
     )
     
     # Update original stock quantity
-    stock.quantity -= quantity
+    journal = system.state.journal
+    journal.setattr(stock, "quantity", stock.quantity - quantity)
     
     # Register new stock
-    system.state.stocks[new_id_val] = new_stock
-    system.state.agents[stock.owner_id].stock_ids.append(new_id_val)
+    journal.setitem(system.state.stocks, new_id_val, new_stock)
+    journal.append(system.state.agents[stock.owner_id].stock_ids, new_id_val)
+    system._mark_stock_dirty(stock_id, stock.owner_id)
+    system._mark_stock_dirty(new_id_val)
     
     system.log("StockSplit", 
               original_id=stock_id, 
@@ -66,11 +69,13 @@ def merge_stock(system: 'System', keep_id: InstrId, remove_id: InstrId) -> Instr
     
     # Merge quantities
     original_qty = keep_stock.quantity
-    keep_stock.quantity += remove_stock.quantity
+    journal = system.state.journal
+    journal.setattr(keep_stock, "quantity", keep_stock.quantity + remove_stock.quantity)
     
     # Remove the merged stock
-    del system.state.stocks[remove_id]
-    system.state.agents[remove_stock.owner_id].stock_ids.remove(remove_id)
+    journal.delitem(system.state.stocks, remove_id)
+    journal.remove(system.state.agents[remove_stock.owner_id].stock_ids, remove_id)
+    system._mark_stock_dirty(keep_id, keep_stock.owner_id, remove_stock.owner_id)
     
     system.log("StockMerged",
               keep_id=keep_id,
@@ -90,12 +95,15 @@ def consume_stock(system: 'System', stock_id: InstrId, quantity: int) -> None:
     if quantity <= 0 or quantity > stock.quantity:
         raise ValidationError("Invalid consumption quantity")
     
+    journal = system.state.journal
     if quantity == stock.quantity:
         # Complete consumption - remove the stock
-        del system.state.stocks[stock_id]
-        system.state.agents[stock.owner_id].stock_ids.remove(stock_id)
+        journal.delitem(system.state.stocks, stock_id)
+        journal.remove(system.state.agents[stock.owner_id].stock_ids, stock_id)
+        system._mark_stock_dirty(stock_id, stock.owner_id)
         system.log("StockConsumed", stock_id=stock_id, sku=stock.sku, qty=quantity, complete=True)
     else:
         # Partial consumption
-        stock.quantity -= quantity
+        journal.setattr(stock, "quantity", stock.quantity - quantity)
+        system._mark_stock_dirty(stock_id)
         system.log("StockConsumed", stock_id=stock_id, sku=stock.sku, qty=quantity, remaining=stock.quantity, complete=False)
\ No newline at end of file
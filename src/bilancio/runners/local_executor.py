@@ -60,6 +60,7 @@ class LocalExecutor:
 
         balances_path = exports_dir / "balances.csv"
         events_path = exports_dir / "events.jsonl"
+        phase_timings_path = exports_dir / "phase_timings.csv"
         run_html_path = output_dir / "run.html"
 
         try:
@@ -75,6 +76,7 @@ class LocalExecutor:
                 export={
                     "balances_csv": str(balances_path),
                     "events_jsonl": str(events_path),
+                    "phase_timings_csv": str(phase_timings_path),
                 },
                 html_output=run_html_path,
                 t_account=options.t_account,
@@ -94,6 +96,8 @@ class LocalExecutor:
                 artifacts["events_jsonl"] = "out/events.jsonl"
             if balances_path.exists():
                 artifacts["balances_csv"] = "out/balances.csv"
+            if phase_timings_path.exists():
+                artifacts["phase_timings_csv"] = "out/phase_timings.csv"
             if run_html_path.exists():
                 artifacts["run_html"] = "run.html"
 
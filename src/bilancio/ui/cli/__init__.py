@@ -8,6 +8,7 @@ from .run import run, validate, new, analyze
 from .sweep import sweep
 from .volume import volume
 from .jobs import jobs
+from .bench import bench
 
 
 @click.group()
@@ -24,6 +25,7 @@ cli.add_command(analyze)
 cli.add_command(sweep)
 cli.add_command(volume)
 cli.add_command(jobs)
+cli.add_command(bench)
 
 
 def main():
@@ -0,0 +1,139 @@
+"""CLI command for running performance benchmarks."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from typing import Optional, Tuple
+
+import click
+from rich.table import Table
+
+from bilancio.benchmarks import (
+    BENCHMARKS,
+    DEFAULT_SIZES,
+    compare_results,
+    load_results,
+    run_benchmarks,
+    write_results,
+)
+
+from .utils import console
+
+DEFAULT_OUTPUT = Path("benchmarks/results.json")
+DEFAULT_BASELINE = Path("benchmarks/baseline.json")
+
+
+def _parse_sizes(value: str) -> list[int]:
+    try:
+        sizes = [int(part.replace("_", "")) for part in value.split(",") if part.strip()]
+    except ValueError:
+        raise click.BadParameter(f"expected a comma list of integers, got {value!r}")
+    if not sizes or any(n < 2 for n in sizes):
+        raise click.BadParameter("sizes must be integers >= 2")
+    return sizes
+
+
+@click.command()
+@click.option('--case', 'cases', multiple=True, type=click.Choice(sorted(BENCHMARKS)),
+              help='Benchmark to run (repeatable); default: all')
+@click.option('--sizes', type=str, default=",".join(str(n) for n in DEFAULT_SIZES),
+              show_default=True, help='Comma list of ring sizes (n_agents)')
+@click.option('--repeat', type=int, default=3, show_default=True, help='Timed runs per case and size')
+@click.option('--output', type=click.Path(path_type=Path), default=DEFAULT_OUTPUT,
+              show_default=True, help='Where to write the results JSON')
+@click.option('--baseline', type=click.Path(path_type=Path), default=None,
+              help=f'Results JSON to compare against (default: {DEFAULT_BASELINE} if present)')
+@click.option('--tolerance', type=float, default=0.2, show_default=True,
+              help='Allowed slowdown vs baseline before flagging a regression (0.2 = 20%)')
+@click.option('--save-baseline', is_flag=True, help='Also write the results as the new baseline')
+@click.option('--list', 'list_cases', is_flag=True, help='List available benchmarks and exit')
+def bench(
+    cases: Tuple[str, ...],
+    sizes: str,
+    repeat: int,
+    output: Path,
+    baseline: Optional[Path],
+    tolerance: float,
+    save_baseline: bool,
+    list_cases: bool,
+):
+    """Time engine, dealer and analysis hot paths at several sizes.
+
+    Writes the timings as JSON and, when a baseline is available, compares
+    best times against it. Exits with status 1 if any case failed, or if
+    any baseline case regressed or is missing from the run.
+    """
+    if list_cases:
+        for name, b in BENCHMARKS.items():
+            console.print(f"{name}: {b.description}")
+        return
+
+    if repeat < 1:
+        raise click.BadParameter("repeat must be >= 1", param_hint="--repeat")
+    size_list = _parse_sizes(sizes)
+    names = list(cases) or list(BENCHMARKS)
+
+    baseline_path = baseline
+    if baseline_path is None and DEFAULT_BASELINE.exists():
+        baseline_path = DEFAULT_BASELINE
+
+    if baseline_path is not None and not baseline_path.exists():
+        if not save_baseline:
+            raise click.ClickException(f"Baseline not found: {baseline_path}")
+        baseline_path = None  # first run: nothing to compare against yet
+
+    def progress(result):
+        if result.error:
+            console.print(f"[red]{result.name} n={result.n_agents}: {result.error}[/red]")
+        else:
+            console.print(f"{result.name} n={result.n_agents}: best {result.best_s:.4f}s "
+                          f"(mean {result.mean_s:.4f}s, setup {result.setup_s:.2f}s)")
+
+    doc = run_benchmarks(names, size_list, repeat=repeat, progress=progress)
+    write_results(doc, output)
+    console.print(f"[green]OK[/green] Wrote benchmark results to {output}")
+
+    errors = [r for r in doc["results"] if r["error"]]
+    comparisons = []
+    if baseline_path is not None:
+        try:
+            base_doc = load_results(baseline_path)
+        except (OSError, ValueError) as e:
+            raise click.ClickException(f"Cannot read baseline {baseline_path}: {e}")
+        # Only the selected sizes (and cases, if any were named) are expected
+        # in this run; without --case, baseline cases that no longer exist
+        # still count as missing
+        base_doc = {**base_doc, "results": [r for r in base_doc.get("results", [])
+                                            if r["n_agents"] in size_list
+                                            and (not cases or r["name"] in cases)]}
+        comparisons = compare_results(doc, base_doc, tolerance=tolerance)
+        table = Table(title=f"Compared to {baseline_path}")
+        for column in ("benchmark", "n_agents", "baseline (s)", "current (s)", "ratio"):
+            table.add_column(column)
+        for c in comparisons:
+            style = "red" if c.failed else None
+            current_s = c.error if c.error else f"{c.current_s:.4f}"
+            ratio = "-" if c.ratio is None else f"{c.ratio:.2f}"
+            table.add_row(c.name, str(c.n_agents), f"{c.baseline_s:.4f}",
+                          current_s, ratio, style=style)
+        console.print(table)
+
+    if save_baseline:
+        write_results(doc, DEFAULT_BASELINE if baseline is None else baseline)
+        console.print(f"[green]OK[/green] Saved baseline to {baseline or DEFAULT_BASELINE}")
+
+    failed = False
+    if errors:
+        console.print(f"[red]Failed: {len(errors)} case(s) raised an error[/red]")
+        failed = True
+    if any(c.regressed for c in comparisons):
+        console.print(f"[red]Regression: some cases are more than {tolerance:.0%} slower than the baseline[/red]")
+        failed = True
+    ran = {(r["name"], r["n_agents"]) for r in doc["results"]}
+    missing = [c for c in comparisons if (c.name, c.n_agents) not in ran]
+    if missing:
+        console.print(f"[red]Missing: {len(missing)} baseline case(s) did not run[/red]")
+        failed = True
+    if failed:
+        sys.exit(1)
@@ -121,7 +121,7 @@ def show_day_summary_renderable(
     # Show events
     if day is not None:
         # Show events for specific day
-        events_for_day = [e for e in system.state.events if e.get("day") == day]
+        events_for_day = system.state.events.for_day(day)
         if events_for_day:
             renderables.append(Text("\nEvents:", style="bold"))
             if event_mode == "table":
@@ -765,7 +765,7 @@ def export_pretty_html(
     # Determine convergence robustly: check tail quiet days and open obligations
     def _has_open_obligations() -> bool:
         try:
-            return any(c.kind in ("payable", "delivery_obligation") for c in system.state.contracts.values())
+            return system.state.open_obligations > 0
         except Exception:
             return False
     has_open = _has_open_obligations()
@@ -13,6 +13,7 @@ from bilancio.engines.system import System
 from bilancio.engines.simulation import run_day, run_until_stable
 from bilancio.core.errors import ValidationError, DefaultError
 from bilancio.config import load_yaml, apply_to_system
+from bilancio.config.apply import schedule_actions
 from bilancio.export.writers import write_balances_csv, write_events_jsonl
 
 from .display import (
@@ -71,7 +72,7 @@ def run_scenario(
         show: "summary", "detailed" or "table" for event display
         agent_ids: List of agent IDs to show balances for
         check_invariants: "setup", "daily", or "none"
-        export: Dictionary with export paths (balances_csv, events_jsonl)
+        export: Dictionary with export paths (balances_csv, events_jsonl, phase_timings_csv)
         html_output: Optional path to export HTML with colored output
         progress_callback: Optional callback(current_day, max_days) for progress tracking
     """
@@ -88,6 +89,8 @@ def run_scenario(
 
     # Create and configure system with selected default-handling mode
     system = System(default_mode=effective_default_handling)
+    # Pooled holdings must be on before setup mints cash/reserves
+    system.state.pooled_holdings = config.run.pooled_holdings
     # Preflight schedule validation (aliases available when referenced)
     try:
         from bilancio.config.apply import validate_scheduled_aliases
@@ -117,17 +120,13 @@ def run_scenario(
     
     # Plan 024: Enable rollover if configured
     system.state.rollover_enabled = config.run.rollover_enabled
+    system.state.clearing_mode = config.run.clearing_mode
+    system.state.settlement_mode = config.run.settlement_mode
 
     # Stage scheduled actions into system state (Phase B1 execution by day)
-    try:
-        if getattr(config, 'scheduled_actions', None):
-            for sa in config.scheduled_actions:
-                day = sa.day
-                system.state.scheduled_actions_by_day.setdefault(day, []).append(sa.action)
-    except Exception:
-        # Keep robust even if config lacks scheduled actions
-        pass
-    
+    if config.scheduled_actions:
+        schedule_actions(system, config.scheduled_actions)
+
     # Use config settings unless overridden by CLI
     if agent_ids is None and config.run.show.balances:
         agent_ids = config.run.show.balances
@@ -140,6 +139,12 @@ def run_scenario(
         export['balances_csv'] = config.run.export.balances_csv
     if not export.get('events_jsonl') and config.run.export.events_jsonl:
         export['events_jsonl'] = config.run.export.events_jsonl
+    if not export.get('phase_timings_csv') and config.run.export.phase_timings_csv:
+        export['phase_timings_csv'] = config.run.export.phase_timings_csv
+
+    if export.get('phase_timings_csv'):
+        from bilancio.engines.instrumentation import PhaseTimer
+        system.phase_timer = PhaseTimer()
     
     # Plan 030: Check for quiet mode (show="none") to suppress verbose output
     quiet_mode = show == "none"
@@ -230,6 +235,11 @@ def run_scenario(
         write_events_jsonl(system, export_path)
         console.print(f"[green]OK[/green] Exported events to {export_path}")
 
+    if export.get('phase_timings_csv'):
+        export_path = Path(export['phase_timings_csv'])
+        system.phase_timer.to_csv(export_path)
+        console.print(f"[green]OK[/green] Exported phase timings to {export_path}")
+
     # Export dealer metrics if dealer subsystem is enabled
     if enable_dealer and hasattr(system.state, 'dealer_subsystem') and system.state.dealer_subsystem is not None:
         dealer_metrics_path = None
@@ -359,14 +369,14 @@ def run_step_mode(
             
             # Check invariants if requested
             if check_invariants == "daily":
-                system.assert_invariants()
+                system.assert_invariants(mode="incremental")
             
             # Skip day 0 display - it's already shown as "Day 0 (After Setup)"
             # But still capture Day 0 simulation events for HTML export
             if day_before == 0:
                 # Only capture Day 0 simulation events for HTML
-                day0_events = [e for e in system.state.events
-                              if e.get("day") == 0 and e.get("phase") == "simulation"]
+                day0_events = [e for e in system.state.events.for_day(0)
+                              if e.get("phase") == "simulation"]
                 if day0_events:
                     days_data.append({
                         'day': 0,
@@ -387,8 +397,8 @@ def run_step_mode(
                 
                 # Collect day data for HTML export  
                 # Use the actual event day
-                day_events = [e for e in system.state.events 
-                             if e.get("day") == day_before and e.get("phase") == "simulation"]
+                day_events = [e for e in system.state.events.for_day(day_before)
+                             if e.get("phase") == "simulation"]
                 
                 # Capture current balance state for this day
                 day_balances: Dict[str, Any] = {}
@@ -536,8 +546,8 @@ def run_until_stable_mode(
             # But still capture Day 0 simulation events for HTML export
             if day_before == 0:
                 # Only capture Day 0 simulation events for HTML
-                day0_events = [e for e in system.state.events
-                              if e.get("day") == 0 and e.get("phase") == "simulation"]
+                day0_events = [e for e in system.state.events.for_day(0)
+                              if e.get("phase") == "simulation"]
                 if day0_events:
                     days_data.append({
                         'day': 0,
@@ -557,7 +567,7 @@ def run_until_stable_mode(
                 # Check invariants if requested
                 if check_invariants == "daily":
                     try:
-                        system.assert_invariants()
+                        system.assert_invariants(mode="incremental")
                     except Exception as e:
                         if not quiet_mode:
                             console.print(f"[yellow][!] Invariant check failed: {e}[/yellow]")
@@ -575,8 +585,8 @@ def run_until_stable_mode(
                 # Collect day data for HTML export
                 # We want simulation events from the day that was just displayed
                 # show_day_summary was called with day=day_before
-                day_events = [e for e in system.state.events
-                             if e.get("day") == day_before and e.get("phase") == "simulation"]
+                day_events = [e for e in system.state.events.for_day(day_before)
+                             if e.get("phase") == "simulation"]
                 # Plan 024: stability check accounts for rollover mode
                 is_stable = consecutive_quiet >= quiet_days
                 if not system.state.rollover_enabled:
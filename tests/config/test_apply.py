@@ -5,7 +5,7 @@ from decimal import Decimal
 
 from bilancio.engines.system import System
 from bilancio.config.models import ScenarioConfig, AgentSpec
-from bilancio.config.apply import apply_to_system, create_agent, apply_action
+from bilancio.config.apply import apply_to_system, create_agent, apply_action, apply_policy_overrides
 from bilancio.domain.agents import Bank, Household, CentralBank, Firm
 
 
@@ -128,6 +128,16 @@ class TestApplyToSystem:
         # Check policy was updated
         assert system.policy.mop_rank["household"] == ["cash", "bank_deposit"]
         assert system.policy.mop_rank["bank"] == ["reserve_deposit"]
+
+    def test_policy_overrides_invalidate_memoized_answers(self):
+        """Overrides replace answers the policy memoized before."""
+        system = System()
+        household = Household(id="H1", name="H", kind="household")
+        assert list(system.policy.settlement_order(household)) == ["bank_deposit", "cash"]
+
+        apply_policy_overrides(system, {"mop_rank": {"household": ["cash"]}})
+
+        assert list(system.policy.settlement_order(household)) == ["cash"]
     
     def test_apply_complex_scenario(self):
         """Test applying a complex scenario with multiple actions."""
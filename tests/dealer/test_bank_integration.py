@@ -170,6 +170,34 @@ class TestBankAwareTraderState:
         assert trader.shortfall(5) == Decimal("50")  # 100 due - 50 deposits
         assert trader.shortfall(6) == Decimal("0")  # Nothing due on day 6
 
+    def test_due_window_queries_include_loans(self):
+        """Windowed shortfall and next liability day see both payables and loans."""
+        trader = BankAwareTraderState(agent_id="H1", bank_id="bank_1")
+        trader.add_deposit(Decimal("50"), Decimal("0.02"), day=1)
+
+        class MockTicket:
+            def __init__(self, face, maturity_day):
+                self.face = face
+                self.maturity_day = maturity_day
+
+        trader.obligations.append(MockTicket(Decimal("30"), 4))
+        trader.obligations.append(MockTicket(Decimal("40"), 9))
+        trader.add_loan(TraderLoan(
+            loan_id="loan_1",
+            borrower_id="H1",
+            bank_id="bank_1",
+            principal=Decimal("100"),
+            rate=Decimal("0"),
+            issuance_day=1,
+            maturity_day=6,
+        ))
+
+        assert trader.max_shortfall(0, 5) == Decimal("0")
+        assert trader.max_shortfall(0, 10) == Decimal("50")  # loan of 100 on day 6
+        assert trader.max_payment_due(7, 10) == Decimal("40")
+        assert trader.earliest_liability_day(4) == 6
+        assert trader.earliest_liability_day(6) == 9
+
 
 class TestInterbankLedger:
     """Tests for InterbankLedger."""
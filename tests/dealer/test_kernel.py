@@ -10,8 +10,13 @@ References:
 - Examples Document: Balanced dealer state example
 """
 
+import random
+import subprocess
+import sys
+
+import numpy as np
 import pytest
-from decimal import Decimal
+from decimal import Decimal, localcontext
 from copy import deepcopy
 
 from bilancio.dealer import (
@@ -19,13 +24,19 @@ from bilancio.dealer import (
     DealerState,
     VBTState,
     KernelParams,
+    KernelAudit,
+    QuoteCache,
     recompute_dealer_state,
+    recompute_dealer_state_batch,
+    audit_dealer_state,
+    kernel_quotes,
     can_interior_buy,
     can_interior_sell,
     assert_c2_quote_bounds,
     assert_c5_equity_basis,
 )
 from bilancio.core.ids import new_id
+from bilancio.dealer.metrics import RunMetrics
 
 
 # Helper function to create test fixtures
@@ -752,3 +763,187 @@ class TestKernelRecomputation:
         assert dealer.x == x_before + params.S
         assert dealer.a == 3
         assert dealer.V > V_before  # V increased (assuming M > 0)
+
+
+class TestKernelAudit:
+    """Test the float kernel and its sampled audit against the Decimal kernel."""
+
+    # Cent-valued inputs, not binary-exact; some have V/M an exact integer
+    STATES = [
+        (a, cash, M)
+        for a in [0, 1, 2, 3, 18]
+        for cash in [Decimal(0), Decimal("0.2"), Decimal("1.97"), Decimal("20.16")]
+        for M in [Decimal("0.01"), Decimal("0.14"), Decimal("0.47"), Decimal("0.73"), Decimal(1)]
+    ]
+
+    def assert_matches(self, dealer, vbt, a, cash, M):
+        quotes = kernel_quotes(a, float(cash), float(M), float(vbt.O), float(vbt.A), float(vbt.B))
+        assert quotes.K_star == dealer.K_star
+        assert quotes.is_pinned_bid == dealer.is_pinned_bid
+        assert quotes.is_pinned_ask == dealer.is_pinned_ask
+        for name in ("X_star", "lambda_", "I", "midline", "bid", "ask"):
+            assert getattr(quotes, name) == pytest.approx(float(getattr(dealer, name)), abs=1e-12)
+
+    def test_float_kernel_matches_decimal(self):
+        for a, cash, M in self.STATES:
+            for O in [Decimal("0.18"), Decimal("0.30")]:
+                dealer, vbt, _ = make_dealer_vbt(a=a, cash=cash, M=M, O=O)
+                self.assert_matches(dealer, vbt, a, cash, M)
+
+    def test_float_capacity_at_integer_ratio(self):
+        """V/M = 22.68/0.14 = 162 exactly; plain float division gives 161.99..."""
+        dealer, vbt, _ = make_dealer_vbt(a=18, cash=Decimal("20.16"), M=Decimal("0.14"))
+        assert dealer.K_star == 162
+        self.assert_matches(dealer, vbt, 18, Decimal("20.16"), Decimal("0.14"))
+
+    def test_float_kernel_random_cent_states(self):
+        rng = random.Random(3)
+        for _ in range(3000):
+            a = rng.randint(0, 30)
+            cash = Decimal(rng.randint(0, 3000)) / 100
+            M = Decimal(rng.randint(3, 150)) / 100
+            spread = Decimal(rng.randint(1, 60)) / 100
+            dealer, vbt, _ = make_dealer_vbt(a=a, cash=cash, M=M, O=spread)
+            self.assert_matches(dealer, vbt, a, cash, M)
+
+    def test_audit_every_recomputation(self):
+        for a, cash, M in self.STATES:
+            dealer, vbt, params = make_dealer_vbt(a=a, cash=cash, M=M, O=Decimal("0.18"))
+            params.audit = KernelAudit(every=1)
+            recompute_dealer_state(dealer, vbt, params)
+            recompute_dealer_state(dealer, vbt, params)
+            assert params.audit.checked == 2
+
+    def test_audit_samples_every_nth(self):
+        dealer, vbt, params = make_dealer_vbt()
+        params.audit = KernelAudit(every=3)
+        for _ in range(7):
+            recompute_dealer_state(dealer, vbt, params)
+        assert (params.audit.recomputes, params.audit.checked) == (7, 2)
+
+    def test_audit_detects_mismatch(self):
+        dealer, vbt, params = make_dealer_vbt()
+        dealer.bid += Decimal("0.01")
+        with pytest.raises(AssertionError, match="bid"):
+            audit_dealer_state(dealer, vbt, params)
+
+
+class TestQuoteCache:
+    """Test memoized kernel outputs."""
+
+    def cached(self, **kwargs):
+        """make_dealer_vbt, recomputed once more with a fresh cache."""
+        dealer, vbt, params = make_dealer_vbt(**kwargs)
+        params.cache = QuoteCache()
+        recompute_dealer_state(dealer, vbt, params)
+        return dealer, vbt, params
+
+    def test_off_by_default(self):
+        assert KernelParams().cache is None
+
+    def test_repeated_state_hits(self):
+        dealer, vbt, params = self.cached()
+        assert (params.cache.hits, params.cache.misses) == (0, 1)
+        recompute_dealer_state(dealer, vbt, params)
+        assert (params.cache.hits, params.cache.misses) == (1, 1)
+        assert params.cache.hit_rate == 0.5
+        assert dealer.ask == Decimal("1.03")
+        assert dealer.bid == Decimal("0.97")
+
+    def test_cached_results_match_uncached(self):
+        for a in [0, 1, 2, 4]:
+            for M in [Decimal("0.01"), Decimal("0.73"), Decimal(1)]:
+                cached, vbt, params = self.cached(a=a, M=M)
+                recompute_dealer_state(cached, vbt, params)
+                fresh = deepcopy(cached)
+                recompute_dealer_state(fresh, vbt, KernelParams(S=params.S, cache=None))
+                assert params.cache.hits >= 1
+                assert repr(cached) == repr(fresh)
+
+    def test_changed_inputs_are_new_states(self):
+        dealer, vbt, params = self.cached()
+        dealer.cash -= Decimal("0.97")
+        recompute_dealer_state(dealer, vbt, params)
+        vbt.M = Decimal("0.9")
+        vbt.recompute_quotes()
+        recompute_dealer_state(dealer, vbt, params)
+        assert params.cache.hits == 0
+        # Equal values with different exponents are kept apart
+        dealer.cash = Decimal("1.030")
+        recompute_dealer_state(dealer, vbt, params)
+        assert params.cache.hits == 0
+        assert str(dealer.V) == str(vbt.M * 2 + Decimal("1.030"))
+
+    def test_decimal_context_is_part_of_key(self):
+        dealer, vbt, params = self.cached(M=Decimal("0.7"), O=Decimal("0.3"))
+        with localcontext() as context:
+            context.prec = 6
+            recompute_dealer_state(dealer, vbt, params)
+            assert (params.cache.hits, params.cache.misses) == (0, 2)
+
+    def test_stats_in_run_summary(self):
+        dealer, vbt, params = self.cached()
+        recompute_dealer_state(dealer, vbt, params)
+        summary = RunMetrics(quote_cache=params.cache).summary()
+        assert summary["quote_cache_hits"] == 1
+        assert summary["quote_cache_misses"] == 1
+        assert "quote_cache_hits" not in RunMetrics().summary()
+
+    def test_bounded(self):
+        cache = QuoteCache(maxsize=2)
+        cache.put(("a",), (1,))
+        cache.put(("b",), (2,))
+        assert cache.get(("a",)) == (1,)
+        cache.put(("c",), (3,))
+        assert len(cache) == 2
+        assert cache.get(("b",)) is None  # least recently used was evicted
+        assert cache.get(("a",)) == (1,)
+        cache.clear()
+        assert (len(cache), cache.hits, cache.misses) == (0, 0, 0)
+
+
+class TestBatchKernel:
+    """Test the vectorized kernel against the scalar kernels."""
+
+    def test_dealer_import_does_not_load_numpy(self):
+        code = "import sys, bilancio.dealer; assert 'numpy' not in sys.modules"
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def grid(self, O=Decimal("0.18")):
+        states = TestKernelAudit.STATES + [(0, Decimal("0.2"), Decimal("0.47"))]
+        dealers = [make_dealer_vbt(a=a, cash=cash, M=M, O=O)[:2] for a, cash, M in states]
+        a = np.array([state[0] for state in states])
+        cash = np.array([float(state[1]) for state in states])
+        M = np.array([float(state[2]) for state in states])
+        A = np.array([float(vbt.A) for _, vbt in dealers])
+        B = np.array([float(vbt.B) for _, vbt in dealers])
+        return dealers, a, cash, M, A, B
+
+    def test_matches_scalar_float_kernel(self):
+        dealers, a, cash, M, A, B = self.grid()
+        batch = recompute_dealer_state_batch(a, cash, M, 0.18, A=A, B=B)
+        assert batch.K_star.dtype == np.int64
+        for i, (n, c, m) in enumerate(zip(a, cash, M, strict=True)):
+            scalar = kernel_quotes(int(n), float(c), float(m), 0.18, float(A[i]), float(B[i]))
+            assert tuple(field[i] for field in batch) == scalar
+
+    def test_matches_decimal_kernel(self):
+        """Also with A and B derived in floats from M and O."""
+        dealers, a, cash, M, A, B = self.grid()
+        for batch in (
+            recompute_dealer_state_batch(a, cash, M, 0.18, S=1.0, A=A, B=B),
+            recompute_dealer_state_batch(a, cash, M, 0.18, S=1.0),
+        ):
+            for i, (dealer, _) in enumerate(dealers):
+                assert batch.K_star[i] == dealer.K_star
+                assert batch.is_pinned_bid[i] == dealer.is_pinned_bid
+                assert batch.is_pinned_ask[i] == dealer.is_pinned_ask
+                for name in ("X_star", "lambda_", "I", "midline", "bid", "ask"):
+                    expected = float(getattr(dealer, name))
+                    assert getattr(batch, name)[i] == pytest.approx(expected, abs=1e-12)
+
+    def test_guard_with_zero_mid(self):
+        batch = recompute_dealer_state_batch([2, 2], [1.0, 1.0], [0.0, 1.0], [0.30, 0.30])
+        assert batch.K_star.tolist() == [0, 3]
+        assert batch.is_pinned_bid.tolist() == [True, False]
+        assert batch.bid[0] == 0.0  # outside bid clipped at 0
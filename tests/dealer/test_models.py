@@ -0,0 +1,131 @@
+"""
+Tests for ticket containers: TicketInventory and the trader due schedule
+(DueSchedule / ObligationList).
+
+Containers must behave like the plain lists they replace, and the indexed
+due-date queries must agree with a plain scan of the obligations however
+they are mutated.
+"""
+
+from copy import deepcopy
+from decimal import Decimal
+
+from bilancio.dealer.models import DealerState, Ticket, TicketInventory, TraderState
+
+
+def make_ticket(serial: int, maturity_day: int, face: str = "1") -> Ticket:
+    return Ticket(
+        id=f"T{serial}",
+        issuer_id="H1",
+        owner_id="H2",
+        face=Decimal(face),
+        maturity_day=maturity_day,
+        remaining_tau=maturity_day,
+        serial=serial,
+    )
+
+
+def scan_due(trader: TraderState, day: int) -> Decimal:
+    return sum(t.face for t in trader.obligations if t.maturity_day == day)
+
+
+class TestTicketInventory:
+    """Insertion-ordered, id-keyed ticket container."""
+
+    def test_behaves_like_list_of_distinct_tickets(self):
+        tickets = [make_ticket(i, 5) for i in range(6)]
+        inventory = TicketInventory(tickets[:4])
+        reference = list(tickets[:4])
+
+        for ticket in (tickets[4], tickets[5]):
+            inventory.append(ticket)
+            reference.append(ticket)
+        inventory.remove(tickets[1])
+        reference.remove(tickets[1])
+        assert inventory.pop(0) is reference.pop(0)
+        inventory.insert(1, tickets[1])
+        reference.insert(1, tickets[1])
+
+        assert inventory == reference
+        assert len(inventory) == len(reference)
+        assert inventory[0] is reference[0] and inventory[-1] is reference[-1]
+        assert inventory[2] is reference[2]
+        assert inventory[1:3] == reference[1:3]
+        assert inventory.index(tickets[4]) == reference.index(tickets[4])
+        assert tickets[0] not in inventory and tickets[3] in inventory
+
+    def test_membership_by_id_and_value(self):
+        ticket = make_ticket(1, 5)
+        inventory = TicketInventory([ticket])
+        assert make_ticket(1, 5) in inventory      # equal copy
+        assert make_ticket(1, 6) not in inventory  # same id, different ticket
+        assert inventory.get("T1") is ticket
+
+        inventory.append(ticket)
+        assert len(inventory) == 1
+        inventory.discard(make_ticket(2, 5))
+        inventory.discard(ticket)
+        assert not inventory
+
+    def test_remove_missing_raises(self):
+        inventory = TicketInventory([make_ticket(1, 5)])
+        try:
+            inventory.remove(make_ticket(2, 5))
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("expected ValueError")
+
+    def test_states_wrap_plain_lists(self):
+        tickets = [make_ticket(i, 5) for i in range(3)]
+        dealer = DealerState(bucket_id="short", inventory=list(tickets))
+        trader = TraderState(agent_id="H2", tickets_owned=list(tickets))
+        assert isinstance(dealer.inventory, TicketInventory)
+        assert isinstance(trader.tickets_owned, TicketInventory)
+        assert list(dealer.inventory) == tickets
+
+        clone = deepcopy(dealer)
+        clone.inventory.pop()
+        assert len(clone.inventory) == 2 and len(dealer.inventory) == 3
+
+
+class TestTraderDueSchedule:
+    """TraderState due-date queries backed by the obligations index."""
+
+    def test_matches_scan_through_mutations(self):
+        trader = TraderState(agent_id="H1", cash=Decimal("1.5"))
+        tickets = [make_ticket(i, 3 + i % 4, face=str(1 + i % 3)) for i in range(12)]
+        for ticket in tickets[:8]:
+            trader.obligations.append(ticket)
+        trader.obligations.extend(tickets[8:])
+        trader.obligations.remove(tickets[2])
+        trader.obligations.pop(0)
+        trader.obligations.insert(1, tickets[2])
+        del trader.obligations[-1]
+
+        for day in range(0, 9):
+            assert trader.payment_due(day) == scan_due(trader, day)
+            assert trader.shortfall(day) == max(Decimal(0), scan_due(trader, day) - trader.cash)
+            future = [t.maturity_day for t in trader.obligations if t.maturity_day > day]
+            assert trader.earliest_liability_day(day) == (min(future) if future else None)
+
+        assert trader.max_payment_due(0, 10) == max(scan_due(trader, d) for d in range(11))
+        assert trader.max_shortfall(4, 5) == max(trader.shortfall(4), trader.shortfall(5))
+
+    def test_empty_and_reassigned(self):
+        trader = TraderState(agent_id="H1", cash=Decimal(2))
+        assert trader.payment_due(5) == 0
+        assert trader.earliest_liability_day(0) is None
+        assert trader.max_shortfall(0, 10) == Decimal(0)
+
+        trader.obligations = [make_ticket(1, 4, face="5")]
+        assert isinstance(trader.obligations, list)
+        assert trader.max_shortfall(0, 10) == Decimal(3)
+        assert isinstance(trader.obligations, list)
+
+    def test_copy_rebuilds_schedule(self):
+        trader = TraderState(agent_id="H1", obligations=[make_ticket(1, 4), make_ticket(2, 4)])
+        clone = deepcopy(trader)
+        clone.obligations.pop()
+        assert clone.payment_due(4) == Decimal(1)
+        assert trader.payment_due(4) == Decimal(2)
@@ -35,6 +35,7 @@ from bilancio.dealer import (
     recompute_dealer_state,
     run_all_assertions,
 )
+from bilancio.dealer.ticket_schedule import bucket_edges
 from bilancio.core.ids import new_id
 
 
@@ -174,6 +175,16 @@ class TestSimulationInit:
         assert sim.vbts["mid"].A == Decimal("1.15")
         assert sim.vbts["mid"].B == Decimal("0.85")
 
+    def test_kernel_audit_runs_in_simulation(self):
+        """kernel_audit_every cross-checks the float kernel during a run."""
+        sim = DealerRingSimulation(DealerRingConfig(kernel_audit_every=1, seed=3))
+        assert sim.params.cache is None
+        traders = create_ring_traders(6)
+        sim.setup_ring(traders, create_ring_tickets(traders, starting_tau=4, starting_maturity=4))
+        sim.run(max_days=5)
+
+        assert sim.params.audit.checked == sim.params.audit.recomputes > 0
+
 
 # =========================================================================
 # Test: Ring Setup
@@ -351,6 +362,77 @@ class TestPhase1MaturityUpdates:
         assert sim.all_tickets[ticket.id].remaining_tau == 3
         assert sim.all_tickets[ticket.id].bucket_id == "short"
 
+    def test_rebucket_across_days_matches_remaining_tau(self):
+        """Indexed rebucketing keeps bucket_id in step with remaining_tau over many days."""
+        config = DealerRingConfig(
+            dealer_share=Decimal(0),
+            vbt_share=Decimal(0),
+        )
+        sim = DealerRingSimulation(config)
+
+        traders = [create_trader(cash=Decimal(100))]
+        tickets = [
+            create_ticket(traders[0].agent_id, traders[0].agent_id,
+                          remaining_tau=tau, maturity_day=tau, serial=tau)
+            for tau in (1, 4, 9, 12)
+        ]
+        sim.setup_ring(traders, tickets)
+        # A ticket added to the registry directly, with a stale bucket
+        late = create_ticket("other", traders[0].agent_id, remaining_tau=10, maturity_day=30, bucket_id="short")
+        sim.all_tickets[late.id] = late
+
+        for _ in range(13):
+            sim.run_day()
+            for ticket in sim.all_tickets.values():
+                if ticket.remaining_tau > 0:
+                    assert ticket.bucket_id == sim._compute_bucket(ticket.remaining_tau)
+
+        assert [t.remaining_tau for t in tickets] == [0, 0, 0, 0]
+        assert late.remaining_tau == 0
+        assert sim.ticket_schedule.maturing(12) == [tickets[3]]
+
+    def test_maturity_update_derives_remaining_tau(self):
+        """The daily update ticks the schedule's clock; no ticket is written."""
+        sim = DealerRingSimulation(DealerRingConfig())
+        ticket = create_ticket("A", "B", remaining_tau=5, maturity_day=5)
+        sim.all_tickets[ticket.id] = ticket
+        assert ticket._clock is sim.ticket_schedule.clock
+
+        sim._update_maturities()
+        sim._update_maturities()
+        assert ticket.remaining_tau == 3
+        ticket.remaining_tau = 7          # reassigning moves the countdown
+        sim._update_maturities()
+        assert ticket.remaining_tau == 6
+
+        del sim.all_tickets[ticket.id]    # removed tickets stop counting down
+        assert ticket._clock is None
+        sim._update_maturities()
+        assert ticket.remaining_tau == 6
+
+    def test_schedule_tracks_remove_and_add_on_same_day(self):
+        """Removing and adding tickets between updates keeps the index current."""
+        sim = DealerRingSimulation(DealerRingConfig())
+        old = create_ticket("A", "B", remaining_tau=4, maturity_day=4)
+        sim.all_tickets[old.id] = old
+        sim._update_maturities()
+
+        # Same registry size, different ticket
+        sim.all_tickets.pop(old.id)
+        new = create_ticket("C", "D", remaining_tau=3, maturity_day=4, bucket_id="mid")
+        sim.all_tickets[new.id] = new
+
+        assert sim.ticket_schedule.maturing(4) == [new]
+        sim._update_maturities()
+        assert sim.ticket_schedule.crossing() == [new]
+        assert new.remaining_tau == 2
+        assert old.remaining_tau == 3
+
+    def test_bucket_edges_default_buckets(self):
+        """Tickets re-bucket when remaining_tau drops to 8 (long->mid) or 3 (mid->short)."""
+        sim = DealerRingSimulation(DealerRingConfig())
+        assert bucket_edges(sim.config.buckets, sim._compute_bucket) == [3, 8]
+
 
 class TestDealerRebucketing:
     """
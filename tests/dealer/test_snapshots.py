@@ -0,0 +1,167 @@
+"""
+Tests for delta-encoded day snapshots (SnapshotLog).
+
+Snapshots read back from the log must equal the full snapshots that were
+recorded, while unchanged entities are not stored again.
+"""
+
+import random
+from decimal import Decimal
+
+import pytest
+
+from bilancio.dealer.events import EventLog
+from bilancio.dealer.models import Ticket, TraderState
+from bilancio.dealer.report import generate_dealer_ring_html
+from bilancio.dealer.simulation import DaySnapshot, DealerRingConfig, DealerRingSimulation
+from bilancio.dealer.snapshots import KEYFRAME_INTERVAL, SnapshotLog
+
+SECTIONS = ("dealers", "vbts", "traders", "tickets")
+TICKET_LISTS = {"traders": {"tickets_owned": ("id", "remaining_tau")}}
+
+
+def full_frame(day, tickets, traders):
+    """The full snapshot sections of one synthetic day."""
+    return {
+        "dealers": {"short": {"cash": Decimal(day)}},
+        "vbts": {"short": {"M": Decimal(1)}},
+        "traders": {
+            agent: {"cash": cash, "tickets_owned": [{"id": t, "remaining_tau": tickets[t]["remaining_tau"]} for t in held]}
+            for agent, (cash, held) in traders.items()
+        },
+        "tickets": {tid: dict(t) for tid, t in tickets.items()},
+    }
+
+
+def encoded(frame):
+    """``frame`` with trader ticket lists given as ids, as the simulations pass them."""
+    traders = {
+        agent: {**trader, "tickets_owned": tuple(e["id"] for e in trader["tickets_owned"])}
+        for agent, trader in frame["traders"].items()
+    }
+    return {**frame, "traders": traders}
+
+
+class TestSnapshotLog:
+
+    def test_round_trip(self):
+        events = EventLog()
+        log = SnapshotLog(DaySnapshot, SECTIONS, events, ticket_lists=TICKET_LISTS)
+        tickets = {
+            "T1": {"id": "T1", "owner_id": "A", "remaining_tau": 3},
+            "T2": {"id": "T2", "owner_id": "B", "remaining_tau": 1},
+            "T3": {"id": "T3", "owner_id": "B", "remaining_tau": 5},
+        }
+        traders = {"A": (Decimal(1), ["T1"]), "B": (Decimal(2), ["T2", "T3"])}
+
+        frames = []
+        for day in range(5):
+            events.log("day_start", day)
+            if day == 2:
+                tickets["T1"]["owner_id"] = "B"          # changed field
+                traders = {"B": (Decimal(3), ["T3", "T1"]), "A": (Decimal(0), [])}  # reordered
+            if day == 3:
+                tickets["T3"]["remaining_tau"] += 2      # countdown deviates
+                del tickets["T2"]                        # removed
+                traders = {"B": (Decimal(3), ["T3", "T1"]), "A": (Decimal(0), [])}
+            frame = full_frame(day, tickets, traders)
+            frames.append(frame)
+            log.record(day, **encoded(frame))
+            for t in tickets.values():
+                t["remaining_tau"] = max(0, t["remaining_tau"] - 1)
+
+        assert len(log) == 5
+        for day, (snapshot, frame) in enumerate(zip(log, frames)):
+            assert snapshot.day == day
+            for name in SECTIONS:
+                assert getattr(snapshot, name) == frame[name]
+                assert list(getattr(snapshot, name)) == list(frame[name])
+            assert [e["kind"] for e in snapshot.events] == ["day_start"]
+        assert log[3].tickets == frames[3]["tickets"]
+        assert log.for_day(4).traders == frames[4]["traders"]
+        with pytest.raises(KeyError):
+            log.for_day(9)
+
+    def test_unchanged_entities_not_stored_again(self):
+        log = SnapshotLog(DaySnapshot, SECTIONS, EventLog(), ticket_lists=TICKET_LISTS)
+        tickets = {f"T{i}": {"id": f"T{i}", "remaining_tau": 10 + i} for i in range(50)}
+        traders = {"A": (Decimal(1), list(tickets))}
+        for day in range(10):
+            log.record(day, **encoded(full_frame(day, tickets, traders)))
+            for t in tickets.values():
+                t["remaining_tau"] -= 1
+
+        # Day 0 stores everything; later days only the dealer whose cash changed
+        stored = [sum(len(changed) for changed, _, _ in delta.values()) for delta in log._deltas]
+        assert stored[0] == 53
+        assert stored[1:] == [1] * 9
+        assert log[-1].traders["A"]["tickets_owned"][0] == {"id": "T0", "remaining_tau": 1}
+
+    def test_random_access_matches_iteration(self):
+        events = EventLog()
+        log = SnapshotLog(DaySnapshot, SECTIONS, events, ticket_lists=TICKET_LISTS)
+        tickets = {f"T{i}": {"id": f"T{i}", "owner_id": "A", "remaining_tau": 200} for i in range(5)}
+        days = 3 * KEYFRAME_INTERVAL + 5
+        for day in range(days):
+            events.log("day_start", day)
+            tickets[f"T{day % 5}"]["owner_id"] = f"A{day}"
+            if day % 7 == 0:
+                tickets[f"X{day}"] = {"id": f"X{day}", "owner_id": "B", "remaining_tau": 3}
+            traders = {"A": (Decimal(day), sorted(tickets, reverse=day % 2 == 0))}
+            log.record(day, **encoded(full_frame(day, tickets, traders)))
+            for t in tickets.values():
+                t["remaining_tau"] = max(0, t["remaining_tau"] - 1)
+
+        in_order = list(log)
+        rng = random.Random(3)
+        indexes = [rng.randrange(days) for _ in range(60)] + [days - 1, 0, -1, KEYFRAME_INTERVAL - 1]
+        for index in indexes:
+            expected = in_order[index]
+            snapshot = log[index]
+            for name in SECTIONS:
+                assert getattr(snapshot, name) == getattr(expected, name)
+                assert list(getattr(snapshot, name)) == list(getattr(expected, name))
+            assert log.for_day(expected.day).tickets == expected.tickets
+        assert [s.day for s in log[10:50:7]] == [s.day for s in in_order[10:50:7]]
+
+
+def run_simulation(days: int) -> DealerRingSimulation:
+    sim = DealerRingSimulation(DealerRingConfig(seed=7, max_days=days))
+    traders = [TraderState(agent_id=f"H{i}", cash=Decimal("0.5")) for i in range(1, 7)]
+    tickets = []
+    for i, trader in enumerate(traders):
+        ticket = Ticket(
+            id=f"T{i}",
+            issuer_id=trader.agent_id,
+            owner_id=traders[(i + 1) % len(traders)].agent_id,
+            face=Decimal(1),
+            maturity_day=2 + i,
+            remaining_tau=2 + i,
+            serial=i,
+        )
+        trader.obligations.append(ticket)
+        tickets.append(ticket)
+    sim.setup_ring(traders, tickets)
+    sim.run(max_days=days)
+    return sim
+
+
+class TestSimulationSnapshots:
+
+    def test_snapshot_days_and_events(self):
+        sim = run_simulation(4)
+        assert [s.day for s in sim.snapshots] == [0, 1, 2, 3, 4]
+        assert sim.snapshots.days() == [0, 1, 2, 3, 4]
+        for snapshot in sim.snapshots:
+            assert snapshot.events == sim.events.get_events_for_day(snapshot.day)
+        # Ticket lists nested in traders are filled in from the tickets section
+        for snapshot in sim.snapshots:
+            for trader in snapshot.traders.values():
+                for entry in trader["tickets_owned"]:
+                    assert entry["remaining_tau"] == snapshot.tickets[entry["id"]]["remaining_tau"]
+
+    def test_report_renders_selected_days(self):
+        sim = run_simulation(3)
+        html = generate_dealer_ring_html(sim.snapshots, sim.config, days={2})
+        assert "Day 2" in html
+        assert "Day 1" not in html and "Day 0 (Setup)" not in html
@@ -1,8 +1,9 @@
 import pytest
 
+from bilancio.core.atomic_tx import atomic
 from bilancio.core.errors import DefaultError
 from bilancio.domain.instruments.credit import Payable
-from bilancio.engines.settlement import settle_due
+from bilancio.engines.settlement import schedule_action, settle_due
 from bilancio.engines.system import System
 from bilancio.domain.agents.central_bank import CentralBank
 from bilancio.domain.agents.firm import Firm
@@ -52,12 +53,8 @@ def test_expel_mode_handles_partial_payment_and_marks_agent():
     system.mint_cash(debtor.id, 60)
 
     # Scheduled action involving debtor should be cancelled once defaulted
-    system.state.scheduled_actions_by_day[2] = [
-        {"mint_cash": {"to": debtor.id, "amount": 10}}
-    ]
-    system.state.scheduled_actions_by_day[3] = [
-        {"transfer_claim": {"contract_alias": "PAY1", "to_agent": creditor.id}}
-    ]
+    schedule_action(system, 2, {"mint_cash": {"to": debtor.id, "amount": 10}})
+    schedule_action(system, 3, {"transfer_claim": {"contract_alias": "PAY1", "to_agent": creditor.id}})
 
     settle_due(system, 1)
 
@@ -100,3 +97,41 @@ def test_expel_mode_handles_partial_payment_and_marks_agent():
 
     agent_event = next(e for e in system.state.events if e["kind"] == "AgentDefaulted")
     assert agent_event["frm"] == debtor.id
+
+
+def test_expel_only_rewrites_days_referencing_the_agent():
+    system, _, debtor, creditor = _basic_system(default_mode="expel-agent")
+    other = Firm(id="F2", name="Other", kind="firm")
+    system.add_agent(other)
+    _make_payable(system, debtor, creditor, amount=100, due_day=1)
+
+    schedule_action(system, 2, {"mint_cash": {"to": other.id, "amount": 5}})
+    schedule_action(system, 3, {"mint_cash": {"to": other.id, "amount": 5}})
+    untouched = system.state.scheduled_actions_by_day[2]
+    # Stage a new action on a day that is already indexed
+    schedule_action(system, 3, {"mint_cash": {"to": debtor.id, "amount": 1}})
+    assert system.state.scheduled_days_by_ref[debtor.id] == {3}
+
+    settle_due(system, 1)
+
+    assert system.state.scheduled_actions_by_day[2] is untouched
+    assert system.state.scheduled_actions_by_day[3] == [{"mint_cash": {"to": other.id, "amount": 5}}]
+    assert debtor.id not in system.state.scheduled_days_by_ref
+    assert system.state.scheduled_refs_by_day[3] == {other.id}
+    cancelled = [e for e in system.state.events if e["kind"] == "ScheduledActionCancelled"]
+    assert [e["scheduled_day"] for e in cancelled] == [3]
+
+
+def test_schedule_action_index_rolls_back_with_the_action():
+    system, _, debtor, _ = _basic_system(default_mode="expel-agent")
+    schedule_action(system, 2, {"mint_cash": {"to": debtor.id, "amount": 5}})
+
+    with pytest.raises(RuntimeError):
+        with atomic(system):
+            schedule_action(system, 2, {"mint_cash": {"to": "F9", "amount": 1}})
+            schedule_action(system, 4, {"mint_cash": {"to": debtor.id, "amount": 1}})
+            raise RuntimeError("abort")
+
+    assert system.state.scheduled_actions_by_day == {2: [{"mint_cash": {"to": debtor.id, "amount": 5}}]}
+    assert system.state.scheduled_refs_by_day == {2: {debtor.id}}
+    assert system.state.scheduled_days_by_ref == {debtor.id: {2}}
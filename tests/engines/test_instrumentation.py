@@ -0,0 +1,53 @@
+from bilancio.domain.agents import CentralBank, Household
+from bilancio.domain.instruments.credit import Payable
+from bilancio.engines.instrumentation import (
+    PhaseTimer,
+    read_phase_timings_csv,
+    summarize_phase_timings,
+)
+from bilancio.engines.simulation import run_day
+from bilancio.engines.system import System
+
+
+def _system_with_payable():
+    system = System()
+    system.add_agent(CentralBank(id="CB", name="CB", kind="central_bank"))
+    system.add_agent(Household(id="H1", name="H1", kind="household"))
+    system.add_agent(Household(id="H2", name="H2", kind="household"))
+    system.mint_cash("H1", 100)
+    system.add_contract(Payable(id="P1", kind="payable", amount=40, denom="X",
+                                asset_holder_id="H2", liability_issuer_id="H1", due_day=1))
+    return system
+
+
+def test_run_day_records_phases_when_timer_attached(tmp_path):
+    system = _system_with_payable()
+    timer = PhaseTimer()
+    system.phase_timer = timer
+    setup_events = len(system.state.events)
+
+    run_day(system)
+    run_day(system)
+
+    assert [r.phase for r in timer.records if r.day == 0] == [
+        "PhaseA", "SubphaseB1", "SubphaseB2", "PhaseC",
+    ]
+    b2 = next(r for r in timer.records if r.day == 1 and r.phase == "SubphaseB2")
+    assert b2.events >= 2  # SubphaseB2 marker and the settlement
+    assert b2.contracts_removed >= 1  # the payable is settled and removed
+    assert b2.atomic_entries >= 1
+    assert sum(r.events for r in timer.records) == len(system.state.events) - setup_events
+
+    path = tmp_path / "phase_timings.csv"
+    timer.to_csv(path)
+    assert read_phase_timings_csv(path) == timer.records
+
+    summary = summarize_phase_timings(timer.records)
+    assert set(summary) >= {"time_PhaseA_s", "time_SubphaseB2_s", "phase_time_total_s", "slowest_phase"}
+    assert summary["phase_events"] == sum(r.events for r in timer.records)
+
+
+def test_run_day_without_timer_records_nothing():
+    system = _system_with_payable()
+    run_day(system)
+    assert system.phase_timer is None
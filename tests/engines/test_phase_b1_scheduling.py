@@ -1,7 +1,7 @@
 from pathlib import Path
 
 from bilancio.config.loaders import load_yaml
-from bilancio.config.apply import apply_to_system
+from bilancio.config.apply import apply_to_system, compile_action, schedule_actions
 from bilancio.engines.system import System
 from bilancio.engines.simulation import run_day
 
@@ -44,3 +44,87 @@ def test_b1_executes_before_b2(tmp_path: Path):
     assert "DeliveryObligationSettled" in kinds
     assert "PayableSettled" in kinds
 
+
+
+SCHEDULED = SCENARIO.replace(
+    "run: {mode: until_stable, max_days: 5}",
+    """scheduled_actions:
+  - {day: 1, action: {mint_cash: {to: F2, amount: 10}}}
+  - {day: 1, action: {transfer_cash: {from_agent: F1, to_agent: F2, amount: 5}}}
+  - {day: 2, action: {mint_cash: {to: F1, amount: 7}}}
+run: {mode: until_stable, max_days: 5}""",
+)
+
+
+def test_scheduled_actions_are_compiled_when_staged(tmp_path: Path):
+    p = tmp_path / "s.yaml"
+    p.write_text(SCHEDULED)
+    cfg = load_yaml(p)
+    sys = System()
+    apply_to_system(cfg, sys)
+    assert sys.state.scheduled_actions_by_day == {}  # staging is explicit
+    schedule_actions(sys, cfg.scheduled_actions)
+
+    by_day = sys.state.scheduled_actions_by_day
+    assert [len(by_day[1]), len(by_day[2])] == [2, 1]
+    actions, _, compiled = sys.state.compiled_actions_by_day[1]
+    assert actions is by_day[1]
+    assert [c.source for c in compiled] == by_day[1]
+    assert [c.action.action for c in compiled] == ["mint_cash", "transfer_cash"]
+
+    # Dropping an action (as default cancellation does) is picked up on use
+    first = compiled[0]
+    by_day[1] = by_day[1][:1]
+    run_day(sys)  # day 0
+    run_day(sys)  # day 1
+    assert sys.state.compiled_actions_by_day[1][2] == [first]
+    day1 = [e["kind"] for e in sys.state.events if e.get("day") == 1]
+    assert "CashMinted" in day1
+    assert "CashTransferred" not in day1
+
+
+def test_transfer_claim_applies_from_schedule(tmp_path: Path):
+    p = tmp_path / "s.yaml"
+    p.write_text(SCENARIO.replace(
+        "run: {mode: until_stable, max_days: 5}",
+        """  - {create_payable: {from: F1, to: F2, amount: 50, due_day: 3, alias: P1}}
+scheduled_actions:
+  - {day: 1, action: {transfer_claim: {contract_alias: P1, to_agent: CB}}}
+run: {mode: until_stable, max_days: 5}""",
+    ))
+    cfg = load_yaml(p)
+    sys = System()
+    apply_to_system(cfg, sys)
+    schedule_actions(sys, cfg.scheduled_actions)
+    run_day(sys)
+    run_day(sys)
+
+    payable = sys.state.contracts[sys.state.aliases["P1"]]
+    assert payable.asset_holder_id == "CB"
+    kinds = [e["kind"] for e in sys.state.events if e.get("day") == 1]
+    assert "ClaimTransferred" in kinds
+    assert "PayableCreated" not in kinds
+
+
+def test_client_payment_sees_banks_added_after_compile(tmp_path: Path):
+    from bilancio.domain.agents import Bank, Household
+    from bilancio.ops.banking import deposit_cash
+
+    p = tmp_path / "s.yaml"
+    p.write_text(SCENARIO)
+    sys = System()
+    apply_to_system(load_yaml(p), sys)
+    payment = compile_action({"client_payment": {"payer": "H1", "payee": "H2", "amount": 5}})
+
+    sys.add_agent(Bank(id="B1", name="B1", kind="bank"))
+    sys.add_agent(Bank(id="B2", name="B2", kind="bank"))
+    for h in ("H1", "H2"):
+        sys.add_agent(Household(id=h, name=h, kind="household"))
+        sys.mint_cash(h, 20)
+    deposit_cash(sys, "H1", "B1", 20)
+    deposit_cash(sys, "H2", "B2", 20)
+    sys.mint_reserves("B1", 50)
+
+    payment(sys)
+    assert sys.total_deposit("H1", "B1") == 15
+    assert sys.total_deposit("H2", "B2") == 25
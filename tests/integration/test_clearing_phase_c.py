@@ -1,6 +1,9 @@
 import pytest
 from bilancio.engines.system import System
-from bilancio.engines.clearing import settle_intraday_nets, compute_intraday_nets
+from bilancio.engines.clearing import (
+    settle_intraday_nets, compute_intraday_nets, compute_net_positions, match_net_positions,
+    scan_intraday_nets,
+)
 from bilancio.domain.agents.central_bank import CentralBank
 from bilancio.domain.agents.bank import Bank
 from bilancio.domain.agents.household import Household
@@ -203,4 +206,109 @@ def test_phase_c_no_nets_for_same_bank():
     assert sys.total_deposit("H2", "B1") == 170  # 200 + 50 - 80
     assert sys.total_deposit("H3", "B1") == 150  # 100 + 80 - 30
     
-    sys.assert_invariants()
\ No newline at end of file
+    sys.assert_invariants()
+
+
+def test_intraday_nets_accumulated_consumed_and_rolled_back():
+    """client_payment maintains the net accumulator; Phase C consumes it; failed txs roll it back."""
+    from bilancio.core.atomic_tx import atomic
+
+    sys = System()
+    sys.add_agent(CentralBank(id="CB1", name="Central Bank", kind="central_bank"))
+    for bank_id in ("B1", "B2"):
+        sys.add_agent(Bank(id=bank_id, name=bank_id, kind="bank"))
+        sys.mint_reserves(bank_id, 1000)
+    for hh_id, bank_id in (("H1", "B1"), ("H2", "B2")):
+        sys.add_agent(Household(id=hh_id, name=hh_id, kind="household"))
+        sys.mint_cash(hh_id, 100)
+        deposit_cash(sys, hh_id, bank_id, 100)
+
+    day = sys.state.day
+    client_payment(sys, "H2", "B2", "H1", "B1", 30)
+    assert sys.state.intraday_nets[day] == {("B1", "B2"): -30}
+
+    with pytest.raises(RuntimeError):
+        with atomic(sys):
+            client_payment(sys, "H1", "B1", "H2", "B2", 50)
+            assert compute_intraday_nets(sys, day) == {("B1", "B2"): 20}
+            raise RuntimeError("abort")
+    assert compute_intraday_nets(sys, day) == {("B1", "B2"): -30}
+
+    settle_intraday_nets(sys, day)
+    assert day not in sys.state.intraday_nets
+    assert compute_intraday_nets(sys, day) == {}
+    cleared = [e for e in sys.state.events if e["kind"] == "InterbankCleared"]
+    assert [(e["debtor_bank"], e["creditor_bank"], e["amount"]) for e in cleared] == [("B2", "B1", 30)]
+
+
+def _three_bank_system(reserves):
+    sys = System()
+    sys.add_agent(CentralBank(id="CB1", name="Central Bank", kind="central_bank"))
+    for i, amount in enumerate(reserves, start=1):
+        bank_id, hh_id = f"B{i}", f"H{i}"
+        sys.add_agent(Bank(id=bank_id, name=bank_id, kind="bank"))
+        if amount:
+            sys.mint_reserves(bank_id, amount)
+        sys.add_agent(Household(id=hh_id, name=hh_id, kind="household"))
+        sys.mint_cash(hh_id, 200)
+        deposit_cash(sys, hh_id, bank_id, 200)
+    # B1 owes B2 100, B2 owes B3 100 (bilaterally: two transfers)
+    client_payment(sys, "H1", "B1", "H2", "B2", 100)
+    client_payment(sys, "H2", "B2", "H3", "B3", 100)
+    return sys
+
+
+def test_phase_c_multilateral_settles_net_positions():
+    """Multilateral mode moves reserves once per net position, skipping pass-through banks."""
+    sys = _three_bank_system([1000, 1000, 1000])
+    day = sys.state.day
+
+    settle_intraday_nets(sys, day, mode="multilateral")
+
+    cleared = [e for e in sys.state.events if e["kind"] == "InterbankCleared"]
+    assert [(e["debtor_bank"], e["creditor_bank"], e["amount"]) for e in cleared] == [("B1", "B3", 100)]
+    assert sys.holding_balance("B1", "reserve_deposit") == 900
+    assert sys.holding_balance("B2", "reserve_deposit") == 1000
+    assert sys.holding_balance("B3", "reserve_deposit") == 1100
+    assert not [c for c in sys.state.contracts.values() if c.kind == "payable"]
+    sys.assert_invariants()
+
+
+def test_phase_c_multilateral_overnight_only_for_shortfall():
+    """A net payer pays what its reserves cover; only the rest becomes an overnight payable."""
+    sys = _three_bank_system([60, 0, 0])
+    sys.state.clearing_mode = "multilateral"
+    day = sys.state.day
+
+    settle_intraday_nets(sys, day)
+
+    assert sys.holding_balance("B1", "reserve_deposit") == 0
+    assert sys.holding_balance("B3", "reserve_deposit") == 60
+    payables = [c for c in sys.state.contracts.values() if c.kind == "payable"]
+    assert [(p.liability_issuer_id, p.asset_holder_id, p.amount, p.due_day) for p in payables] == [
+        ("B1", "B3", 40, day + 1)
+    ]
+    sys.assert_invariants()
+
+
+def test_compute_net_positions_sum_to_zero():
+    positions = compute_net_positions({("B1", "B2"): 70, ("B1", "B3"): -20, ("B2", "B3"): 5})
+    assert positions == {"B1": 50, "B2": -65, "B3": 15}
+    assert sum(positions.values()) == 0
+
+
+def test_match_net_positions_rejects_unbalanced_positions():
+    assert match_net_positions({"B1": 50, "B2": -30, "B3": -20}) == [("B1", "B2", 30), ("B1", "B3", 20)]
+    with pytest.raises(ValueError, match="sum to zero"):
+        match_net_positions({"B1": 50, "B2": -30})
+
+
+def test_invariants_check_intraday_nets_against_events():
+    """An incremental check flags ClientPayments that bypassed the accumulator."""
+    sys = _three_bank_system([500, 500, 500])
+    assert scan_intraday_nets(sys, sys.state.day) == compute_intraday_nets(sys, sys.state.day)
+    sys.assert_invariants(mode="incremental")
+
+    sys.log("ClientPayment", payer="H3", payer_bank="B3", payee="H1", payee_bank="B1", amount=5)
+    with pytest.raises(AssertionError, match="intraday nets"):
+        sys.assert_invariants(mode="incremental")
@@ -285,4 +285,42 @@ def test_policy_order_drives_payment_choice_default():
                   if cid in sys.state.contracts and sys.state.contracts[cid].kind == "cash")
     assert h2_cash == 0
     
-    sys.assert_invariants()
\ No newline at end of file
+    sys.assert_invariants()
+
+def test_stability_counters_track_events_and_obligations():
+    """Impact and open-obligation counters agree with a full scan."""
+    from bilancio.engines.simulation import IMPACT_EVENTS, _has_open_obligations, _impacted_today
+
+    sys = System()
+    sys.add_agent(CentralBank(id="CB1", name="Central Bank", kind="central_bank"))
+    sys.add_agent(Household(id="H1", name="Household 1", kind="household"))
+    sys.add_agent(Household(id="H2", name="Household 2", kind="household"))
+    sys.mint_cash("H1", 100)
+    for due_day in (0, 1):
+        sys.add_contract(Payable(
+            id=sys.new_contract_id("P"), kind="payable", amount=30, denom="X",
+            asset_holder_id="H2", liability_issuer_id="H1", due_day=due_day,
+        ))
+    assert sys.state.open_obligations == 2
+
+    for day in (0, 1, 2):
+        run_day(sys)
+        scanned = sum(1 for e in sys.state.events if e["day"] == day and e["kind"] in IMPACT_EVENTS)
+        assert _impacted_today(sys, day) == scanned
+    assert _impacted_today(sys, 0) == 1
+    assert _impacted_today(sys, 2) == 0
+    assert sys.state.open_obligations == 0
+    assert not _has_open_obligations(sys)
+
+
+def test_log_events_counts_prebuilt_impact_events():
+    """Events appended via System.log_events feed the impact counter."""
+    from bilancio.engines.simulation import _impacted_today
+
+    sys = System()
+    sys.log_events([
+        {"kind": "PayableSettled", "day": 3, "phase": "B"},
+        {"kind": "dealer_trade", "day": 3, "phase": "B"},
+    ])
+    assert len(sys.state.events) == 2
+    assert _impacted_today(sys, 3) == 1
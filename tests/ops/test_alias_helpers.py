@@ -1,3 +1,8 @@
+import copy
+
+import pytest
+
+from bilancio.core.atomic_tx import atomic
 from bilancio.engines.system import System
 from bilancio.ops.aliases import get_alias_for_id, get_id_for_alias
 
@@ -10,3 +15,24 @@ def test_alias_helpers_roundtrip():
     assert get_id_for_alias(sys, "MISSING") is None
     assert get_alias_for_id(sys, "C_XXX") is None
 
+
+
+def test_reverse_alias_index_follows_mutations_and_rollback():
+    sys = System()
+    sys.set_alias("AL1", "C_001")
+    sys.state.aliases["AL2"] = "C_002"
+    sys.state.aliases["AL2"] = "C_003"  # re-pointed alias drops the old reverse entry
+    assert get_alias_for_id(sys, "C_002") is None
+    assert get_alias_for_id(sys, "C_003") == "AL2"
+
+    with pytest.raises(RuntimeError):
+        with atomic(sys):
+            sys.pop_alias("AL1")
+            assert get_alias_for_id(sys, "C_001") is None
+            raise RuntimeError("rollback")
+    assert get_alias_for_id(sys, "C_001") == "AL1"
+
+    clone = copy.deepcopy(sys.state.aliases)
+    del sys.state.aliases["AL1"]
+    assert get_alias_for_id(sys, "C_001") is None
+    assert clone.alias_for("C_001") == "AL1"
@@ -194,6 +194,23 @@ class TestLocalExecutorOutputFiles:
         assert events_path.exists()
         assert result.artifacts.get("events_jsonl") == "out/events.jsonl"
 
+    @pytest.mark.slow
+    def test_execute_creates_phase_timings_csv(self, tmp_path: Path):
+        """execute() exports per-phase timings next to events.jsonl."""
+        executor = LocalExecutor()
+        result = executor.execute(
+            scenario_config=SCENARIO_WITH_ACTIVITY,
+            run_id="test_phase_timings_001",
+            output_dir=tmp_path,
+            options=RunOptions(max_days=5),
+        )
+
+        timings_path = tmp_path / "out" / "phase_timings.csv"
+        assert timings_path.exists()
+        assert result.artifacts.get("phase_timings_csv") == "out/phase_timings.csv"
+        header = timings_path.read_text().splitlines()[0]
+        assert header.startswith("day,phase,wall_time_s,events")
+
     @pytest.mark.slow
     def test_execute_creates_run_html(self, tmp_path: Path):
         """execute() creates run.html file."""
@@ -0,0 +1,87 @@
+import pytest
+from bilancio.core.atomic_tx import atomic
+from bilancio.core.errors import ValidationError
+from bilancio.domain.agents.central_bank import CentralBank
+from bilancio.domain.agents.household import Household
+from bilancio.engines.system import System
+
+
+def _system():
+    sys = System()
+    sys.add_agent(CentralBank(id="CB1", name="Central Bank", kind="central_bank"))
+    sys.add_agent(Household(id="H1", name="H1", kind="household"))
+    sys.add_agent(Household(id="H2", name="H2", kind="household"))
+    sys.mint_cash("H1", 100)
+    sys.mint_cash("H1", 50)
+    return sys
+
+
+def _cash(sys, agent_id):
+    return sum(
+        sys.state.contracts[cid].amount
+        for cid in sys.state.agents[agent_id].asset_ids
+        if sys.state.contracts[cid].kind == "cash"
+    )
+
+
+def test_rollback_restores_state_in_place():
+    sys = _system()
+    h1 = sys.state.agents["H1"]
+    assets_before = list(h1.asset_ids)
+    n_contracts = len(sys.state.contracts)
+    n_events = len(sys.state.events)
+
+    with pytest.raises(ValidationError):
+        with atomic(sys):
+            sys.transfer_cash("H1", "H2", 120)  # splits a piece and merges at receiver
+            raise ValidationError("boom")
+
+    # Same objects, restored contents and ordering
+    assert sys.state.agents["H1"] is h1
+    assert h1.asset_ids == assets_before
+    assert len(sys.state.contracts) == n_contracts
+    assert len(sys.state.events) == n_events
+    assert _cash(sys, "H1") == 150
+    assert _cash(sys, "H2") == 0
+    assert sys.state.journal.depth == 0
+    assert sys.state.journal.entries == []
+    sys.assert_invariants()
+
+
+def test_nested_savepoint_only_undoes_inner_block():
+    sys = _system()
+
+    with atomic(sys):
+        sys.transfer_cash("H1", "H2", 30)
+        with pytest.raises(ValidationError):
+            with atomic(sys):
+                sys.transfer_cash("H1", "H2", 10)
+                sys.retire_cash("H2", 1000)  # fails: insufficient cash
+        assert _cash(sys, "H2") == 30
+
+    assert _cash(sys, "H1") == 120
+    assert _cash(sys, "H2") == 30
+    sys.assert_invariants()
+
+
+def test_outer_rollback_undoes_committed_inner_block():
+    sys = _system()
+
+    with pytest.raises(RuntimeError):
+        with atomic(sys):
+            with atomic(sys):
+                sys.transfer_cash("H1", "H2", 30)
+            sys.mint_cash("H2", 5)
+            raise RuntimeError("outer failure")
+
+    assert _cash(sys, "H1") == 150
+    assert _cash(sys, "H2") == 0
+    assert sys.state.cb_cash_outstanding == 150
+    sys.assert_invariants()
+
+
+def test_mutations_outside_transaction_are_not_journaled():
+    sys = _system()
+    sys.state.journal.setattr(sys.state, "day", 3)
+    assert sys.state.day == 3
+    assert sys.state.journal.entries == []
@@ -0,0 +1,98 @@
+import json
+from dataclasses import replace
+
+from click.testing import CliRunner
+
+from bilancio.benchmarks import BENCHMARKS, compare_results, run_benchmarks
+from bilancio.ui.cli import cli
+
+
+def test_every_case_runs_at_small_size():
+    doc = run_benchmarks(list(BENCHMARKS), [10], repeat=1)
+
+    assert [r["name"] for r in doc["results"]] == list(BENCHMARKS)
+    for result in doc["results"]:
+        assert result["error"] is None, result
+        assert result["best_s"] > 0
+
+
+def test_compare_results_flags_slowdowns_beyond_tolerance():
+    def doc(times):
+        return {"version": 1, "results": [
+            {"name": name, "n_agents": 10, "best_s": t, "error": None}
+            for name, t in times.items()
+        ]}
+
+    base = doc({"a": 1.0, "b": 1.0, "gone": 1.0, "broken": 1.0})
+    current = doc({"a": 1.1, "b": 1.5, "new": 2.0, "broken": 0.0})
+    current["results"][-1]["error"] = "RuntimeError: boom"
+
+    by_name = {c.name: c for c in compare_results(current, base, tolerance=0.2)}
+    assert set(by_name) == {"a", "b", "gone", "broken"}
+    assert not by_name["a"].failed
+    assert by_name["b"].regressed
+    assert by_name["b"].ratio == 1.5
+    # Cases that disappeared or crashed fail the comparison
+    assert by_name["gone"].failed and by_name["gone"].current_s is None
+    assert by_name["broken"].error == "RuntimeError: boom"
+    assert by_name["broken"].failed
+
+
+def test_bench_command_writes_results_and_compares_to_baseline(tmp_path):
+    runner = CliRunner()
+    out = tmp_path / "results.json"
+    baseline = tmp_path / "baseline.json"
+    args = ["bench", "--case", "run_until_stable", "--sizes", "10", "--repeat", "1",
+            "--output", str(out)]
+
+    result = runner.invoke(cli, args + ["--baseline", str(baseline)])
+    assert result.exit_code != 0  # baseline missing
+
+    # No baseline yet: --save-baseline creates it
+    result = runner.invoke(cli, args + ["--baseline", str(baseline), "--save-baseline"])
+    assert result.exit_code == 0, result.output
+    assert json.loads(baseline.read_text()) == json.loads(out.read_text())
+
+    result = runner.invoke(cli, args + ["--baseline", str(baseline), "--tolerance", "1000"])
+    assert result.exit_code == 0, result.output
+    doc = json.loads(out.read_text())
+    assert doc["results"][0]["name"] == "run_until_stable"
+
+    slow = json.loads(baseline.read_text())
+    slow["results"][0]["best_s"] /= 10_000
+    baseline.write_text(json.dumps(slow))
+    result = runner.invoke(cli, args + ["--baseline", str(baseline)])
+    assert result.exit_code == 1
+
+
+def test_bench_command_fails_on_errored_or_missing_cases(tmp_path, monkeypatch):
+    runner = CliRunner()
+    out = tmp_path / "results.json"
+    baseline = tmp_path / "baseline.json"
+    args = ["bench", "--case", "run_until_stable", "--sizes", "10", "--repeat", "1",
+            "--output", str(out), "--baseline", str(baseline), "--tolerance", "1000"]
+    result = runner.invoke(cli, args + ["--save-baseline"])
+    assert result.exit_code == 0, result.output
+
+    # Baseline sizes that were not requested are not expected
+    doc = json.loads(baseline.read_text())
+    doc["results"].append({**doc["results"][0], "n_agents": 20})
+    baseline.write_text(json.dumps(doc))
+    result = runner.invoke(cli, args)
+    assert result.exit_code == 0, result.output
+
+    # A baseline case that no longer exists
+    doc["results"].append({**doc["results"][0], "name": "retired_case"})
+    baseline.write_text(json.dumps(doc))
+    result = runner.invoke(cli, [a for a in args if a not in ("--case", "run_until_stable")])
+    assert result.exit_code == 1
+    assert "1 baseline case(s) did not run" in result.output
+
+    def crash(n_agents):
+        raise RuntimeError("boom")
+
+    broken = replace(BENCHMARKS["run_until_stable"], setup=crash)
+    monkeypatch.setitem(BENCHMARKS, "run_until_stable", broken)
+    result = runner.invoke(cli, args[:-4])  # no baseline
+    assert result.exit_code == 1
+    assert "raised an error" in result.output
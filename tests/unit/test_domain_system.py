@@ -1,3 +1,4 @@
+import pytest
 from bilancio.engines.system import System
 from bilancio.domain.agents.central_bank import CentralBank
 from bilancio.domain.agents.bank import Bank
@@ -37,4 +38,110 @@ def test_policy_allows_and_blocks_expected_cases():
     # Any agent can issue a payable in MVP
     sys.add_contract(Payable(id="p", kind="payable", amount=7, denom="X",
                              asset_holder_id="B1", liability_issuer_id="H1", due_day=0))
-    sys.assert_invariants()
\ No newline at end of file
+    sys.assert_invariants()
+
+def test_policy_memo_follows_policy_changes():
+    sys = System()
+    h1 = Household(id="H1", name="H1", kind="household")
+    cb = CentralBank(id="CB1", name="CB", kind="central_bank")
+    reserves = ReserveDeposit(id="r", kind="reserve_deposit", amount=1, denom="X",
+                              asset_holder_id="H1", liability_issuer_id="CB1")
+    policy = sys.policy
+    assert not policy.can_hold(h1, reserves)
+    assert policy.can_issue(cb, reserves)
+    assert (Household, ReserveDeposit) in policy._hold_memo
+
+    policy.holders[ReserveDeposit] = (Household,)
+    policy.invalidate()
+    assert policy.can_hold(h1, reserves)
+
+
+def test_due_index_tracks_payable_lifecycle():
+    sys = System()
+    cb = CentralBank(id="CB1", name="CB", kind="central_bank")
+    h1 = Household(id="H1", name="H1", kind="household")
+    h2 = Household(id="H2", name="H2", kind="household")
+    sys.add_agent(cb); sys.add_agent(h1); sys.add_agent(h2)
+
+    sys.add_contract(Payable(id="p1", kind="payable", amount=7, denom="X",
+                             asset_holder_id="H2", liability_issuer_id="H1", due_day=3))
+    sys.add_contract(Payable(id="p2", kind="payable", amount=4, denom="X",
+                             asset_holder_id="H1", liability_issuer_id="H2", due_day=3))
+    sys.mint_cash("H1", 10)
+
+    assert sys.contract_ids_due(3) == ["p1", "p2"]
+    assert sys.contract_ids_due(2) == []
+    assert len(sys.contract_ids_of_kind("cash")) == 1
+
+    sys.remove_contract("p1")
+    assert sys.contract_ids_due(3) == ["p2"]
+    sys.remove_contract("p2")
+    assert 3 not in sys.state.due_index
+    assert "payable" not in sys.state.kind_index
+
+
+def test_holdings_index_tracks_balances():
+    sys = System()
+    cb = CentralBank(id="CB1", name="CB", kind="central_bank")
+    b1 = Bank(id="B1", name="B1", kind="bank")
+    h1 = Household(id="H1", name="H1", kind="household")
+    h2 = Household(id="H2", name="H2", kind="household")
+    sys.add_agent(cb); sys.add_agent(b1); sys.add_agent(h1); sys.add_agent(h2)
+
+    sys.mint_cash("H1", 100)
+    sys.mint_cash("H1", 30)
+    assert sys.holding_balance("H1", "cash") == 130
+    assert len(sys.holding_ids("H1", "cash")) == 2
+
+    sys.transfer_cash("H1", "H2", 110)
+    assert sys.holding_balance("H1", "cash") == 20
+    assert sys.holding_balance("H2", "cash") == 110
+    assert sys.holding_balance("H2", "cash", "CB1") == 110
+
+    sys.add_contract(BankDeposit(id="D1", kind="bank_deposit", amount=40, denom="X",
+                                 asset_holder_id="H2", liability_issuer_id="B1"))
+    assert sys.total_deposit("H2", "B1") == 40
+    assert sys.deposit_ids("H2", "B1") == ["D1"]
+    assert sys.holding_balance("H2", "bank_deposit", "CB1") == 0
+
+
+def test_incremental_invariants_check_only_touched_state():
+    sys = System()
+    sys.add_agent(CentralBank(id="CB1", name="CB", kind="central_bank"))
+    sys.add_agent(Household(id="H1", name="H1", kind="household"))
+    sys.add_agent(Household(id="H2", name="H2", kind="household"))
+    sys.mint_cash("H1", 10)
+    sys.assert_invariants(mode="incremental")
+    assert not sys.state.dirty_contracts and not sys.state.dirty_agents
+
+    sys.transfer_cash("H1", "H2", 4)
+    assert sys.state.dirty_agents.keys() >= {"H1", "H2"}
+    sys.assert_invariants(mode="incremental")
+
+    # Corrupt a touched contract: the incremental check catches it
+    sys.mint_cash("H2", 1)
+    cid = sys.holding_ids("H2", "cash")[-1]
+    sys.state.agents["H2"].asset_ids.remove(cid)
+    with pytest.raises(AssertionError, match="missing on asset holder"):
+        sys.assert_invariants(mode="incremental")
+    with pytest.raises(AssertionError, match="missing on asset holder"):
+        sys.assert_invariants(mode="full")
+    with pytest.raises(ValueError):
+        sys.assert_invariants(mode="sometimes")
+
+
+def test_domain_objects_are_slotted():
+    import copy
+    from bilancio.dealer.models import Ticket
+    from bilancio.domain.goods import StockLot
+
+    p = Payable(id="p1", kind="payable", amount=7, denom="X",
+                asset_holder_id="H2", liability_issuer_id="H1", due_day=3)
+    objs = [p, Household(id="H1", name="H1", kind="household"),
+            StockLot(id="s1", kind="stock_lot", sku="X", quantity=1, unit_price=1, owner_id="H1"),
+            Ticket(id="t1", issuer_id="H1", owner_id="H2", face=1, maturity_day=3)]
+    for obj in objs:
+        assert not hasattr(obj, "__dict__")
+        assert copy.deepcopy(obj) == obj
+    p.validate_type_invariants()
+    assert p.effective_creditor == "H2"
@@ -0,0 +1,50 @@
+import copy
+
+import pytest
+
+from bilancio.core.atomic_tx import atomic
+from bilancio.core.events import EventStore
+from bilancio.domain.agents.central_bank import CentralBank
+from bilancio.domain.agents.household import Household
+from bilancio.engines.system import System
+
+
+def test_event_store_indexes_by_day_and_kind():
+    events = EventStore()
+    events.append({"kind": "A", "day": 0})
+    events.extend([{"kind": "B", "day": 1}, {"kind": "A", "day": 1}])
+    events.append({"kind": "A", "day": 0})
+
+    assert isinstance(events, list)
+    assert len(events) == 4
+    assert [e["kind"] for e in events.for_day(1)] == ["B", "A"]
+    assert events.of_kind("A", 0) == [{"kind": "A", "day": 0}, {"kind": "A", "day": 0}]
+    assert len(events.of_kind("A")) == 3
+    assert events.for_day(7) == []
+
+    events.pop()
+    assert len(events.of_kind("A", 0)) == 1
+    del events[0]
+    assert events.for_day(0) == []
+    assert events.days() == [1]
+
+    clone = copy.deepcopy(events)
+    assert clone == events
+    assert clone.for_day(1) == events.for_day(1)
+
+
+def test_system_events_rollback_keeps_index_consistent():
+    sys = System()
+    sys.add_agent(CentralBank(id="CB1", name="Central Bank", kind="central_bank"))
+    sys.add_agent(Household(id="H1", name="H1", kind="household"))
+    sys.mint_cash("H1", 100)
+    n_cash_minted = len(sys.state.events.of_kind("CashMinted", 0))
+
+    with pytest.raises(RuntimeError):
+        with atomic(sys):
+            sys.mint_cash("H1", 5)
+            assert len(sys.state.events.of_kind("CashMinted", 0)) == n_cash_minted + 1
+            raise RuntimeError("rollback")
+
+    assert len(sys.state.events.of_kind("CashMinted", 0)) == n_cash_minted
+    assert sys.state.events.for_day(0) == list(sys.state.events)
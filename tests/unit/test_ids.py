@@ -0,0 +1,52 @@
+import pytest
+
+from bilancio.core.ids import IdAllocator, IdList
+from bilancio.domain.agents.central_bank import CentralBank
+from bilancio.domain.agents.household import Household
+from bilancio.engines.system import System
+
+
+def test_id_allocator_counts_per_prefix():
+    ids = IdAllocator()
+    assert [ids.next("C"), ids.next("C"), ids.next("R"), ids.next("C")] == ["C_1", "C_2", "R_1", "C_3"]
+
+    compact = IdAllocator(compact=True)
+    assert [compact.next("C"), compact.next("R"), compact.next("C")] == ["1", "2", "3"]
+
+
+def _run(compact_ids=False):
+    sys = System(compact_ids=compact_ids)
+    sys.add_agent(CentralBank(id="CB1", name="Central Bank", kind="central_bank"))
+    sys.add_agent(Household(id="H1", name="H1", kind="household"))
+    sys.add_agent(Household(id="H2", name="H2", kind="household"))
+    sys.mint_cash("H1", 100)
+    sys.mint_cash("H1", 50)
+    sys.transfer_cash("H1", "H2", 120)  # splits a twin
+    return sys
+
+
+def test_system_ids_are_reproducible():
+    assert _run().state.events == _run().state.events
+    assert list(_run(compact_ids=True).state.contracts) == list(_run(compact_ids=True).state.contracts)
+    assert all(cid.isdigit() for cid in _run(compact_ids=True).state.contracts)
+
+
+def test_system_ids_skip_names_already_taken():
+    sys = System()
+    sys.add_agent(CentralBank(id="CB1", name="Central Bank", kind="central_bank"))
+    sys.add_agent(Household(id="C_1", name="H", kind="household"))
+    assert sys.new_contract_id("C") == "C_2"
+
+
+def test_id_list_positional_access_follows_mutations():
+    ids = IdList(["a", "b", "c"])
+    assert (ids[0], ids[-1], ids[1], ids.first(), ids.last()) == ("a", "c", "b", "a", "c")
+    token = ids.remove_with_token("a")
+    ids.append("d")
+    assert (ids[0], ids[1], ids[-1], ids.index("d")) == ("b", "c", "d", 2)
+    ids.restore("a", token)
+    assert (ids[0], ids[1], ids[-1], ids[1:3]) == ("a", "b", "d", ["b", "c"])
+    assert ids.pop() == "d" and ids[-1] == "c"
+    ids.clear()
+    with pytest.raises(IndexError):
+        ids.first()
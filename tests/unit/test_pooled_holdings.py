@@ -0,0 +1,74 @@
+import pytest
+
+from bilancio.core.errors import ValidationError
+from bilancio.domain.agents.bank import Bank
+from bilancio.domain.agents.central_bank import CentralBank
+from bilancio.domain.agents.household import Household
+from bilancio.engines.system import System
+
+
+def _system():
+    sys = System()
+    sys.state.pooled_holdings = True
+    sys.add_agent(CentralBank(id="CB1", name="Central Bank", kind="central_bank"))
+    sys.add_agent(Household(id="H1", name="H1", kind="household"))
+    sys.add_agent(Household(id="H2", name="H2", kind="household"))
+    sys.add_agent(Bank(id="B1", name="B1", kind="bank"))
+    sys.add_agent(Bank(id="B2", name="B2", kind="bank"))
+    return sys
+
+
+def test_pooled_cash_keeps_one_record_per_holder():
+    sys = _system()
+    sys.mint_cash("H1", 100)
+    sys.mint_cash("H1", 50)
+    assert len(sys.holding_ids("H1", "cash")) == 1
+
+    sys.transfer_cash("H1", "H2", 30)  # first payment hands over a piece
+    sys.transfer_cash("H1", "H2", 20)  # later ones update balances in place
+    sys.transfer_cash("H2", "H1", 50)  # payer's emptied record is dropped
+
+    assert sys.holding_ids("H2", "cash") == []
+    assert sys.holding_balance("H1", "cash") == 150
+    assert len(sys.holding_ids("H1", "cash")) == 1
+    kinds = [e["kind"] for e in sys.state.events]
+    assert "InstrumentMerged" not in kinds
+    last = sys.state.events[-1]
+    assert last["kind"] == "CashTransferred" and last["amount"] == 50
+    assert last["instr_id"] == sys.holding_ids("H1", "cash")[0]
+    sys.assert_invariants()
+
+    with pytest.raises(ValidationError):
+        sys.transfer_cash("H2", "H1", 1)
+
+
+def test_pooled_reserves_transfer_in_place():
+    sys = _system()
+    sys.mint_reserves("B1", 500)
+    sys.mint_reserves("B2", 10)
+    n_contracts = len(sys.state.contracts)
+
+    sys.transfer_reserves("B1", "B2", 200)
+
+    assert len(sys.state.contracts) == n_contracts
+    assert sys.holding_balance("B1", "reserve_deposit") == 300
+    assert sys.holding_balance("B2", "reserve_deposit") == 210
+    sys.assert_invariants()
+
+
+def test_pooled_mint_allocates_ids_only_for_new_records():
+    pooled = _system()
+    pooled.mint_cash("H1", 100)
+    pooled.mint_cash("H1", 50)  # credited to H1's record, no new id
+    pooled.mint_reserves("B1", 100)
+    pooled.mint_reserves("B1", 50)
+
+    unpooled = _system()
+    unpooled.state.pooled_holdings = False
+    unpooled.mint_cash("H1", 150)
+    unpooled.mint_reserves("B1", 150)
+
+    assert pooled.mint_cash("H2", 10) == unpooled.mint_cash("H2", 10)
+    assert pooled.mint_reserves("B2", 10) == unpooled.mint_reserves("B2", 10)
+    assert sorted(pooled.state.contracts) == sorted(unpooled.state.contracts)
+    pooled.assert_invariants()